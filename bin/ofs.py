@@ -21,11 +21,12 @@ import logging
 import sys
 import os
 
-from ofspy.ofs import OFS
+from ofspy.ofs import OFS, getNumPlayers
+from ofspy.batch import executeJobs, parseJobs
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description="This program runs an Orbital Federates simulation.")
-    parser.add_argument('elements', type=str, nargs='+',
+    parser.add_argument('elements', type=str, nargs='*',
                         help='the list of initial elements, e.g. 1.GroundSta@SUR1,pSGL 1.SmallSat@LEO1,pSGL,SAR')
     parser.add_argument('-d', '--numTurns', type=int, default=24,
                         help='simulation duration (number of turns)')
@@ -39,13 +40,21 @@ if __name__ == '__main__':
                         help='federate operations model specification')
     parser.add_argument('-f', '--fops', type=str, default='',
                         help='federation operations model specification')
+    parser.add_argument('-c', '--crn', action='store_true',
+                        help='common random numbers across designs')
     parser.add_argument('-l', '--logging', type=str, default='error',
                         choices=['debug','info','warning','error'],
                         help='logging level')
     parser.add_argument('-g', '--gui', action='store_true',
                         help='launch with graphical user interface')
+    parser.add_argument('-b', '--batch', type=str, default=None,
+                        help='execute one job per line from a file (- for stdin)')
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help='number of batch worker processes')
 
     args = parser.parse_args()
+    if args.batch is None and len(args.elements) == 0:
+        parser.error('the following arguments are required: elements')
     if args.logging == 'debug':
         level = logging.DEBUG
     elif args.logging == 'info':
@@ -56,29 +65,33 @@ if __name__ == '__main__':
         level = logging.ERROR
     logging.basicConfig(level=level)
 
+    if args.batch is not None:
+        # execute one job per line and output results as they finish
+        source = sys.stdin if args.batch == '-' else open(args.batch)
+        defaults = {'numTurns': args.numTurns, 'numPlayers': args.numPlayers,
+                    'initialCash': args.initialCash, 'seed': args.seed,
+                    'ops': args.ops, 'fops': args.fops, 'crn': args.crn}
+        try:
+            for result in executeJobs(parseJobs(source, defaults),
+                                      numWorkers=args.workers):
+                print(json.dumps(result))
+                sys.stdout.flush()
+        finally:
+            if source is not sys.stdin:
+                source.close()
+        sys.exit(0)
+
     # count the number of players if not specified
     if args.numPlayers is None:
-        numPlayers = 0
-        # split the elements argument into individual elements
-        for element in args.elements:
-            # split each element into components
-            specs = element.split(',')
-            if len(specs) > 0 and len(specs[0].split('@')) == 2:
-                # parse player ownership
-                if len(specs[0].split('@')[0].split('.')) == 2:
-                    # parse player owner from leading number
-                    pId = int(specs[0].split('@')[0].split('.')[0])-1
-                else:
-                    # default to player 0
-                    pId = 0
-                numPlayers = max(numPlayers, pId+1)
+        numPlayers = getNumPlayers(args.elements)
     else:
         numPlayers = args.numPlayers
 
     # set up the simulation
     ofs = OFS(elements=args.elements, numTurns=args.numTurns,
                   numPlayers=numPlayers, initialCash=args.initialCash,
-                  seed=args.seed, ops=args.ops, fops=args.fops)
+                  seed=args.seed, ops=args.ops, fops=args.fops,
+                  crn=args.crn)
 
     if args.gui:
         # launch gui and start simulation
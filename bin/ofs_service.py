@@ -0,0 +1,70 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+from __future__ import print_function
+import argparse
+import json
+import logging
+import sys
+
+from ofspy.service import ServiceClient, ServiceServer, SimulationService
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="This program runs a local Orbital Federates simulation service or submits jobs to it.")
+    parser.add_argument('-a', '--host', type=str, default='localhost',
+                        help='service host')
+    parser.add_argument('-t', '--port', type=int, default=8080,
+                        help='service port')
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help='number of worker processes')
+    parser.add_argument('-c', '--client', action='store_true',
+                        help='submit one job per line from stdin and output the results')
+    parser.add_argument('-d', '--numTurns', type=int, default=24,
+                        help='default simulation duration (number of turns)')
+    parser.add_argument('-i', '--initialCash', type=int, default=0,
+                        help='default initial cash')
+    parser.add_argument('-s', '--seed', type=int, default=0,
+                        help='default random number seed')
+    parser.add_argument('-o', '--ops', type=str, default='d6',
+                        help='default federate operations model specification')
+    parser.add_argument('-f', '--fops', type=str, default='',
+                        help='default federation operations model specification')
+    parser.add_argument('-l', '--logging', type=str, default='error',
+                        choices=['debug','info','warning','error'],
+                        help='logging level')
+
+    args = parser.parse_args()
+    logging.basicConfig(level=getattr(logging, args.logging.upper()))
+
+    if args.client:
+        # stand-in client: submit jobs and output results as they finish
+        client = ServiceClient(args.host, args.port)
+        for result in client.evaluate([line.strip() for line in sys.stdin]):
+            print(json.dumps(result))
+            sys.stdout.flush()
+    else:
+        service = SimulationService(numWorkers=args.workers)
+        server = ServiceServer((args.host, args.port), service, defaults={
+            'numTurns': args.numTurns, 'initialCash': args.initialCash,
+            'seed': args.seed, 'ops': args.ops, 'fops': args.fops})
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            service.close()
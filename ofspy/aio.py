@@ -0,0 +1,211 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+"""
+The L{ofspy.aio} package evaluates designs from asyncio code in a pool of
+worker processes (requires Python 3.7+).
+
+    results = await ofspy.aio.evaluate(design, seeds=range(10), ops='d6')
+
+    async for result in ofspy.aio.imap(jobs):
+        ...
+
+Jobs use the format of L{ofspy.batch}. At most C{maxPending} runs are
+submitted to the pool at once; the rest wait in the event loop, so
+cancelling a task drops its queued runs without starting them (a run
+which has already started completes in its worker but is discarded, and
+holds its pool slot until then).
+"""
+
+import asyncio
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .batch import executeJob, makeJob, _initWorker
+
+class Evaluator(object):
+    """
+    An L{Evaluator} runs jobs in a process pool for asyncio code.
+    """
+    def __init__(self, maxWorkers=None, maxPending=None):
+        """
+        @param maxWorkers: the number of worker processes (defaults to the
+            number of CPUs)
+        @type maxWorkers: L{int}
+        @param maxPending: the maximum number of runs submitted to the
+            pool at once (defaults to the number of workers)
+        @type maxPending: L{int}
+        """
+        self.maxWorkers = (maxWorkers if maxWorkers is not None
+                           else os.cpu_count())
+        self.maxPending = (maxPending if maxPending is not None
+                           else self.maxWorkers)
+        self.numSubmitted = 0
+        self._executor = None
+        self._semaphore = None
+
+    def _getExecutor(self):
+        """
+        Gets the process pool, starting it on first use.
+        @return: L{ProcessPoolExecutor}
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                self.maxWorkers, initializer=_initWorker,
+                initargs=(logging.getLogger().getEffectiveLevel(),))
+        return self._executor
+
+    async def run(self, job):
+        """
+        Runs a job once a pool slot is free.
+        @param job: the job
+        @type job: L{dict}
+        @return: L{dict}
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore[0] is not loop:
+            # semaphores cannot be shared across event loops
+            self._semaphore = (loop, asyncio.Semaphore(self.maxPending))
+        semaphore = self._semaphore[1]
+        await semaphore.acquire()
+        try:
+            future = self._getExecutor().submit(executeJob, job)
+        except BaseException:
+            semaphore.release()
+            raise
+        self.numSubmitted += 1
+        # hold the slot until the worker finishes, even if cancelled
+        future.add_done_callback(
+            lambda future: _release(loop, semaphore))
+        return await asyncio.wrap_future(future, loop=loop)
+
+    async def imap(self, jobs):
+        """
+        Runs jobs, yielding each result as it finishes (in any order).
+        Jobs are taken from the iterable only as pool slots free up.
+        @param jobs: the jobs
+        @type jobs: L{iterable}
+        @return: L{AsyncGenerator}
+        """
+        jobs = iter(jobs)
+        tasks = set()
+        try:
+            while True:
+                for job in jobs:
+                    tasks.add(asyncio.ensure_future(self.run(job)))
+                    if len(tasks) >= self.maxPending:
+                        break
+                if len(tasks) == 0:
+                    break
+                done, tasks = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def iterSeeds(self, design, seeds=(0,), **options):
+        """
+        Evaluates a design for seeds, yielding each per-seed result (keyed
+        by its seed) as it finishes.
+        @param design: the design elements
+        @type design: L{list}
+        @param seeds: the seeds
+        @type seeds: L{list}
+        @param options: the job options, e.g. ops, fops, numTurns
+        @type options: L{dict}
+        @return: L{AsyncGenerator}
+        """
+        async for result in self.imap(makeJob(design, id=seed, seed=seed,
+                                              **options)
+                                      for seed in seeds):
+            yield result
+
+    async def evaluate(self, design, seeds=(0,), **options):
+        """
+        Evaluates a design for seeds.
+        @param design: the design elements
+        @type design: L{list}
+        @param seeds: the seeds
+        @type seeds: L{list}
+        @param options: the job options, e.g. ops, fops, numTurns
+        @type options: L{dict}
+        @return: L{list}
+        """
+        seeds = list(seeds)
+        results = {}
+        async for result in self.iterSeeds(design, seeds, **options):
+            results[result['id']] = result
+        return [results[seed] for seed in seeds]
+
+    def close(self):
+        """
+        Closes this evaluator, stopping its workers.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+def _release(loop, semaphore):
+    """
+    Releases a semaphore from a pool thread.
+    @param loop: the event loop of the semaphore
+    @type loop: L{asyncio.AbstractEventLoop}
+    @param semaphore: the semaphore
+    @type semaphore: L{asyncio.Semaphore}
+    """
+    try:
+        loop.call_soon_threadsafe(semaphore.release)
+    except RuntimeError:
+        # the event loop has closed
+        pass
+
+_evaluator = None
+
+def getEvaluator():
+    """
+    Gets the shared evaluator, creating it on first use.
+    @return: L{Evaluator}
+    """
+    global _evaluator
+    if _evaluator is None:
+        _evaluator = Evaluator()
+    return _evaluator
+
+async def evaluate(design, seeds=(0,), **options):
+    """
+    Evaluates a design for seeds with the shared evaluator.
+    @param design: the design elements
+    @type design: L{list}
+    @param seeds: the seeds
+    @type seeds: L{list}
+    @param options: the job options, e.g. ops, fops, numTurns
+    @type options: L{dict}
+    @return: L{list}
+    """
+    return await getEvaluator().evaluate(design, seeds, **options)
+
+def imap(jobs):
+    """
+    Runs jobs with the shared evaluator, yielding each result as it
+    finishes.
+    @param jobs: the jobs
+    @type jobs: L{iterable}
+    @return: L{AsyncGenerator}
+    """
+    return getEvaluator().imap(jobs)
@@ -0,0 +1,171 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+"""
+The L{ofspy.batch} package executes batches of OFS jobs in a pool of
+warm worker processes.
+
+Each job is one line: either a JSON object with the design C{elements}
+and optional C{id}, C{seed}, C{ops}, C{fops}, C{numTurns}, C{numPlayers},
+C{initialCash} and C{crn} overrides, or a whitespace-separated list of
+elements. Jobs without an id are keyed by their line number. Lines which
+cannot be parsed yield jobs with an C{error}.
+"""
+
+import json
+import logging
+import multiprocessing
+import os
+import re
+import sys
+
+from .ofs import OFS, getNumPlayers
+
+DEFAULTS = {'numTurns': 24, 'numPlayers': None, 'initialCash': 0,
+            'seed': 0, 'ops': 'd6', 'fops': '', 'crn': False}
+
+# element specification P.SysType@LOC,SubType,...
+ELEMENT = re.compile(r'^(\d+\.)?\w+@\w+(,\w+)*$')
+
+def parseJobs(lines, defaults=None):
+    """
+    Parses jobs from lines, skipping blank lines.
+    @param lines: the lines
+    @type lines: L{list}
+    @param defaults: the default job options
+    @type defaults: L{dict}
+    @return: L{generator}
+    """
+    for i, line in enumerate(lines):
+        line = line.strip()
+        if len(line) == 0:
+            continue
+        job = dict(DEFAULTS)
+        if defaults is not None:
+            job.update(defaults)
+        job['id'] = i
+        try:
+            if '{' in line or '"' in line:
+                options = json.loads(line)
+                if not isinstance(options, dict):
+                    raise ValueError('expected a JSON object')
+                job.update(options)
+            else:
+                job['elements'] = line.split()
+                invalid = [e for e in job['elements']
+                           if ELEMENT.match(e) is None]
+                if len(invalid) > 0:
+                    raise ValueError('invalid elements {}'.format(
+                        ' '.join(invalid)))
+        except ValueError as e:
+            job['error'] = 'cannot parse job: {}'.format(e)
+        yield job
+
+def makeJob(design, id=None, **options):
+    """
+    Makes a job for a design.
+    @param design: the design elements (or a space-separated string)
+    @type design: L{list}
+    @param id: the job id
+    @type id: L{object}
+    @param options: the job options, e.g. seed, ops, fops, numTurns
+    @type options: L{dict}
+    @return: L{dict}
+    """
+    job = dict(DEFAULTS)
+    job.update(options)
+    job['id'] = id
+    job['elements'] = (design.split() if isinstance(design, str)
+                       else list(design))
+    return job
+
+def executeJob(job):
+    """
+    Executes a job.
+    @param job: the job
+    @type job: L{dict}
+    @return: L{dict}
+    """
+    if 'error' in job:
+        return {'id': job['id'], 'error': job['error']}
+    try:
+        elements = job.get('elements', [])
+        ofs = OFS(elements=elements,
+                  numTurns=job['numTurns'],
+                  numPlayers=(job['numPlayers']
+                              if job['numPlayers'] is not None
+                              else getNumPlayers(elements)),
+                  initialCash=job['initialCash'],
+                  seed=job['seed'], ops=job['ops'], fops=job['fops'],
+                  crn=job['crn'])
+        return {'id': job['id'], 'results': ofs.execute()}
+    except Exception as e:
+        logging.warning('Job {} failed: {}'.format(job['id'], e))
+        return {'id': job['id'], 'error': repr(e)}
+
+def _initWorker(level):
+    """
+    Initializes a worker process.
+    @param level: the logging level
+    @type level: L{int}
+    """
+    logging.getLogger().setLevel(level)
+    # keep solver banners out of the JSON lines on standard output
+    sys.stdout.flush()
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+def _executeQuietly(job):
+    """
+    Executes a job in this process with its standard output sent to
+    standard error.
+    @param job: the job
+    @type job: L{dict}
+    @return: L{dict}
+    """
+    # keep solver banners out of the JSON lines on standard output
+    sys.stdout.flush()
+    stdout = os.dup(sys.stdout.fileno())
+    try:
+        os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+        return executeJob(job)
+    finally:
+        sys.stdout.flush()
+        os.dup2(stdout, sys.stdout.fileno())
+        os.close(stdout)
+
+def executeJobs(jobs, numWorkers=None):
+    """
+    Executes jobs, yielding each result as it finishes (in any order).
+    @param jobs: the jobs
+    @type jobs: L{list}
+    @param numWorkers: the number of worker processes (defaults to the
+        number of CPUs; executes in this process if 1)
+    @type numWorkers: L{int}
+    @return: L{generator}
+    """
+    if numWorkers == 1:
+        for job in jobs:
+            yield _executeQuietly(job)
+        return
+    pool = multiprocessing.Pool(numWorkers, _initWorker,
+                                (logging.getLogger().getEffectiveLevel(),))
+    try:
+        for result in pool.imap_unordered(executeJob, jobs):
+            yield result
+    finally:
+        # all results are in unless the caller stopped early
+        pool.terminate()
+        pool.join()
@@ -19,17 +19,24 @@ limitations under the License.
 The L{ofspy.context} package contains classes related to the environment.
 """
 
-import random
 import logging
+import math
+import random
+from array import array
 
 from ..simulation import Entity
+from .resolver import DisturbanceResolver
+from .eligibility import EligibilityMatrix
+from .stream import StreamManager, shuffle
+from .location import SURFACE, SPEEDS, getCode
 
 class Context(Entity):
     """
     A L{Context} contains the complete simulation state.
     """
 
-    def __init__(self, locations=None, events=None, federations=None, seed=0):
+    def __init__(self, locations=None, events=None, federations=None, seed=0,
+                 crn=False):
         """
         @param locations: the locations in this context
         @type locations: L{list}
@@ -39,6 +46,9 @@ class Context(Entity):
         @type federations: L{list}
         @param seed: the seed for stochastic events
         @type seed: L{int}
+        @param crn: true, if random numbers are common across designs for
+            the same seed (see L{getRollStream})
+        @type crn: L{bool}
         """
         Entity.__init__(self, 'context')
         if locations is None:
@@ -50,19 +60,38 @@ class Context(Entity):
         else:
             self.events = events
         self.currentEvents = []
-        self.futureEvents = []
         self.pastEvents = []
         if federations is None:
             self.federations = []
         else:
             self.federations = federations
         self.seed = seed
+        self.crn = crn
+        self.resolver = DisturbanceResolver()
+        self.eligibility = EligibilityMatrix()
+        self._orbiting = []
+        self._nextLocations = []
 
         self.sectors = frozenset(l.sector for l in self.locations)
+        # index locations by name and code and count orbits at each level
+        self._locationNames = {}
+        self._locationCodes = {}
+        self._levelSizes = {}
+        for location in self.locations:
+            self._locationNames.setdefault(location.name, location)
+            self._locationCodes.setdefault(location.code, location)
+            if location.level != SURFACE:
+                self._levelSizes[location.level] = (
+                    self._levelSizes.get(location.level, 0) + 1)
         self.initTime = 0
         self.maxTime = 0
         self.time = 0
         self._nextTime = 0
+        self._numDraws = 0
+        self._eventIndices = {}
+        self._deck = array('i')
+        self._reshuffles = {}
+        self._dealState = ([], [], [])
 
     def getNumSectors(self):
         """
@@ -80,22 +109,25 @@ class Context(Entity):
         @type duration: L{float}
         @return: L{Location}
         """
-        if location is not None and location.isOrbit():
-            distance = 0
-            if location.altitude == "LEO":
-                distance = 2*duration
-            elif location.altitude == "MEO":
-                distance = 1*duration
-            elif location.altitude == "GEO":
-                distance = 0*duration
-            path = [l for l in self.locations
-                    if l.isOrbit()
-                    and l.altitude == location.altitude]
-            return next((p for p in path
-                        if p.sector == (location.sector
-                                        + distance) % len(path)), None)
+        if location is not None and location.level != SURFACE:
+            size = self._levelSizes.get(location.level)
+            if size is None:
+                return None
+            return self._locationCodes.get(getCode(
+                location.level, int((location.sector
+                                     + SPEEDS[location.level]*duration)
+                                    % size)))
         return location
 
+    def getLocation(self, name):
+        """
+        Gets a location in this context by name.
+        @param name: the name of the location
+        @type name: L{str}
+        @return: L{Location}
+        """
+        return self._locationNames.get(name)
+
     def getElementOwner(self, element):
         """
         Gets the element owner in this context.
@@ -142,12 +174,9 @@ class Context(Entity):
         @type contract: L{Contract}
         @return: L{Data}
         """
-        return next((data for federation in self.federations
-                     for federate in federation.federates
-                     for element in federate.elements
-                     for module in element.modules
-                     for data in module.data
-                     if data.contract is contract), None)
+        return (contract.data
+                if self.getDataElement(contract) is not None
+                else None)
 
     def getContract(self, demand):
         """
@@ -168,13 +197,8 @@ class Context(Entity):
         @type contract: L{Contract}
         @return: L{Location}
         """
-        return next((element.location
-                     for federation in self.federations
-                     for federate in federation.federates
-                     for element in federate.elements
-                     if any(any(d.contract is contract
-                                for d in module.data)
-                            for module in element.modules)), None)
+        element = self.getDataElement(contract)
+        return element.location if element is not None else None
 
     def getDataElement(self, contract):
         """
@@ -183,12 +207,34 @@ class Context(Entity):
         @type contract: L{Contract}
         @return: L{Element}
         """
-        return next((element for federation in self.federations
-                     for federate in federation.federates
-                     for element in federate.elements
-                     if any(data.contract is contract
-                            for module in element.modules
-                            for data in module.data)), None)
+        # data track their containing module as they are transferred
+        data = contract.data
+        module = data.container if data is not None else None
+        element = module.element if module is not None else None
+        if (element is not None
+                and any(element in federate.getElements()
+                        for federation in self.federations
+                        for federate in federation.getFederates())):
+            return element
+        return None
+
+    def getRollStream(self, federate, sector=None):
+        """
+        Gets the stream for disturbance rolls against the elements of a
+        federate. With common random numbers, each federate has a stream
+        per sector and turn, so designs with the same elements exposed in
+        a sector draw the same rolls whatever happens elsewhere. These
+        streams are created on each call and not kept by the manager.
+        @param federate: the federate
+        @type federate: L{Federate}
+        @param sector: the sector of the disturbance
+        @type sector: L{int}
+        @return: L{Random}
+        """
+        if self.crn:
+            return random.Random(self.streams.getSeed(
+                'roll', self.time, sector, federate.name))
+        return self.rollStreams[federate.name]
 
     def init(self, sim):
         """
@@ -197,23 +243,39 @@ class Context(Entity):
         @type sim: L{Simulator}
         """
         super(Context, self).init(sim)
-        self.masterStream = random.Random(self.seed)
-        self.shuffleStream = random.Random(self.masterStream.random())
-        self.orderStream = random.Random(self.masterStream.random())
+        self.streams = StreamManager(self.seed)
+        self.shuffleStream = self.streams.getStream('shuffle')
+        self.orderStream = self.streams.getStream('order')
         self.rollStreams = {}
         for federate in [federate for federation in self.federations
                          for federate in federation.federates]:
-            self.rollStreams[federate.name] = random.Random(self.masterStream.random())
+            self.rollStreams[federate.name] = self.streams.getStream(
+                'roll', federate.name)
         self.currentEvents = []
         self.pastEvents = []
-        self.futureEvents = self.events[:]
-        random.shuffle(self.futureEvents, random=self.shuffleStream.random)
+        self._numDraws = 0
+        self._eventIndices = dict((event, i)
+                                  for i, event in enumerate(self.events))
+        self._deck = array('i')
+        self._reshuffles = {}
+        future = list(range(len(self.events)))
+        shuffle(future, self.shuffleStream)
+        self._dealState = (future, [], [])
+        if sim.maxTime is not None:
+            self.dealEvents(self.getNumSectors()*int(math.ceil(
+                (sim.maxTime - sim.initTime)/float(sim.timeStep))))
         self.time = sim.initTime
         self.trigger('init', self, self.time)
         self.initTime = sim.initTime
         self.maxTime = sim.maxTime
         for federation in self.federations:
             federation.init(sim)
+        for federate in [federate for federation in self.federations
+                         for federate in federation.federates]:
+            for contract in federate.contracts:
+                if contract.clock is None:
+                    contract.bind(self)
+                    federate.scheduleDefault(contract)
 
     def tick(self, sim):
         """
@@ -226,6 +288,125 @@ class Context(Entity):
             federation.tick(sim)
         self._nextTime = self.time + sim.timeStep
 
+    def register(self, schedule):
+        """
+        Registers the per-turn updates of this context in a schedule:
+        one pass propagating orbiting elements, the updates of each
+        federation, and the resolution of the turn.
+        @param schedule: the schedule
+        @type schedule: L{Schedule}
+        """
+        self._orbiting = [element for federation in self.federations
+                          for federate in federation.federates
+                          for element in federate.elements
+                          if element.location is not None
+                          and element.location.isOrbit()]
+        self._nextLocations = []
+        schedule.add('tick', self.propagateElements)
+        schedule.add('tock', self.moveElements)
+        for federation in self.federations:
+            federation.register(schedule)
+        schedule.add('tock', self.resolveTurn)
+
+    def propagateElements(self, sim):
+        """
+        Propagates the locations of all orbiting elements over a time step.
+        @param sim: the simulator
+        @type sim: L{Simulator}
+        """
+        self._nextLocations = [self.propagate(element.location, sim.timeStep)
+                               for element in self._orbiting]
+        self._nextTime = self.time + sim.timeStep
+
+    def moveElements(self):
+        """
+        Moves all orbiting elements to their propagated locations.
+        """
+        for element, location in zip(self._orbiting, self._nextLocations):
+            element.move(location)
+
+    @property
+    def futureEvents(self):
+        """
+        The event templates remaining in the deck before the next shuffle,
+        in reverse order of reveal.
+        """
+        nextShuffle = next(iter(sorted(d for d in self._reshuffles
+                                       if d > self._numDraws)), None)
+        if nextShuffle is None:
+            indices = (self._dealState[0]
+                       + self._deck[self._numDraws:].tolist()[::-1])
+        else:
+            indices = self._deck[self._numDraws:nextShuffle].tolist()[::-1]
+        return [self.events[i] for i in indices]
+
+    def dealEvents(self, numDraws):
+        """
+        Deals the event deck up to a number of draws, consuming the shuffle
+        stream exactly as successive reveals would. Reshuffles are predicted
+        assuming every revealed event returns to the discard pile at the end
+        of its turn; L{revealEvents} re-deals if this does not hold.
+        @param numDraws: the number of draws
+        @type numDraws: L{int}
+        """
+        future, past, current = self._dealState
+        numSectors = self.getNumSectors()
+        while len(self._deck) < numDraws and len(future) > 0:
+            if len(self._deck) % numSectors == 0:
+                while len(current) > 0:
+                    past.append(current.pop())
+            current.append(future.pop())
+            self._deck.append(current[-1])
+            if len(future) < 1:
+                self._reshuffles[len(self._deck)] = (
+                    tuple(past), self.shuffleStream.getstate())
+                shuffle(past, self.shuffleStream)
+                while len(past) > 0:
+                    future.append(past.pop())
+
+    def getFutureReveals(self, numTurns=1):
+        """
+        Gets the event templates revealed in each sector in upcoming turns.
+        Reveals after the next shuffle are predictions which change if
+        contracted demands are still outstanding when the deck runs out.
+        @param numTurns: the number of turns
+        @type numTurns: L{int}
+        @return: L{list}
+        """
+        numSectors = self.getNumSectors()
+        self.dealEvents(self._numDraws + numTurns*numSectors)
+        return [dict(zip(self.sectors,
+                         [self.events[i] for i in
+                          self._deck[start:start+numSectors]]))
+                for start in range(self._numDraws,
+                                   self._numDraws + numTurns*numSectors,
+                                   numSectors)]
+
+    def _shuffleEvents(self):
+        """
+        Shuffles past events back into the deck after the last future event
+        is revealed, re-dealing if the discard pile differs from prediction.
+        """
+        logging.info('Shuffling events...')
+        predicted, state = self._reshuffles[self._numDraws]
+        past = [self._eventIndices[event.getTemplate()]
+                for event in self.pastEvents]
+        if tuple(past) != predicted and not self.crn:
+            # contracts changed the discard pile: re-deal from this point
+            # (common random numbers keep the deck a function of the seed)
+            numDealt = len(self._deck)
+            numSectors = self.getNumSectors()
+            turnStart = ((self._numDraws - 1)//numSectors)*numSectors
+            self.shuffleStream.setstate(state)
+            shuffle(past, self.shuffleStream)
+            self._dealState = (past[::-1], [],
+                               self._deck[turnStart:self._numDraws].tolist())
+            del self._deck[self._numDraws:]
+            for draw in [d for d in self._reshuffles if d > self._numDraws]:
+                del self._reshuffles[draw]
+            self.dealEvents(numDealt)
+        del self.pastEvents[:]
+
     def revealEvents(self):
         """
         Reveal events.
@@ -233,9 +414,15 @@ class Context(Entity):
         # reveal and resolve new events in each sector
         while len(self.currentEvents) > 0:
             self.pastEvents.append(self.currentEvents.pop())
+        self.dealEvents(self._numDraws + self.getNumSectors())
         for sector in self.sectors:
-            event = self.futureEvents.pop()
-            event.sector = sector
+            if self._numDraws >= len(self._deck):
+                logging.warning('No events remaining to reveal.')
+                break
+            # instantiate the shared template rather than mutating it
+            event = self.events[self._deck[self._numDraws]].instantiate(
+                sector, self._numDraws)
+            self._numDraws += 1
             self.currentEvents.append(event)
             if any(element for federation in self.federations
                    for federate in federation.federates
@@ -247,42 +434,37 @@ class Context(Entity):
                               .format(sector+1, event.name))
 
             # shuffle past events if there are no more future events
-            if len(self.futureEvents) < 1:
-                logging.info('Shuffling events...')
-                random.shuffle(self.pastEvents, self.shuffleStream.random)
-                while len(self.pastEvents) > 0:
-                    self.futureEvents.append(self.pastEvents.pop())
+            if self._numDraws in self._reshuffles:
+                self._shuffleEvents()
             self.trigger('reveal', self, event)
 
     def resolveDisturbances(self):
-        for event in [e for e in self.currentEvents if e.isDisturbance()]:
-            # resolve disturbances
+        """
+        Resolves disturbances.
+        """
+        disturbances = [e for e in self.currentEvents if e.isDisturbance()]
+        if len(disturbances) < 1:
+            return
+        # draw all hits up front, then apply them in event order
+        exposures, results = self.resolver.resolve(self, disturbances)
+        for event in disturbances:
             for federate in [federate for federation in self.federations
                              for federate in federation.federates]:
-                rollStream = self.rollStreams[federate.name]
-                for element in federate.elements:
-                    if (element.isSpace()
-                        and element.location is not None
-                        and element.location.sector == event.sector):
-                            if any(module.isDefense() for module in element.modules):
-                                logging.info('{0} is protected from {1}'
-                                            .format(element.name, event.name))
-                            else:
-                                numHits = 0
-                                modules = element.modules[:]
-                                random.shuffle(modules, random=rollStream.random)
-                                for module in modules:
-                                    if (numHits < event.maxHits
-                                        and rollStream.random() < event.hitChance):
-                                        element.modules.remove(module)
-                                        numHits += 1
-                                        logging.info('{0} was hit and lost {1}'
-                                                    .format(element.name, module.name))
-                                        self.trigger('hit', self, element, module)
-                                    else:
-
-                                        logging.debug('{0} was not hit'
-                                                    .format(element.name))
+                for element in exposures.get((federate, event.sector), []):
+                    if (event, element) not in results:
+                        logging.info('{0} is protected from {1}'
+                                    .format(element.name, event.name))
+                        continue
+                    modules, hits = results[(event, element)]
+                    for module in modules:
+                        if module in hits:
+                            element.removeModule(module)
+                            logging.info('{0} was hit and lost {1}'
+                                        .format(element.name, module.name))
+                            self.trigger('hit', self, element, module)
+                        else:
+                            logging.debug('{0} was not hit'
+                                        .format(element.name))
             self.trigger('resolve', self, event)
 
     def logState(self):
@@ -315,11 +497,10 @@ class Context(Entity):
         for federate in [federate for federation in self.federations
                          for federate in federation.federates]:
             # default any failed contracts
-            for contract in federate.contracts[:]:
-                if contract.isDefaulted(self.getDataLocation(contract)):
-                    logging.warning('Auto-defaulting {0} for {1}'
-                                .format(contract.name, federate.name))
-                    federate.resolve(contract, self)
+            for contract in federate.getDefaultedContracts(self):
+                logging.warning('Auto-defaulting {0} for {1}'
+                            .format(contract.name, federate.name))
+                federate.resolve(contract, self)
             # liquidate bankrupt federates
             if federate.getCash() < 0:
                 federate.liquidate(self)
@@ -329,14 +510,18 @@ class Context(Entity):
         Executes operational models.
         """
         logging.info('Commence operations for time {0}'.format(self.time))
+        if self.crn:
+            # order draws restart each turn (not kept by the manager)
+            self.orderStream = random.Random(
+                self.streams.getSeed('order', self.time))
         federates = [federate for federation in self.federations
                          for federate in federation.federates]
-        random.shuffle(federates, random=self.orderStream.random)
+        shuffle(federates, self.orderStream)
         for federate in federates:
             federate.operations.execute(federate, self)
 
         federations = self.federations[:]
-        random.shuffle(federations, random=self.orderStream.random)
+        shuffle(federations, self.orderStream)
         for federation in federations:
             federation.operations.execute(federation, self)
 
@@ -352,11 +537,19 @@ class Context(Entity):
         super(Context, self).tock()
         for federation in self.federations:
             federation.tock()
+        self.resolveTurn()
 
-        self.autoDefault()
+    def resolveTurn(self):
+        """
+        Advances the time of this context and resolves the turn: contract
+        defaults, event reveals, disturbances, and operations.
+        """
+        # contracts derive elapsed time from this clock
         self.time = self._nextTime
+        self.autoDefault()
         self.trigger('advance', self, self.time)
         self.logState()
         self.revealEvents()
+        self.eligibility.update(self)
         self.resolveDisturbances()
         self.executeOperations()
@@ -0,0 +1,97 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+Copyright 2017 Paul T. Grogan, Stevens Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+"""
+The L{ofspy.context.eligibility} package records which elements can sense
+the current demands.
+"""
+
+class EligibilityMatrix(object):
+    """
+    An L{EligibilityMatrix} records which elements of each federate can
+    sense each current demand. It is computed once per turn after events
+    are revealed; the row of an element is recomputed when its state
+    version changes, e.g. as sensing consumes its capacity.
+    """
+    def __init__(self):
+        self._demands = []
+        self._columns = {}
+        self._rows = {}
+
+    def update(self, context):
+        """
+        Computes this matrix for the current demands of a context.
+        @param context: the context
+        @type context: L{Context}
+        """
+        self._demands = [e for e in context.currentEvents if e.isDemand()]
+        self._columns = dict((demand, j)
+                             for j, demand in enumerate(self._demands))
+        self._rows = {}
+        for federation in context.federations:
+            for federate in federation.federates:
+                for element in federate.elements:
+                    self.getRow(element)
+
+    def getDemands(self):
+        """
+        Gets the demands in the columns of this matrix.
+        @return: L{list}
+        """
+        return self._demands
+
+    def getRow(self, element):
+        """
+        Gets the row of an element, recomputing it if the element state
+        changed since it was computed.
+        @param element: the element
+        @type element: L{Element}
+        @return: L{list}
+        """
+        version = element.getStateVersion()
+        row = self._rows.get(element)
+        if row is None or row[0] != version:
+            row = (version, [element.canSense(demand)
+                             for demand in self._demands])
+            self._rows[element] = row
+        return row[1]
+
+    def canSense(self, element, demand):
+        """
+        Checks if an element can sense a demand.
+        @param element: the element
+        @type element: L{Element}
+        @param demand: the demand
+        @type demand: L{Demand}
+        @return: L{bool}
+        """
+        j = self._columns.get(demand)
+        if j is None:
+            return element.canSense(demand)
+        return self.getRow(element)[j]
+
+    def getEligibleElements(self, federate, demand):
+        """
+        Gets the elements of a federate which can sense a demand.
+        @param federate: the federate
+        @type federate: L{Federate}
+        @param demand: the demand
+        @type demand: L{Demand}
+        @return: L{list}
+        """
+        return [element for element in federate.getElements()
+                if self.canSense(element, demand)]
@@ -29,6 +29,7 @@ class Event(object):
     """
     An L{Event} defines an uncertain occurrance.
     """
+    __slots__ = ('sector', 'name')
 
     def __init__(self, sector, name=None):
         """
@@ -43,6 +44,24 @@ class Event(object):
         else:
             self.name = name
 
+    def getTemplate(self):
+        """
+        Gets the template of this event.
+        @return: L{Event}
+        """
+        return self
+
+    def instantiate(self, sector, draw=0):
+        """
+        Instantiates this event as a template for one draw in a sector.
+        @param sector: the spatial sector where the draw occurs
+        @type sector: L{int}
+        @param draw: the draw index
+        @type draw: L{int}
+        @return: L{EventInstance}
+        """
+        return EventInstance(self, sector, draw)
+
     def isDemand(self):
         """
         Checks if this is a demand event.
@@ -65,6 +84,40 @@ class Event(object):
         """
         return self.name
 
+class EventInstance(object):
+    """
+    An L{EventInstance} is one draw of a shared, immutable event template.
+
+    Only the sector and draw index are stored per instance; all other
+    attributes and methods are delegated to the template so that contexts
+    can share a single template table.
+    """
+    __slots__ = ('template', 'sector', 'draw')
+
+    def __init__(self, template, sector, draw=0):
+        """
+        @param template: the event template
+        @type template: L{Event}
+        @param sector: the spatial sector where this draw occurs
+        @type sector: L{int}
+        @param draw: the draw index
+        @type draw: L{int}
+        """
+        self.template = template
+        self.sector = sector
+        self.draw = draw
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.template, name)
+
+    def __str__(self):
+        """
+        Gets the string representation of this event instance.
+        """
+        return str(self.template)
+
 class ValueSchedule(object):
     """
     A L{ValueSchedule} determines the value of a time-varying asset.
@@ -78,10 +131,15 @@ class ValueSchedule(object):
         """
         self.timeValuePairs = sorted(timeValuePairs, key=operator.itemgetter(0))
         self.defaultValue = defaultValue
+        self._defaultTime = max(tvp[0] for tvp in self.timeValuePairs)
+        # value lookup table indexed by integer elapsed time up to default
+        self._values = [self._findValueAt(time) for time
+                        in range(int(self._defaultTime) + 1)]
+        self._vectors = {}
 
-    def getValueAt(self, time):
+    def _findValueAt(self, time):
         """
-        Gets the value of this schedule at a time.
+        Finds the value of this schedule at a time by a linear search.
         @param time: the time
         @type time: L{float}
         @return: L{float}
@@ -91,6 +149,34 @@ class ValueSchedule(object):
                 return tvp[1]
         return self.defaultValue
 
+    def getValueAt(self, time):
+        """
+        Gets the value of this schedule at a time.
+        @param time: the time
+        @type time: L{float}
+        @return: L{float}
+        """
+        if time > self._defaultTime:
+            return self.defaultValue
+        if 0 <= time < len(self._values) and time == int(time):
+            return self._values[int(time)]
+        return self._findValueAt(time)
+
+    def getValues(self, time, numTimes):
+        """
+        Gets the values of this schedule at consecutive integer times.
+        @param time: the first time
+        @type time: L{int}
+        @param numTimes: the number of times
+        @type numTimes: L{int}
+        @return: L{tuple}
+        """
+        key = (time, numTimes)
+        if key not in self._vectors:
+            self._vectors[key] = tuple(self.getValueAt(time + t)
+                                       for t in range(numTimes))
+        return self._vectors[key]
+
     def getDefaultTime(self):
         """
         Gets the time when this schedule enters default.
@@ -98,7 +184,7 @@ class ValueSchedule(object):
         @type time: L{float}
         @return: L{float}
         """
-        return max(tvp[0] for tvp in self.timeValuePairs)
+        return self._defaultTime
 
     def __str__(self):
         """
@@ -110,6 +196,7 @@ class Demand(Event):
     """
     A L{Demand} defines a demand for data collection and down-link.
     """
+    __slots__ = ('phenomenon', 'size', 'valueSchedule')
 
     def __init__(self, sector, phenomenon, size,
                  valueSchedule=ValueSchedule(), name=None):
@@ -139,6 +226,17 @@ class Demand(Event):
         """
         return self.valueSchedule.getValueAt(time)
 
+    def getValues(self, time, numTimes):
+        """
+        Gets the values of this demand at consecutive integer elapsed times.
+        @param time: the first time
+        @type time: L{int}
+        @param numTimes: the number of times
+        @type numTimes: L{int}
+        @return: L{tuple}
+        """
+        return self.valueSchedule.getValues(time, numTimes)
+
     def getDefaultTime(self):
         """
         Gets the time when this demand is defaulted.
@@ -192,6 +290,7 @@ class Disturbance(Event):
     """
     A L{Disturbance} defines a potentially-damaging event.
     """
+    __slots__ = ('hitChance', 'maxHits')
 
     def __init__(self, sector, hitChance=0, maxHits=0, name=None):
         """
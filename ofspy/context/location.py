@@ -22,22 +22,63 @@ locations for elements.
 
 import uuid
 
+# level of surface locations; orbit altitudes are levels 1, 2, ...
+SURFACE = 0
+# orbit altitudes in order of level
+ALTITUDES = ('LEO', 'MEO', 'GEO')
+# sectors propagated per unit time at each level
+SPEEDS = (0, 2, 1, 0)
+# commission cost of a satellite at each level as a fraction of its cost
+COMMISSION_FACTORS = (0, 0, 0.5, 1.0)
+# whether sensors can sense demands from each level
+SENSING = (False, True, True, False)
+
+def getLevel(altitude):
+    """
+    Gets the level of an orbit altitude.
+    @param altitude: the altitude
+    @type altitude: L{str}
+    @return: L{int}
+    @raise ValueError: if the altitude is not one of L{ALTITUDES}
+    """
+    if altitude not in ALTITUDES:
+        raise ValueError('unknown orbit altitude {0}'.format(altitude))
+    return ALTITUDES.index(altitude) + 1
+
+def getCode(level, sector):
+    """
+    Gets the integer code of a location at a level and sector.
+    @param level: the level
+    @type level: L{int}
+    @param sector: the sector
+    @type sector: L{int}
+    @return: L{int}
+    """
+    return (sector << 8) | level
+
 class Location(object):
     """
-    An L{Location} defines a valid position of an element.
+    An L{Location} defines a valid position of an element. Locations are
+    immutable and encoded by an integer combining level and sector.
     """
-    def __init__(self, sector, name=None):
+    __slots__ = ('sector', 'name', 'level', 'code')
+
+    def __init__(self, sector, name=None, level=SURFACE):
         """
         @param sector: the sector of this location
         @type sector: L{int}
         @param name: the name of this location
         @type name: L{str}
+        @param level: the level of this location
+        @type level: L{int}
         """
         self.sector = sector
         if name is None:
             self.name = uuid.uuid4
         else:
             self.name = name
+        self.level = level
+        self.code = getCode(level, sector)
 
     def isSurface(self):
         """
@@ -65,6 +106,8 @@ class Surface(Location):
     """
     L{Surface} is a ground-based location on the Earth's surface.
     """
+    __slots__ = ()
+
     def __init__(self, sector, name=None):
         """
         @param sector: the sector of this surface location
@@ -86,6 +129,8 @@ class Orbit(Location):
     """
     L{Orbit} is a space-based location in orbit about the Earth.
     """
+    __slots__ = ('altitude',)
+
     def __init__(self, sector, altitude, name=None):
         """
         @param sector: the sector of this orbit location
@@ -95,7 +140,7 @@ class Orbit(Location):
         @param name: the name of this orbit location
         @type name: L{str}
         """
-        Location.__init__(self, sector, name)
+        Location.__init__(self, sector, name, level=getLevel(altitude))
         self.altitude = altitude
 
     def isOrbit(self):
@@ -0,0 +1,108 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+Copyright 2017 Paul T. Grogan, Stevens Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+"""
+The L{ofspy.context.resolver} package resolves disturbances for all
+exposed elements at once.
+"""
+
+from .stream import getHits, shuffle
+
+class DisturbanceResolver(object):
+    """
+    A L{DisturbanceResolver} computes disturbance hits for all exposed
+    elements in a turn, drawing from each federate roll stream in one pass.
+    """
+    def getExposures(self, context, disturbances):
+        """
+        Gets the elements exposed to disturbances.
+        @param context: the context
+        @type context: L{Context}
+        @param disturbances: the disturbances
+        @type disturbances: L{list}
+        @return: L{dict}
+        """
+        sectors = set(d.sector for d in disturbances)
+        exposures = {}
+        for federation in context.federations:
+            for federate in federation.federates:
+                for element in federate.elements:
+                    if (element.isSpace()
+                            and element.location is not None
+                            and element.location.sector in sectors):
+                        exposures.setdefault(
+                            (federate, element.location.sector),
+                            []).append(element)
+        return exposures
+
+    def drawHits(self, rollStream, trials):
+        """
+        Draws the hits for a sequence of trials from a roll stream. Each
+        trial shuffles the modules of an element and rolls for a hit on
+        each one until the maximum number of hits is reached, consuming
+        the stream exactly as resolving the trials one at a time.
+        @param rollStream: the roll stream
+        @type rollStream: L{Random}
+        @param trials: the (modules, hit chance, max hits) trials
+        @type trials: L{list}
+        @return: L{list}
+        """
+        results = []
+        for modules, hitChance, maxHits in trials:
+            order = list(modules)
+            shuffle(order, rollStream)
+            results.append((order, getHits(order, hitChance,
+                                           maxHits, rollStream)))
+        return results
+
+    def resolve(self, context, disturbances):
+        """
+        Resolves disturbances for all exposed elements.
+        @param context: the context
+        @type context: L{Context}
+        @param disturbances: the disturbances
+        @type disturbances: L{list}
+        @return: L{tuple}
+        """
+        exposures = self.getExposures(context, disturbances)
+        results = {}
+        for federation in context.federations:
+            for federate in federation.federates:
+                # group trials by roll stream: one per federate, or one
+                # per federate and sector with common random numbers
+                groups = {}
+                keys = []
+                for disturbance in disturbances:
+                    key = disturbance.sector if context.crn else None
+                    for element in exposures.get(
+                            (federate, disturbance.sector), []):
+                        if not any(module.isDefense()
+                                   for module in element.modules):
+                            if key not in groups:
+                                groups[key] = ([], [])
+                                keys.append(key)
+                            trials, elements = groups[key]
+                            trials.append((element.modules,
+                                           disturbance.hitChance,
+                                           disturbance.maxHits))
+                            elements.append((disturbance, element))
+                for key in keys:
+                    trials, elements = groups[key]
+                    hits = self.drawHits(
+                        context.getRollStream(federate, key), trials)
+                    results.update(zip(elements, hits))
+        return exposures, results
@@ -0,0 +1,136 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+Copyright 2017 Paul T. Grogan, Stevens Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+"""
+The L{ofspy.context.stream} package manages the random number streams of
+a context.
+
+Streams are split by key rather than drawn in sequence from a master
+stream: the stream with key path C{(k1, ..., kn)} under a root seed is
+seeded with the first 64 bits of the SHA-256 digest of
+C{'seed/k1/.../kn'}. Each stream is derived in constant time from its
+key, independent of which other streams exist or the order they are
+created, so parallel workers can derive the same streams independently
+(e.g. C{('roll', federate.name)}) or spawn disjoint key spaces (e.g.
+C{('worker', 3)}).
+
+Shuffles use the float-based Fisher-Yates algorithm of the C{random=}
+argument of C{random.shuffle} (removed in Python 3.11), so results do not
+depend on the Python version. The bulk draws consume a stream exactly as
+successive calls to C{random()}.
+"""
+
+import hashlib
+import itertools
+import random
+
+def getDraws(stream, n):
+    """
+    Draws a number of uniform random numbers in [0, 1) from a stream.
+    @param stream: the stream
+    @type stream: L{Random}
+    @param n: the number of draws
+    @type n: L{int}
+    @return: L{list}
+    """
+    return list(itertools.starmap(stream.random, itertools.repeat((), n)))
+
+def shuffle(items, stream):
+    """
+    Shuffles a list in place using draws from a stream.
+    @param items: the items to shuffle
+    @type items: L{list}
+    @param stream: the stream
+    @type stream: L{Random}
+    """
+    n = len(items)
+    for draw, i in zip(getDraws(stream, n-1), range(n-1, 0, -1)):
+        j = int(draw * (i+1))
+        items[i], items[j] = items[j], items[i]
+
+def getHits(items, hitChance, maxHits, stream):
+    """
+    Rolls for a hit on each item in order until the maximum number of hits
+    is reached. Rolls are drawn in bulk while each one may still count.
+    @param items: the items
+    @type items: L{list}
+    @param hitChance: the chance to hit each item
+    @type hitChance: L{float}
+    @param maxHits: the maximum number of hits
+    @type maxHits: L{int}
+    @param stream: the stream
+    @type stream: L{Random}
+    @return: L{list}
+    """
+    hits = []
+    i = 0
+    while i < len(items) and len(hits) < maxHits:
+        # the next (maxHits - hits) rolls are consumed whatever the outcome
+        n = min(maxHits - len(hits), len(items) - i)
+        for draw in getDraws(stream, n):
+            if draw < hitChance:
+                hits.append(items[i])
+            i += 1
+    return hits
+
+class StreamManager(object):
+    """
+    A L{StreamManager} derives independent, reproducible random number
+    streams by key from a root seed.
+    """
+    def __init__(self, seed=0, key=()):
+        """
+        @param seed: the root seed
+        @type seed: L{int}
+        @param key: the key path of this manager below the root
+        @type key: L{tuple}
+        """
+        self.seed = seed
+        self.key = tuple(key)
+        self._streams = {}
+
+    def getSeed(self, *key):
+        """
+        Gets the seed of the stream with a key.
+        @param key: the key of the stream
+        @type key: L{tuple}
+        @return: L{int}
+        """
+        path = '/'.join(str(k) for k in (self.seed,) + self.key + key)
+        return int(hashlib.sha256(path.encode('utf-8')).hexdigest()[:16], 16)
+
+    def getStream(self, *key):
+        """
+        Gets the stream with a key, creating it on first use.
+        @param key: the key of the stream
+        @type key: L{tuple}
+        @return: L{Random}
+        """
+        stream = self._streams.get(key)
+        if stream is None:
+            stream = random.Random(self.getSeed(*key))
+            self._streams[key] = stream
+        return stream
+
+    def spawn(self, *key):
+        """
+        Spawns a manager for the streams below a key.
+        @param key: the key of the manager
+        @type key: L{tuple}
+        @return: L{StreamManager}
+        """
+        return StreamManager(self.seed, self.key + key)
@@ -25,13 +25,17 @@ from .context import Context
 from .context.location import Surface, Orbit
 from .context.event import Demand, Disturbance, ValueSchedule
 from .player import Federation, Federate
-from .player.operations import Operations
-from .player.operations.dynamic import DynamicOperations
-from .player.operations.fixed_cost import FixedCostDynamicOperations
+from .player.operations import Operations, getOperations
 
+from .player.capability import PROTOCOLS, PHENOMENA
 from .player.module import Defense, Storage, Sensor, SpaceGroundLink, InterSatelliteLink
 from .player.element import GroundStation, Satellite
 
+# event template tables shared by all games in this process
+_eventTemplates = {}
+# interned location tables shared by all games in this process
+_locationTables = {}
+
 class Game(object):
     """
     A L{Game} contains the complete game specification.
@@ -44,7 +48,7 @@ class Game(object):
         @type numPlayers: L{int}
         @param initialCash: the initial cash of each player
         @type initialCash: L{float}
-        @param altitudes: the list of orbit altitudes
+        @param altitudes: the list of orbit altitudes (LEO, MEO or GEO)
         @type altitudes: L{list}
         @param numSectors: the number of sectors
         @type numSectors: L{int}
@@ -77,15 +81,15 @@ class Game(object):
             {'type':'GroundSta', 'cost':500, 'capacity':4}
         ]
         self.sglTypes = [
-            {'type':'pSGL', 'protocol':'pSGL', 'cost':50, 'size':1,
+            {'type':'pSGL', 'protocol':'pSGL', 'open':False, 'cost':50, 'size':1,
              'capacity':1, 'maxTransmitted':1, 'maxReceived':1},
-            {'type':'oSGL', 'protocol':'oSGL', 'cost':100, 'size':1,
+            {'type':'oSGL', 'protocol':'oSGL', 'open':True, 'cost':100, 'size':1,
              'capacity':1, 'maxTransmitted':1, 'maxReceived':1}
         ]
         self.islTypes = [
-            {'type':'pISL', 'protocol':'pISL', 'cost':50, 'size':1,
+            {'type':'pISL', 'protocol':'pISL', 'open':False, 'cost':50, 'size':1,
              'capacity':1, 'maxTransmitted':1, 'maxReceived':1},
-            {'type':'oISL', 'protocol':'oISL', 'cost':100, 'size':1,
+            {'type':'oISL', 'protocol':'oISL', 'open':True, 'cost':100, 'size':1,
              'capacity':1, 'maxTransmitted':1, 'maxReceived':1}
         ]
         self.sensorTypes = [
@@ -100,6 +104,11 @@ class Game(object):
         self.defenseTypes = [
             {'type':'DEF', 'cost':100, 'size':1}
         ]
+        # intern the protocols and phenomena of the module types
+        for spec in self.sglTypes + self.islTypes:
+            PROTOCOLS.register(spec['protocol'], isOpen=spec.get('open'))
+        for spec in self.sensorTypes:
+            PHENOMENA.register(spec['phenomenon'])
 
     def generateElement(self, eType, pId=None, eId=None, mTypes=[]):
         """
@@ -234,7 +243,52 @@ class Game(object):
                 else None)
         return None
 
-    def generateContext(self, seed=0, ops='', fops=''):
+    def generateEvents(self):
+        """
+        Generates the event templates for this game. Templates are shared
+        by all contexts with the same event types and must not be mutated.
+        @return: L{tuple}
+        """
+        key = tuple((eType[0], eType[1],
+                     tuple(sorted((k, str(v)) for k, v in eType[2].items())))
+                    for eType in self.eventTypes)
+        if key not in _eventTemplates:
+            events = []
+            for eType in self.eventTypes:
+                for i in range(eType[0]):
+                    if eType[1] == 'demand':
+                        events.append(Demand(sector=None,
+                                             phenomenon=eType[2]['phenomenon'],
+                                             size=eType[2]['size'],
+                                             valueSchedule=eType[2]['valueSchedule'],
+                                             name='{0}.{1}'.format(eType[2]['type'], i+1)))
+                    elif eType[1] == 'disturb':
+                        events.append(Disturbance(sector=None,
+                                                  hitChance=eType[2]['hitChance'],
+                                                  maxHits=eType[2]['maxHits'],
+                                                  name='{0}.{1}'.format(eType[2]['type'], i+1)))
+                    else:
+                        logging.warning('Cannot interpret event type {0}'.format(eType))
+            _eventTemplates[key] = tuple(events)
+        return _eventTemplates[key]
+
+    def generateLocations(self):
+        """
+        Generates the locations for this game. Locations are interned and
+        shared by all contexts with the same sectors and altitudes.
+        @return: L{tuple}
+        """
+        key = (self.numSectors, tuple(self.altitudes))
+        if key not in _locationTables:
+            locations = []
+            for i in range(self.numSectors):
+                locations.append(Surface(i, name='SUR{0}'.format(i+1)))
+                for altitude in self.altitudes:
+                    locations.append(Orbit(i, altitude, name='{0}{1}'.format(altitude, i+1)))
+            _locationTables[key] = tuple(locations)
+        return _locationTables[key]
+
+    def generateContext(self, seed=0, ops='', fops='', crn=False):
         """
         Generates the context for this game.
         @param seed: the seed
@@ -243,44 +297,28 @@ class Game(object):
         @type ops: L{str}
         @param fops: the federation oeprations specification
         @type fops: L{str}
+        @param crn: true, if random numbers are common across designs
+        @type crn: L{bool}
         @return: L{Context}
         """
-        # generate locations based on number of sectors
-        locations = []
-        for i in range(self.numSectors):
-            locations.append(Surface(i, name='SUR{0}'.format(i+1)))
-            for altitude in self.altitudes:
-                locations.append(Orbit(i, altitude, name='{0}{1}'.format(altitude, i+1)))
+        # locations are interned across contexts
+        locations = list(self.generateLocations())
 
-        # generate events based on known types
-        events = []
-        for eType in self.eventTypes:
-            for i in range(eType[0]):
-                if eType[1] == 'demand':
-                    events.append(Demand(sector=None,
-                                         phenomenon=eType[2]['phenomenon'],
-                                         size=eType[2]['size'],
-                                         valueSchedule=eType[2]['valueSchedule'],
-                                         name='{0}.{1}'.format(eType[2]['type'], i+1)))
-                elif eType[1] == 'disturb':
-                    events.append(Disturbance(sector=None,
-                                              hitChance=eType[2]['hitChance'],
-                                              maxHits=eType[2]['maxHits'],
-                                              name='{0}.{1}'.format(eType[2]['type'], i+1)))
-                else:
-                    logging.warning('Cannot interpret event type {0}'.format(eType))
+        # events share one immutable template table across contexts
+        events = list(self.generateEvents())
 
         # generate federates based on number of players
         federates = []
         for i in range(self.numPlayers):
             # parse federate operations strategy
             operations = None
-            if re.match('d', ops):
-                # independent operations strategy
+            if re.match('[^x]', ops) and getOperations(ops[0]) is not None:
+                # independent operations strategy (d, p for isl routes,
+                # or a registered third-party model)
                 planningHorizon = 6
                 storagePenalty = -100
                 islPenalty = -10
-                if re.match('d(\d+,(?:a|\d+),\d+)', ops):
+                if re.match('.(\d+,(?:a|\d+),\d+)', ops):
                     # case dH,s,i:  planning horizon H,
                     #               storage opportunity cost s,
                     #               isl opportunity cost i
@@ -296,7 +334,7 @@ class Game(object):
                     # case dH:  planning horizon H
                     planningHorizon = int(re.search(
                         '(\d+)', ops).group(0))
-                operations = DynamicOperations(
+                operations = getOperations(ops[0])(
                     planningHorizon=planningHorizon,
                     storagePenalty=storagePenalty,
                     islPenalty=islPenalty)
@@ -309,12 +347,13 @@ class Game(object):
                                     elements=[]))
         # parse federation operations strategy
         foperations = None
-        if re.match('d', fops):
-            # parse centralized operations strategy
+        if re.match('[^x]', fops) and getOperations(fops[0]) is not None:
+            # parse centralized operations strategy (d, p for isl routes,
+            # or a registered third-party model)
             planningHorizon = 6
             storagePenalty = -100
             islPenalty = -10
-            if re.match('d\d+,(?:a|\d+),\d+', fops):
+            if re.match('.\d+,(?:a|\d+),\d+', fops):
                 # case dH,s,i:  planning horizon H,
                 #               storage opportunity cost s,
                 #               isl opportunity cost i
@@ -330,7 +369,7 @@ class Game(object):
                 # case dH:  planning horizon H
                 planningHorizon = int(re.search(
                     '(\d+)', fops).group(0))
-            foperations = DynamicOperations(
+            foperations = getOperations(fops[0])(
                 planningHorizon=planningHorizon,
                 storagePenalty=storagePenalty,
                 islPenalty=islPenalty)
@@ -379,7 +418,7 @@ class Game(object):
                 priceSGL = int(args[0])
                 priceISL = int(args[1])
                 planningHorizon = int(args[2])
-            foperations = FixedCostDynamicOperations(
+            foperations = getOperations('x')(
                 planningHorizon=planningHorizon,
                 storagePenalty=storagePenalty,
                 islPenalty=islPenalty)
@@ -393,4 +432,4 @@ class Game(object):
                                 operations=foperations)
 
         return Context(locations=locations, events=events,
-                       federations=[federation], seed=seed)
+                       federations=[federation], seed=seed, crn=crn)
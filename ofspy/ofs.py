@@ -19,9 +19,31 @@ import logging
 from .game import Game
 from .simulation import Simulator
 
+def getNumPlayers(elements):
+    """
+    Counts the number of players owning a list of element specifications.
+    @param elements: the element specifications
+    @type elements: L{list}
+    @return: L{int}
+    """
+    numPlayers = 0
+    for element in elements:
+        # split each element into components
+        specs = element.split(',')
+        if len(specs) > 0 and len(specs[0].split('@')) == 2:
+            # parse player ownership
+            if len(specs[0].split('@')[0].split('.')) == 2:
+                # parse player owner from leading number
+                pId = int(specs[0].split('@')[0].split('.')[0])-1
+            else:
+                # default to player 0
+                pId = 0
+            numPlayers = max(numPlayers, pId+1)
+    return numPlayers
+
 class OFS(object):
     def __init__(self, elements, numPlayers, initialCash,
-                 numTurns, seed, ops, fops):
+                 numTurns, seed, ops, fops, crn=False):
         """
         @param elements: elements
         @type elements: L{str}
@@ -37,11 +59,14 @@ class OFS(object):
         @type ops: L{str}
         @param fops: federation operations specification
         @type fops: L{str}
+        @param crn: common random numbers across designs
+        @type crn: L{bool}
         """
         # initialize the game using the number of players and initial cash
         self.game = Game(numPlayers=numPlayers, initialCash=initialCash)
         # generate a new context using the supplied seed and operations strategies
-        self.context = self.game.generateContext(seed=seed, ops=ops, fops=fops)
+        self.context = self.game.generateContext(seed=seed, ops=ops, fops=fops,
+                                                 crn=crn)
         # initialize a new simulator
         self.sim = Simulator(
             entities = [self.context],
@@ -80,9 +105,8 @@ class OFS(object):
                     else:
                         pId = 0
                         eType = specs[0].split('@')[0]
-                    # parse location by searching for match in context locations
-                    location = next((l for l in self.context.locations
-                                     if l.name == specs[0].split('@')[1]), None)
+                    # parse location by name from context locations
+                    location = self.context.getLocation(specs[0].split('@')[1])
                     # parse modules
                     if pId < len(federates) and location is not None:
                         # generate elements
@@ -0,0 +1,202 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+"""
+The L{ofspy.optimize.adaptive} package allocates Monte Carlo seeds to
+designs adaptively. Seeds run in batches per design until the confidence
+interval of the mean final cash of every federate is narrow enough, or
+until the design is statistically dominated by a Pareto front.
+"""
+
+import math
+
+from ..batch import makeJob
+from .pareto import ParetoFront
+
+try:
+    from statistics import NormalDist
+except ImportError:
+    NormalDist = None
+
+def getCriticalValue(confidence):
+    """
+    Gets the two-sided critical value of the standard normal distribution
+    for a confidence level.
+    @param confidence: the confidence level, e.g. 0.95
+    @type confidence: L{float}
+    @return: L{float}
+    """
+    if NormalDist is not None:
+        return NormalDist().inv_cdf((1 + confidence)/2.)
+    # python2: common confidence levels only
+    return {0.9: 1.645, 0.95: 1.960, 0.99: 2.576}[confidence]
+
+class RunningStats(object):
+    """
+    A L{RunningStats} tracks the running mean and variance of samples
+    (Welford's algorithm).
+    """
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.
+        self._m2 = 0.
+
+    def add(self, x):
+        """
+        Adds a sample.
+        @param x: the sample
+        @type x: L{float}
+        """
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta/self.count
+        self._m2 += delta*(x - self.mean)
+
+    def getVariance(self):
+        """
+        Gets the sample variance.
+        @return: L{float}
+        """
+        return self._m2/(self.count - 1) if self.count > 1 else float('inf')
+
+    def getHalfWidth(self, z):
+        """
+        Gets the half-width of the confidence interval of the mean.
+        @param z: the critical value
+        @type z: L{float}
+        @return: L{float}
+        """
+        if self.count < 2:
+            return float('inf')
+        return z*math.sqrt(self.getVariance()/self.count)
+
+class AdaptiveEvaluator(object):
+    """
+    An L{AdaptiveEvaluator} evaluates designs with as many seeds as needed
+    to estimate their expected final cash.
+    """
+    def __init__(self, service, width=100, confidence=0.95, batchSize=4,
+                 minSeeds=4, maxSeeds=64, player=1, **options):
+        """
+        @param service: the simulation service
+        @type service: L{SimulationService}
+        @param width: the target width of the confidence intervals
+        @type width: L{float}
+        @param confidence: the confidence level
+        @type confidence: L{float}
+        @param batchSize: the number of seeds per batch
+        @type batchSize: L{int}
+        @param minSeeds: the minimum number of seeds per design
+        @type minSeeds: L{int}
+        @param maxSeeds: the maximum number of seeds per design
+        @type maxSeeds: L{int}
+        @param player: the player number whose value is compared
+        @type player: L{int}
+        @param options: the job options, e.g. ops, fops, numTurns
+        @type options: L{dict}
+        """
+        self.service = service
+        self.width = width
+        self.z = getCriticalValue(confidence)
+        self.batchSize = batchSize
+        self.minSeeds = minSeeds
+        self.maxSeeds = maxSeeds
+        self.federate = 'P{0}'.format(player)
+        self.options = options
+        self.numSimulations = 0
+
+    def isConverged(self, stats):
+        """
+        Checks if the intervals of all federates are narrow enough.
+        @param stats: the running stats by federate
+        @type stats: L{dict}
+        @return: L{bool}
+        """
+        return all(2*s.getHalfWidth(self.z) <= self.width
+                   for s in stats.values())
+
+    def isDominated(self, cost, stats, front):
+        """
+        Checks if a design is statistically dominated, i.e. the upper
+        bound of its value is dominated by a point of a front.
+        @param cost: the design cost
+        @type cost: L{float}
+        @param stats: the running stats by federate
+        @type stats: L{dict}
+        @param front: the Pareto front
+        @type front: L{ParetoFront}
+        @return: L{bool}
+        """
+        s = stats[self.federate]
+        return front.isDominated(cost, s.mean + s.getHalfWidth(self.z))
+
+    def evaluate(self, designs, costs, front=None):
+        """
+        Evaluates designs, running batches of seeds for each design still
+        active until converged, dominated, or out of seeds.
+        @param designs: the designs
+        @type designs: L{list}
+        @param costs: the cost of each design
+        @type costs: L{list}
+        @param front: the Pareto front of previously evaluated designs
+        @type front: L{ParetoFront}
+        @return: L{list}
+        """
+        local = ParetoFront()
+        if front is not None:
+            for cost, value, design in front:
+                local.add(cost, value, design)
+        stats = [{} for design in designs]
+        dominated = [False for design in designs]
+        active = list(range(len(designs)))
+        while len(active) > 0:
+            jobs = []
+            for i in active:
+                start = (stats[i][self.federate].count
+                         if self.federate in stats[i] else 0)
+                for seed in range(start, min(start + self.batchSize,
+                                             self.maxSeeds)):
+                    jobs.append(makeJob(designs[i], id=(i, seed), seed=seed,
+                                        **self.options))
+            for result in self.service.evaluate(jobs):
+                if 'error' in result:
+                    raise RuntimeError('cannot evaluate {}: {}'.format(
+                        designs[result['id'][0]], result['error']))
+                self.numSimulations += 1
+                for r in result['results']:
+                    stats[result['id'][0]].setdefault(
+                        r['federate'], RunningStats()).add(r['finalCash'])
+            remaining = []
+            for i in active:
+                count = stats[i][self.federate].count
+                if count >= self.minSeeds \
+                        and self.isDominated(costs[i], stats[i], local):
+                    dominated[i] = True
+                elif count < self.maxSeeds and (count < self.minSeeds
+                        or not self.isConverged(stats[i])):
+                    remaining.append(i)
+                else:
+                    local.add(costs[i], stats[i][self.federate].mean,
+                              designs[i])
+            active = remaining
+        return [{'cost': costs[i],
+                 'value': stats[i][self.federate].mean,
+                 'halfWidth': stats[i][self.federate].getHalfWidth(self.z),
+                 'numSeeds': stats[i][self.federate].count,
+                 'dominated': dominated[i],
+                 'stats': stats[i]}
+                for i in range(len(designs))]
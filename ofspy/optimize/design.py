@@ -0,0 +1,330 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+"""
+The L{ofspy.optimize.design} package generates, validates and varies the
+designs of a player from the type tables of a game.
+
+A design is a tuple of element specifications in the syntax of C{ofs.py},
+e.g. C{('1.GroundSta@SUR1,pSGL', '1.SmallSat@LEO1,pSGL,SAR')}. Canonical
+designs sort the modules of each element and the elements themselves, as
+neither order changes the designed system.
+"""
+
+from ..context.location import COMMISSION_FACTORS
+from ..context.stream import shuffle
+
+class DesignSpace(object):
+    """
+    A L{DesignSpace} holds the element, module and location choices of a
+    player in a game.
+    """
+    def __init__(self, game, player=1, maxElements=4):
+        """
+        @param game: the game
+        @type game: L{Game}
+        @param player: the player number
+        @type player: L{int}
+        @param maxElements: the maximum number of elements in a design
+        @type maxElements: L{int}
+        """
+        self.game = game
+        self.player = player
+        self.maxElements = maxElements
+        locations = game.generateLocations()
+        self._levels = dict((l.name, l.level) for l in locations)
+        self._sectors = dict((l.name, l.sector) for l in locations)
+        self._locationNames = dict(((l.level, l.sector), l.name)
+                                   for l in locations)
+        self.numSectors = len(set(self._sectors.values()))
+        self._surfaces = [l.name for l in locations if l.isSurface()]
+        self._orbits = [l.name for l in locations if l.isOrbit()]
+        self._elementTypes = dict((t['type'], t) for t in
+                                  game.stationTypes + game.satelliteTypes)
+        self._stationTypes = [t['type'] for t in game.stationTypes]
+        self._satelliteTypes = [t['type'] for t in game.satelliteTypes]
+        self._moduleTypes = dict((t['type'], t) for t in
+                                 game.sglTypes + game.islTypes
+                                 + game.sensorTypes + game.storageTypes
+                                 + game.defenseTypes)
+        # ground stations only communicate with satellites
+        self._stationModules = [t['type'] for t in game.sglTypes]
+        self._satelliteModules = [t['type'] for t in
+                                  game.sglTypes + game.islTypes
+                                  + game.sensorTypes + game.storageTypes
+                                  + game.defenseTypes]
+
+    def getElementTypes(self):
+        """
+        Gets the element types, ground stations first.
+        @return: L{list}
+        """
+        return self._stationTypes + self._satelliteTypes
+
+    def getCapacity(self, eType):
+        """
+        Gets the module capacity of an element type.
+        @param eType: the element type
+        @type eType: L{str}
+        @return: L{int}
+        """
+        return self._elementTypes[eType]['capacity']
+
+    def getModulesSize(self, modules):
+        """
+        Gets the total size of modules.
+        @param modules: the module types
+        @type modules: L{list}
+        @return: L{int}
+        """
+        return sum(self._moduleTypes[m]['size'] for m in modules)
+
+    def isStation(self, eType):
+        """
+        Checks if an element type is a ground station.
+        @param eType: the element type
+        @type eType: L{str}
+        @return: L{bool}
+        """
+        return eType in self._stationTypes
+
+    def getLocations(self, eType):
+        """
+        Gets the location names for an element type.
+        @param eType: the element type
+        @type eType: L{str}
+        @return: L{list}
+        """
+        return self._surfaces if self.isStation(eType) else self._orbits
+
+    def getModuleTypes(self, eType):
+        """
+        Gets the module types for an element type.
+        @param eType: the element type
+        @type eType: L{str}
+        @return: L{list}
+        """
+        return (self._stationModules if self.isStation(eType)
+                else self._satelliteModules)
+
+    def parse(self, spec):
+        """
+        Parses an element specification.
+        @param spec: the element specification
+        @type spec: L{str}
+        @return: L{tuple}
+        """
+        specs = spec.split(',')
+        owner, location = specs[0].split('@')
+        eType = owner.split('.')[-1]
+        return eType, location, specs[1:]
+
+    def format(self, eType, location, modules):
+        """
+        Formats an element specification.
+        @param eType: the element type
+        @type eType: L{str}
+        @param location: the location name
+        @type location: L{str}
+        @param modules: the module types
+        @type modules: L{list}
+        @return: L{str}
+        """
+        return ','.join(['{0}.{1}@{2}'.format(self.player, eType, location)]
+                        + list(modules))
+
+    def canonicalize(self, design):
+        """
+        Gets the canonical form of a design.
+        @param design: the design
+        @type design: L{tuple}
+        @return: L{tuple}
+        """
+        elements = []
+        for spec in design:
+            eType, location, modules = self.parse(spec)
+            elements.append(self.format(eType, location, sorted(modules)))
+        return tuple(sorted(elements))
+
+    def rotate(self, design, numSectors):
+        """
+        Rotates the locations of a design by a number of sectors.
+        @param design: the design
+        @type design: L{tuple}
+        @param numSectors: the number of sectors
+        @type numSectors: L{int}
+        @return: L{tuple}
+        """
+        elements = []
+        for spec in design:
+            eType, location, modules = self.parse(spec)
+            elements.append(self.format(eType, self._locationNames[(
+                self._levels[location],
+                (self._sectors[location] + numSectors) % self.numSectors)],
+                modules))
+        return self.canonicalize(elements)
+
+    def getSymmetricForm(self, design):
+        """
+        Gets the canonical form of a design under the rotation symmetry
+        of sectors, i.e. the least canonical form of its rotations. The
+        rotations of a design are equivalent in distribution, as each
+        sector draws events from the same deck and every orbit propagates
+        alike.
+        @param design: the design
+        @type design: L{tuple}
+        @return: L{tuple}
+        """
+        return min(self.rotate(design, k) for k in range(self.numSectors))
+
+    def getElementCost(self, eType, location, modules):
+        """
+        Gets the initial (design and commission) cost of an element.
+        @param eType: the element type
+        @type eType: L{str}
+        @param location: the location name
+        @type location: L{str}
+        @param modules: the module types
+        @type modules: L{list}
+        @return: L{float}
+        """
+        elementCost = self._elementTypes[eType]['cost']
+        return (elementCost
+                + sum(self._moduleTypes[m]['cost'] for m in modules)
+                + COMMISSION_FACTORS[self._levels[location]]*elementCost)
+
+    def getCost(self, design):
+        """
+        Gets the initial (design and commission) cost of a design.
+        @param design: the design
+        @type design: L{tuple}
+        @return: L{float}
+        """
+        return sum(self.getElementCost(*self.parse(spec)) for spec in design)
+
+    def isValid(self, design):
+        """
+        Checks if a design is valid: known types at allowed locations,
+        modules within element capacity, and at most one ground station
+        per location.
+        @param design: the design
+        @type design: L{tuple}
+        @return: L{bool}
+        """
+        if len(design) < 1 or len(design) > self.maxElements:
+            return False
+        stations = set()
+        for spec in design:
+            try:
+                eType, location, modules = self.parse(spec)
+            except ValueError:
+                return False
+            if eType not in self._elementTypes \
+                    or location not in self.getLocations(eType) \
+                    or any(m not in self.getModuleTypes(eType)
+                           for m in modules):
+                return False
+            if self.getModulesSize(modules) > self.getCapacity(eType):
+                return False
+            if self.isStation(eType):
+                if location in stations:
+                    return False
+                stations.add(location)
+        return True
+
+    def generateElement(self, rng):
+        """
+        Generates a random element specification.
+        @param rng: the random number generator
+        @type rng: L{Random}
+        @return: L{str}
+        """
+        eType = rng.choice(self.getElementTypes())
+        capacity = self.getCapacity(eType)
+        choices = self.getModuleTypes(eType)
+        modules = [rng.choice(choices)
+                   for i in range(rng.randint(1, capacity))]
+        while self.getModulesSize(modules) > capacity:
+            modules.pop()
+        return self.format(eType, rng.choice(self.getLocations(eType)),
+                           sorted(modules))
+
+    def generateDesign(self, rng):
+        """
+        Generates a random valid design.
+        @param rng: the random number generator
+        @type rng: L{Random}
+        @return: L{tuple}
+        """
+        while True:
+            design = self.canonicalize(
+                [self.generateElement(rng)
+                 for i in range(rng.randint(1, self.maxElements))])
+            if self.isValid(design):
+                return design
+
+    def mutate(self, design, rng):
+        """
+        Mutates a design by adding, removing or relocating an element, or
+        adding, removing or replacing a module.
+        @param design: the design
+        @type design: L{tuple}
+        @param rng: the random number generator
+        @type rng: L{Random}
+        @return: L{tuple}
+        """
+        elements = list(design)
+        i = rng.randrange(len(elements))
+        eType, location, modules = self.parse(elements[i])
+        operator = rng.randrange(6)
+        if operator == 0 and len(elements) < self.maxElements:
+            elements.append(self.generateElement(rng))
+        elif operator == 1 and len(elements) > 1:
+            del elements[i]
+        elif operator == 2:
+            elements[i] = self.format(
+                eType, rng.choice(self.getLocations(eType)), modules)
+        elif operator == 3:
+            elements[i] = self.format(
+                eType, location,
+                modules + [rng.choice(self.getModuleTypes(eType))])
+        elif operator == 4 and len(modules) > 0:
+            del modules[rng.randrange(len(modules))]
+            elements[i] = self.format(eType, location, modules)
+        elif len(modules) > 0:
+            modules[rng.randrange(len(modules))] = rng.choice(
+                self.getModuleTypes(eType))
+            elements[i] = self.format(eType, location, modules)
+        return self.canonicalize(elements)
+
+    def crossover(self, design1, design2, rng):
+        """
+        Crosses two designs by taking each element of either with equal
+        chance.
+        @param design1: the first design
+        @type design1: L{tuple}
+        @param design2: the second design
+        @type design2: L{tuple}
+        @param rng: the random number generator
+        @type rng: L{Random}
+        @return: L{tuple}
+        """
+        elements = [e for e in design1 + design2 if rng.random() < 0.5]
+        if len(elements) == 0:
+            elements = [rng.choice(design1 + design2)]
+        shuffle(elements, rng)
+        return self.canonicalize(elements[:self.maxElements])
@@ -0,0 +1,109 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+"""
+The L{ofspy.optimize.enumeration} package enumerates the canonical,
+feasible designs of a player within a budget.
+
+Elements are enumerated once per type, location and multiset of modules
+within capacity, and designs once per multiset of elements, so every
+design is emitted in canonical form exactly once. Costs are computed in
+closed form from the type tables and bound the search: elements are
+tried in order of increasing cost and a branch stops as soon as the next
+element exceeds the remaining budget.
+"""
+
+import itertools
+
+def getElementChoices(space, budget, minModules=1):
+    """
+    Gets the element choices of a design space within a budget, sorted by
+    increasing cost.
+    @param space: the design space
+    @type space: L{DesignSpace}
+    @param budget: the maximum cost
+    @type budget: L{float}
+    @param minModules: the minimum number of modules of an element
+    @type minModules: L{int}
+    @return: L{list}
+    """
+    choices = []
+    for eType in space.getElementTypes():
+        capacity = space.getCapacity(eType)
+        moduleTypes = sorted(space.getModuleTypes(eType))
+        for numModules in range(minModules, capacity + 1):
+            for modules in itertools.combinations_with_replacement(
+                    moduleTypes, numModules):
+                if space.getModulesSize(modules) > capacity:
+                    continue
+                for location in space.getLocations(eType):
+                    cost = space.getElementCost(eType, location, modules)
+                    if cost <= budget:
+                        choices.append((cost,
+                                        space.format(eType, location,
+                                                     modules),
+                                        location if space.isStation(eType)
+                                        else None))
+    return sorted(choices)
+
+def enumerateDesigns(space, budget, symmetric=False, minModules=1):
+    """
+    Enumerates the canonical, feasible designs of a design space within a
+    budget.
+    @param space: the design space
+    @type space: L{DesignSpace}
+    @param budget: the maximum cost
+    @type budget: L{float}
+    @param symmetric: true, if designs equivalent under the rotation of
+        sectors are emitted once (in their symmetric form)
+    @type symmetric: L{bool}
+    @param minModules: the minimum number of modules of an element
+    @type minModules: L{int}
+    @return: L{generator}
+    """
+    choices = getElementChoices(space, budget, minModules)
+    # rotate each element once rather than each design
+    rotations = dict((spec, [space.rotate((spec,), k)[0]
+                             for k in range(1, space.numSectors)])
+                     for cost, spec, station in choices) if symmetric else {}
+
+    def isSymmetricForm(design):
+        for k in range(space.numSectors - 1):
+            if tuple(sorted(rotations[spec][k] for spec in design)) < design:
+                return False
+        return True
+
+    def extend(start, cost, elements, stations):
+        for i in range(start, len(choices)):
+            elementCost, spec, station = choices[i]
+            if cost + elementCost > budget:
+                break
+            if station is not None and station in stations:
+                continue
+            design = elements + [spec]
+            canonical = tuple(sorted(design))
+            if not symmetric or isSymmetricForm(canonical):
+                yield cost + elementCost, canonical
+            if len(design) < space.maxElements:
+                # satellites may repeat; one ground station per location
+                for result in extend(i if station is None else i + 1,
+                                     cost + elementCost, design,
+                                     stations | set([station])
+                                     if station is not None else stations):
+                    yield result
+
+    return extend(0, 0, [], frozenset())
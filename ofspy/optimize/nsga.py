@@ -0,0 +1,273 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+"""
+The L{ofspy.optimize.nsga} package evolves designs with the NSGA-II
+algorithm to minimize initial cost and maximize expected final value.
+"""
+
+import random
+
+from ..batch import makeJob
+from ..service import SimulationService
+from .pareto import ParetoFront
+
+def sortNondominated(objectives):
+    """
+    Sorts points into successive non-dominated fronts, minimizing every
+    objective.
+    @param objectives: the objective tuples
+    @type objectives: L{list}
+    @return: L{list}
+    """
+    dominated = [[] for point in objectives]
+    counts = [0 for point in objectives]
+    fronts = [[]]
+    for i, a in enumerate(objectives):
+        for j, b in enumerate(objectives):
+            if all(x <= y for x, y in zip(a, b)) and a != b:
+                dominated[i].append(j)
+            elif all(y <= x for x, y in zip(a, b)) and a != b:
+                counts[i] += 1
+        if counts[i] == 0:
+            fronts[0].append(i)
+    while len(fronts[-1]) > 0:
+        front = []
+        for i in fronts[-1]:
+            for j in dominated[i]:
+                counts[j] -= 1
+                if counts[j] == 0:
+                    front.append(j)
+        fronts.append(front)
+    return fronts[:-1]
+
+def getCrowdingDistances(objectives, front):
+    """
+    Gets the crowding distance of each point in a front.
+    @param objectives: the objective tuples
+    @type objectives: L{list}
+    @param front: the indices of the points in the front
+    @type front: L{list}
+    @return: L{dict}
+    """
+    distances = dict((i, 0.) for i in front)
+    for k in range(len(objectives[front[0]]) if len(front) > 0 else 0):
+        ordered = sorted(front, key=lambda i: objectives[i][k])
+        span = objectives[ordered[-1]][k] - objectives[ordered[0]][k]
+        distances[ordered[0]] = distances[ordered[-1]] = float('inf')
+        if span > 0:
+            for m in range(1, len(ordered)-1):
+                distances[ordered[m]] += (objectives[ordered[m+1]][k]
+                                          - objectives[ordered[m-1]][k])/span
+    return distances
+
+class NSGAOptimizer(object):
+    """
+    An L{NSGAOptimizer} evolves a population of designs with NSGA-II,
+    evaluating each distinct design once (over a fixed set of seeds, or
+    adaptively) in a simulation service and keeping the cost/value Pareto
+    front of all evaluated designs.
+    """
+    def __init__(self, space, populationSize=20, crossoverRate=0.9,
+                 seeds=(0,), seed=0, service=None, numWorkers=None,
+                 evaluator=None, **options):
+        """
+        @param space: the design space
+        @type space: L{DesignSpace}
+        @param populationSize: the population size
+        @type populationSize: L{int}
+        @param crossoverRate: the chance to cross parents before mutation
+        @type crossoverRate: L{float}
+        @param seeds: the simulation seeds for each design
+        @type seeds: L{list}
+        @param seed: the seed for the optimizer
+        @type seed: L{int}
+        @param service: the simulation service (defaults to a new one)
+        @type service: L{SimulationService}
+        @param numWorkers: the number of workers of a new service
+        @type numWorkers: L{int}
+        @param evaluator: the adaptive evaluator to allocate seeds to
+            designs (defaults to the fixed seeds)
+        @type evaluator: L{AdaptiveEvaluator}
+        @param options: the job options, e.g. ops, fops, numTurns
+        @type options: L{dict}
+        """
+        self.space = space
+        self.populationSize = populationSize
+        self.crossoverRate = crossoverRate
+        self.seeds = list(seeds)
+        self.options = options
+        self._rng = random.Random(seed)
+        self._ownsService = service is None
+        self.service = (service if service is not None
+                        else SimulationService(numWorkers=numWorkers))
+        self.evaluator = evaluator
+        self.evaluations = {}
+        self.front = ParetoFront()
+        self.population = []
+        self.numRejected = 0
+        self._ranks = {}
+        self._distances = {}
+
+    def getValue(self, result):
+        """
+        Gets the value of a design from a job result.
+        @param result: the job result
+        @type result: L{dict}
+        @return: L{float}
+        """
+        federate = 'P{0}'.format(self.space.player)
+        return next(r['finalCash'] for r in result['results']
+                    if r['federate'] == federate)
+
+    def evaluate(self, designs):
+        """
+        Evaluates the designs not evaluated before, in parallel.
+        @param designs: the designs
+        @type designs: L{list}
+        """
+        designs = [d for d in set(designs) if d not in self.evaluations]
+        if self.evaluator is not None:
+            summaries = self.evaluator.evaluate(
+                designs, [self.space.getCost(d) for d in designs], self.front)
+            for design, summary in zip(designs, summaries):
+                self.evaluations[design] = (summary['cost'], summary['value'])
+                self.front.add(summary['cost'], summary['value'], design)
+            return
+        jobs = [makeJob(design, id=(i, seed), seed=seed, **self.options)
+                for i, design in enumerate(designs)
+                for seed in self.seeds]
+        values = dict((design, []) for design in designs)
+        for result in self.service.evaluate(jobs):
+            if 'error' in result:
+                raise RuntimeError('cannot evaluate {}: {}'.format(
+                    designs[result['id'][0]], result['error']))
+            values[designs[result['id'][0]]].append(self.getValue(result))
+        for design in designs:
+            cost = self.space.getCost(design)
+            value = sum(values[design])/float(len(values[design]))
+            self.evaluations[design] = (cost, value)
+            self.front.add(cost, value, design)
+
+    def getObjectives(self, design):
+        """
+        Gets the objectives to minimize for an evaluated design.
+        @param design: the design
+        @type design: L{tuple}
+        @return: L{tuple}
+        """
+        cost, value = self.evaluations[design]
+        return (cost, -value)
+
+    def select(self, designs, size):
+        """
+        Selects designs by non-dominated rank and crowding distance.
+        @param designs: the designs
+        @type designs: L{list}
+        @param size: the number to select
+        @type size: L{int}
+        @return: L{list}
+        """
+        objectives = [self.getObjectives(d) for d in designs]
+        selected = []
+        for rank, front in enumerate(sortNondominated(objectives)):
+            distances = getCrowdingDistances(objectives, front)
+            for i in front:
+                self._ranks[designs[i]] = rank
+                self._distances[designs[i]] = distances[i]
+            if len(selected) + len(front) > size:
+                front = sorted(front, key=lambda i: -distances[i])
+            selected.extend(designs[i] for i in front[:size-len(selected)])
+            if len(selected) >= size:
+                break
+        return selected
+
+    def tournament(self):
+        """
+        Picks a parent by binary tournament on rank and crowding distance.
+        @return: L{tuple}
+        """
+        a, b = self._rng.sample(self.population, 2) \
+            if len(self.population) > 1 else self.population*2
+        if (self._ranks[a], -self._distances[a]) \
+                <= (self._ranks[b], -self._distances[b]):
+            return a
+        return b
+
+    def generateOffspring(self):
+        """
+        Generates a new valid design not evaluated before, trying a
+        bounded number of variations.
+        @return: L{tuple}
+        """
+        for attempt in range(100):
+            parent = self.tournament()
+            if self._rng.random() < self.crossoverRate:
+                parent = self.space.crossover(parent, self.tournament(),
+                                              self._rng)
+            child = self.space.mutate(parent, self._rng)
+            if child not in self.evaluations and self.space.isValid(child):
+                return child
+            self.numRejected += 1
+        return self.space.generateDesign(self._rng)
+
+    def initialize(self):
+        """
+        Initializes and evaluates a population of distinct random designs.
+        """
+        designs = set()
+        for attempt in range(100*self.populationSize):
+            if len(designs) >= self.populationSize:
+                break
+            designs.add(self.space.generateDesign(self._rng))
+        self.population = sorted(designs)
+        self.evaluate(self.population)
+        self.population = self.select(self.population, self.populationSize)
+
+    def step(self):
+        """
+        Evolves the population by one generation.
+        """
+        offspring = set()
+        for attempt in range(10*self.populationSize):
+            if len(offspring) >= self.populationSize:
+                break
+            offspring.add(self.generateOffspring())
+        offspring = sorted(offspring)
+        self.evaluate(offspring)
+        self.population = self.select(
+            sorted(set(self.population + offspring)), self.populationSize)
+
+    def run(self, numGenerations):
+        """
+        Runs the optimizer for a number of generations.
+        @param numGenerations: the number of generations
+        @type numGenerations: L{int}
+        @return: L{ParetoFront}
+        """
+        if len(self.population) == 0:
+            self.initialize()
+        for generation in range(numGenerations):
+            self.step()
+        return self.front
+
+    def close(self):
+        """
+        Closes the simulation service if owned by this optimizer.
+        """
+        if self._ownsService:
+            self.service.close()
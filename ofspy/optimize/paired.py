@@ -0,0 +1,72 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+"""
+The L{ofspy.optimize.paired} package compares designs by paired
+differences in common random numbers mode: for each seed, both designs see
+the same event deck and the same disturbance rolls per sector and turn,
+so the noise shared by the designs cancels out of their difference.
+"""
+
+from ..batch import makeJob
+from .adaptive import RunningStats, getCriticalValue
+
+def comparePaired(service, design, baseline, seeds=(0,), confidence=0.95,
+                  **options):
+    """
+    Compares a design against a baseline by the paired differences of the
+    final cash of each federate, simulating both designs for each seed
+    with common random numbers.
+    @param service: the simulation service
+    @type service: L{SimulationService}
+    @param design: the design elements
+    @type design: L{list}
+    @param baseline: the baseline design elements
+    @type baseline: L{list}
+    @param seeds: the seeds
+    @type seeds: L{list}
+    @param confidence: the confidence level of the intervals
+    @type confidence: L{float}
+    @param options: the job options, e.g. ops, fops, numTurns
+    @type options: L{dict}
+    @return: L{dict}
+    """
+    options['crn'] = True
+    seeds = list(seeds)
+    jobs = [makeJob(d, id=(i, seed), seed=seed, **options)
+            for i, d in enumerate([design, baseline]) for seed in seeds]
+    finalCash = {}
+    for result in service.evaluate(jobs):
+        if 'error' in result:
+            raise RuntimeError('cannot evaluate {}: {}'.format(
+                [design, baseline][result['id'][0]], result['error']))
+        for r in result['results']:
+            finalCash[tuple(result['id']) + (r['federate'],)] = r['finalCash']
+    z = getCriticalValue(confidence)
+    comparison = {}
+    for federate in sorted(set(key[2] for key in finalCash)):
+        differences = [finalCash[(0, seed, federate)]
+                       - finalCash[(1, seed, federate)] for seed in seeds
+                       if (0, seed, federate) in finalCash
+                       and (1, seed, federate) in finalCash]
+        stats = RunningStats()
+        for difference in differences:
+            stats.add(difference)
+        comparison[federate] = {'mean': stats.mean,
+                                'halfWidth': stats.getHalfWidth(z),
+                                'differences': differences}
+    return comparison
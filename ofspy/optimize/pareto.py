@@ -0,0 +1,92 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+"""
+The L{ofspy.optimize.pareto} package maintains cost/value Pareto fronts.
+"""
+
+import bisect
+
+def dominates(a, b):
+    """
+    Checks if a (cost, value) point dominates another, i.e. costs no more
+    and is worth no less, and differs.
+    @param a: the first point
+    @type a: L{tuple}
+    @param b: the second point
+    @type b: L{tuple}
+    @return: L{bool}
+    """
+    return a[0] <= b[0] and a[1] >= b[1] and (a[0], a[1]) != (b[0], b[1])
+
+class ParetoFront(object):
+    """
+    A L{ParetoFront} holds the non-dominated (cost, value, design) points
+    added to it, sorted by increasing cost (and so increasing value).
+    Points are added in logarithmic time plus the number removed.
+    """
+    def __init__(self):
+        self._costs = []
+        self._points = []
+
+    def isDominated(self, cost, value):
+        """
+        Checks if a point is dominated by (or equal to) a point in this
+        front.
+        @param cost: the cost
+        @type cost: L{float}
+        @param value: the value
+        @type value: L{float}
+        @return: L{bool}
+        """
+        i = bisect.bisect_right(self._costs, cost)
+        return i > 0 and self._points[i-1][1] >= value
+
+    def add(self, cost, value, design=None):
+        """
+        Adds a point to this front if it is not dominated, removing the
+        points it dominates.
+        @param cost: the cost
+        @type cost: L{float}
+        @param value: the value
+        @type value: L{float}
+        @param design: the design
+        @type design: L{object}
+        @return: L{bool}
+        """
+        if self.isDominated(cost, value):
+            return False
+        i = bisect.bisect_left(self._costs, cost)
+        j = i
+        while j < len(self._points) and self._points[j][1] <= value:
+            j += 1
+        self._costs[i:j] = [cost]
+        self._points[i:j] = [(cost, value, design)]
+        return True
+
+    def getPoints(self):
+        """
+        Gets the (cost, value, design) points of this front.
+        @return: L{list}
+        """
+        return list(self._points)
+
+    def __len__(self):
+        return len(self._points)
+
+    def __iter__(self):
+        return iter(self._points)
@@ -19,10 +19,67 @@ limitations under the License.
 The L{ofspy.player} package contains classes related to the players.
 """
 
+import heapq
 import logging
 
 from ..simulation import Entity
 from .operations import Operations
+from .capability import PROTOCOLS
+
+class View(object):
+    """
+    A L{View} is a cached, read-only sequence with set-backed membership.
+    """
+    def __init__(self, items=None):
+        """
+        @param items: the items in this view
+        @type items: L{list}
+        """
+        self._items = tuple(items) if items is not None else ()
+        self._members = frozenset(self._items)
+        self._indices = None
+
+    def index(self, item):
+        """
+        Gets the index of an item in this view.
+        @param item: the item
+        @type item: L{object}
+        @return: L{int}
+        """
+        if self._indices is None:
+            self._indices = {}
+            for i, member in enumerate(self._items):
+                self._indices.setdefault(member, i)
+        if item not in self._indices:
+            raise ValueError('{0} is not in view'.format(item))
+        return self._indices[item]
+
+    def count(self, item):
+        """
+        Counts the occurrences of an item in this view.
+        @param item: the item
+        @type item: L{object}
+        @return: L{int}
+        """
+        return self._items.count(item) if item in self._members else 0
+
+    def __contains__(self, item):
+        return item in self._members
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __str__(self):
+        """
+        Gets the string representation of this view.
+        """
+        return str(list(self._items))
 
 class Controller(Entity):
     """
@@ -43,27 +100,48 @@ class Controller(Entity):
         self.operations = operations
         self.priceSGL = priceSGL
         self.priceISL = priceISL
-    
+        self._views = {}
+        self._viewVersion = 0
+        self._schedule = None
+
+    def invalidateViews(self):
+        """
+        Invalidates the cached element, federate, and contract views and
+        any update schedule compiled from them.
+        """
+        self._views.clear()
+        self._viewVersion += 1
+        if self._schedule is not None:
+            self._schedule.invalidate()
+
+    def register(self, schedule):
+        """
+        Registers the per-turn updates of this controller in a schedule.
+        @param schedule: the schedule
+        @type schedule: L{Schedule}
+        """
+        self._schedule = schedule
+
     def getElements(self):
         """
         Gets the elements controlled by this controller.
-        @return L{list}
+        @return L{View}
         """
-        return []
+        return View()
 
     def getFederates(self):
         """
         Gets the federates controlled by this controller.
-        @return L{list}
+        @return L{View}
         """
-        return []
+        return View()
 
     def getContracts(self):
         """
         Gets the contracts controlled by this controller.
-        @return L{list}
+        @return L{View}
         """
-        return []
+        return View()
 
     def liquidate(self, context):
         """
@@ -84,7 +162,7 @@ class Controller(Entity):
         @return: L{bool}
         """
         return (demand in context.currentEvents
-                and any(element.canSense(demand)
+                and any(context.eligibility.canSense(element, demand)
                         for element in self.getElements()))
 
     def canResolve(self, contract):
@@ -113,7 +191,7 @@ class Controller(Entity):
         # AND (this controller can contract the demand
         #      OR this controller has a contract for the demand)
         return (element in self.getElements()
-                and element.canSense(demand)
+                and context.eligibility.canSense(element, demand)
                 and (self.canContract(demand, context)
                     or any(contract.demand is demand
                        for contract in self.getContracts())))
@@ -169,15 +247,38 @@ class Controller(Entity):
         @type context: L{Context}
         @return: L{bool}
         """
-        return (txElement.couldTransmit(protocol, data, rxElement,
-                                        txLocation, rxLocation, context)
-                and rxElement.couldReceive(protocol, data, txElement,
-                                           txLocation, rxLocation, context)
-                and ('o' in protocol
-                     or next((federate for federate in self.getFederates()
-                              if txElement in federate.elements), None)
-                     is next((federate for federate in self.getFederates()
-                              if rxElement in federate.elements), None)))
+        return self.couldTransportSize(protocol, data.size, txElement,
+                                       rxElement, txLocation, rxLocation,
+                                       context)
+
+    def couldTransportSize(self, protocol, size, txElement,
+                           rxElement, txLocation, rxLocation, context):
+        """
+        Checks if this controller could transport data of a size between
+        elements.
+        @param protocol: the transmission protocol
+        @type protocol: L{str}
+        @param size: the data size
+        @type size: L{int}
+        @param txElement: the transmitting element
+        @type txElement: L{Element}
+        @param rxElement: the receiving element
+        @type rxElement: L{Element}
+        @param txLocation: the transmitting location
+        @type txLocation: L{Location}
+        @param rxLocation: the receiving location
+        @type rxLocation: L{Location}
+        @param context: the context
+        @type context: L{Context}
+        @return: L{bool}
+        """
+        return (txElement.couldTransmitSize(protocol, size, rxElement,
+                                            txLocation, rxLocation, context)
+                and rxElement.couldReceiveSize(protocol, size, txElement,
+                                               txLocation, rxLocation, context)
+                and (PROTOCOLS.isOpen(protocol)
+                     or self.getElementOwner(txElement)
+                     is self.getElementOwner(rxElement)))
 
     def canTransport(self, protocol, data, txElement, rxElement, context):
         """
@@ -269,8 +370,10 @@ class Controller(Entity):
             for federate in [federate for federate in self.getFederates()
                              if federate.canContract(demand, context)]:
                 context.currentEvents.remove(demand)
-                contract = Contract(demand)
+                contract = Contract(demand, clock=context)
                 federate.contracts.append(contract)
+                federate.scheduleDefault(contract)
+                federate.invalidateViews()
                 logging.info('{0} contracted for {1}'
                             .format(federate.name, demand.name))
                 self.trigger('contract', federate, demand)
@@ -299,6 +402,7 @@ class Controller(Entity):
                          else contract.demand.getDefaultValue())
                 federate.receiveCash(value)
                 federate.contracts.remove(contract)
+                federate.invalidateViews()
                 context.pastEvents.append(contract.demand)
                 self.deleteData(contract)
                 logging.info('{0} resolved {1} for {2} cash'
@@ -383,16 +487,54 @@ class Contract(Entity):
     """
     A L{Contract} assigns responsibility to serve a demand.
     """
-    def __init__(self, demand):
+    __slots__ = ('demand', 'clock', 'startTime', 'data', 'federate',
+                 '_initElapsedTime', '_elapsedTime', '_nextElapsedTime')
+
+    def __init__(self, demand, clock=None):
         """
         @param demand: the demand for this contract
         @type demand: L{Demand}
+        @param clock: the clock from which elapsed time is derived
+        @type clock: L{Context}
         """
         Entity.__init__(self, name='C-{0}'.format(demand.name))
         self.demand = demand
-        self.elapsedTime = 0
+        self.clock = None
+        self.startTime = 0
+        self.data = None
+        self.federate = None
         self._initElapsedTime = 0
+        self._elapsedTime = 0
         self._nextElapsedTime = 0
+        if clock is not None:
+            self.bind(clock)
+
+    @property
+    def elapsedTime(self):
+        """
+        The time elapsed since this contract started.
+        """
+        if self.clock is None:
+            return self._elapsedTime
+        return self.clock.time - self.startTime
+
+    def bind(self, clock):
+        """
+        Binds this contract to a clock, preserving its elapsed time. Bound
+        contracts do not need to be ticked or tocked.
+        @param clock: the clock
+        @type clock: L{Context}
+        """
+        elapsedTime = self.elapsedTime
+        self.clock = clock
+        self.startTime = clock.time - elapsedTime
+
+    def getDeadline(self):
+        """
+        Gets the clock time after which this contract is defaulted.
+        @return: L{float}
+        """
+        return self.startTime + self.demand.getDefaultTime()
 
     def getValue(self):
         """
@@ -428,7 +570,10 @@ class Contract(Entity):
         @type sim: L{Simulation}
         """
         super(Contract, self).init(sim)
-        self.elapsedTime = self._initElapsedTime
+        self._elapsedTime = self._initElapsedTime
+        self._nextElapsedTime = self._initElapsedTime
+        if self.clock is not None:
+            self.startTime = self.clock.time - self._initElapsedTime
 
     def tick(self, sim):
         """
@@ -437,19 +582,23 @@ class Contract(Entity):
         @type sim: L{Simulation}
         """
         super(Contract, self).tick(sim)
-        self._nextElapsedTime += sim.timeStep
+        if self.clock is None:
+            self._nextElapsedTime += sim.timeStep
 
     def tock(self):
         """
         Tocks this contract in a simulation.
         """
         super(Contract, self).tock()
-        self.elapsedTime = self._nextElapsedTime
+        if self.clock is None:
+            self._elapsedTime = self._nextElapsedTime
 
 class Data(object):
     """
     L{Data} models data collected in support of a contract.
     """
+    __slots__ = ('phenomenon', 'size', 'contract', 'container')
+
     def __init__(self, phenomenon, size, contract=None):
         """
         @param phenomenon: the phenomenon of this data
@@ -462,6 +611,22 @@ class Data(object):
         self.phenomenon = phenomenon
         self.size = size
         self.contract = contract
+        self.container = None
+        if isinstance(contract, Contract):
+            contract.data = self
+
+    def release(self, container):
+        """
+        Releases this data from a container. Data no longer held by any
+        container are reported to the federate owning their contract.
+        @param container: the container releasing this data
+        @type container: L{Module}
+        """
+        if self.container is container:
+            self.container = None
+            if (isinstance(self.contract, Contract)
+                    and self.contract.federate is not None):
+                self.contract.federate.reportDataLoss(self.contract)
 
     def __str__(self):
         """
@@ -494,28 +659,46 @@ class Federation(Controller):
             self._initFederates = federates
         self.federates = self._initFederates[:]
 
+    def _getView(self, key, generator):
+        """
+        Gets a cached view, rebuilding it if any member federate changed.
+        @param key: the view key
+        @type key: L{str}
+        @param generator: the function generating view items
+        @type generator: L{function}
+        @return: L{View}
+        """
+        signature = tuple(federate._viewVersion for federate in self.federates)
+        if key not in self._views or self._views[key][0] != signature:
+            self._views[key] = (signature, View(generator()))
+        return self._views[key][1]
+
     def getElements(self):
         """
         Gets the elements controlled by this federation.
-        @return L{list}
+        @return L{View}
         """
-        return [element for federate in self.federates
-                for element in federate.elements]
+        return self._getView('elements', lambda: [
+            element for federate in self.federates
+            for element in federate.getElements()])
 
     def getFederates(self):
         """
         Gets the federates controlled by this federation.
-        @return L{list}
+        @return L{View}
         """
-        return self.federates[:]
+        if 'federates' not in self._views:
+            self._views['federates'] = View(self.federates)
+        return self._views['federates']
 
     def getContracts(self):
         """
         Gets the contracts controlled by this federation.
-        @return L{list}
+        @return L{View}
         """
-        return [contract for federate in self.federates
-                for contract in federate.contracts]
+        return self._getView('contracts', lambda: [
+            contract for federate in self.federates
+            for contract in federate.getContracts()])
 
     def join(self, federate):
         """
@@ -529,6 +712,7 @@ class Federation(Controller):
                          .format(federate.name, self.name))
         else:
             self.federates.append(federate)
+            self.invalidateViews()
             logging.info('{0} joined {1}'
                          .format(federate.name, self.name))
             self.trigger('join', self, federate)
@@ -547,6 +731,7 @@ class Federation(Controller):
                          .format(federate.name, self.name))
         else:
             self.federates.remove(federate)
+            self.invalidateViews()
             logging.info('{0} quit {1}'
                          .format(federate.name, self.name))
             self.trigger('quit', self, federate)
@@ -560,6 +745,7 @@ class Federation(Controller):
         """
         super(Federation, self).init(sim)
         self.federates = self._initFederates[:]
+        self.invalidateViews()
         for federate in self.federates:
             federate.init(sim)
 
@@ -572,6 +758,16 @@ class Federation(Controller):
         for federate in self.federates:
             federate.tick(sim)
 
+    def register(self, schedule):
+        """
+        Registers the per-turn updates of this federation in a schedule.
+        @param schedule: the schedule
+        @type schedule: L{Schedule}
+        """
+        super(Federation, self).register(schedule)
+        for federate in self.federates:
+            federate.register(schedule)
+
     def tock(self):
         """
         Tocks this federation in a simulation.
@@ -617,6 +813,11 @@ class Federate(Controller):
             self._initContracts = contracts[:]
         self.contracts = self._initContracts
         self.cashFlow = [self.initialCash]
+        self._deadlines = []
+        self._numScheduled = 0
+        self._sequence = {}
+        self._overdue = set()
+        self._dataLoss = set()
 
     def getCash(self):
         """
@@ -646,23 +847,29 @@ class Federate(Controller):
     def getElements(self):
         """
         Gets the elements controlled by this controller.
-        @return L{list}
+        @return L{View}
         """
-        return self.elements[:]
+        if 'elements' not in self._views:
+            self._views['elements'] = View(self.elements)
+        return self._views['elements']
 
     def getFederates(self):
         """
         Gets the federates controlled by this controller.
-        @return L{list}
+        @return L{View}
         """
-        return [self]
+        if 'federates' not in self._views:
+            self._views['federates'] = View([self])
+        return self._views['federates']
 
     def getContracts(self):
         """
         Gets the contracts controlled by this controller.
-        @return L{list}
+        @return L{View}
         """
-        return self.contracts[:]
+        if 'contracts' not in self._views:
+            self._views['contracts'] = View(self.contracts)
+        return self._views['contracts']
 
     def design(self, element):
         """
@@ -679,6 +886,7 @@ class Federate(Controller):
                          .format(element.name))
         else:
             self.elements.append(element)
+            self.invalidateViews()
             cost = element.getDesignCost()
             self.sendCash(cost)
             logging.info('{0} designed {1} for {2}'
@@ -729,6 +937,11 @@ class Federate(Controller):
                 self.name, element.name))
         else:
             self.elements.remove(element)
+            self.invalidateViews()
+            # data in a decommissioned element is lost
+            for module in element.modules:
+                for data in module.data:
+                    data.release(module)
             # self.receiveCash(element.getDecommissionValue())
             logging.info('{0} decommissioned {1} for {2}.'.format(
                 self.name, element.name, element.getDecommissionValue()))
@@ -748,8 +961,64 @@ class Federate(Controller):
         for element in self.elements:
             element.init(sim)
         self.contracts = self._initContracts[:]
+        self.invalidateViews()
+        self._deadlines = []
+        self._sequence = {}
+        self._overdue = set()
+        self._dataLoss = set()
         for contract in self.contracts:
             contract.init(sim)
+            if contract.clock is not None:
+                self.scheduleDefault(contract)
+
+    def scheduleDefault(self, contract):
+        """
+        Schedules a contract deadline for automatic default. Contracts
+        have no data when scheduled, so they are checked for lost data at
+        the next auto-default.
+        @param contract: the contract
+        @type contract: L{Contract}
+        """
+        contract.federate = self
+        self._sequence[contract] = self._numScheduled
+        heapq.heappush(self._deadlines, (contract.getDeadline(),
+                                         self._numScheduled, contract))
+        self._numScheduled += 1
+        self._dataLoss.add(contract)
+
+    def reportDataLoss(self, contract):
+        """
+        Reports that the data for a contract may have been lost.
+        @param contract: the contract
+        @type contract: L{Contract}
+        """
+        self._dataLoss.add(contract)
+
+    def getDefaultedContracts(self, context):
+        """
+        Gets the contracts of this federate which have passed their deadline
+        or lost their data, in the order they were scheduled. Only overdue
+        contracts and contracts with reported data loss are checked.
+        @param context: the context
+        @type context: L{Context}
+        @return: L{list}
+        """
+        contracts = self.getContracts()
+        while (len(self._deadlines) > 0
+               and self._deadlines[0][0] < context.time):
+            contract = heapq.heappop(self._deadlines)[2]
+            if contract in contracts:
+                self._overdue.add(contract)
+            else:
+                self._sequence.pop(contract, None)
+        self._overdue = set(contract for contract in self._overdue
+                            if contract in contracts)
+        # reported data may since have been transferred in elsewhere
+        self._dataLoss = set(contract for contract in self._dataLoss
+                             if contract in contracts
+                             and context.getDataLocation(contract) is None)
+        return sorted(self._overdue | self._dataLoss,
+                      key=self._sequence.__getitem__)
 
     def tick(self, sim):
         """
@@ -760,15 +1029,38 @@ class Federate(Controller):
         for element in self.elements:
             element.tick(sim)
         for contract in self.contracts:
-            contract.tick(sim)
+            if contract.clock is None:
+                contract.tick(sim)
+
+    def register(self, schedule):
+        """
+        Registers the per-turn updates of this federate in a schedule.
+        Contracts bound to the context clock need no updates.
+        @param schedule: the schedule
+        @type schedule: L{Schedule}
+        """
+        super(Federate, self).register(schedule)
+        schedule.add('tock', self.openCashFlow)
+        for contract in self.contracts:
+            if contract.clock is None:
+                contract.register(schedule)
+        for element in self.elements:
+            element.register(schedule)
+
+    def openCashFlow(self):
+        """
+        Opens the cash flow of this federate for the next turn.
+        """
+        self.cashFlow.append(0)
 
     def tock(self):
         """
         Tocks this federate in a simulation.
         """
         super(Federate, self).tock()
-        self.cashFlow.append(0)
+        self.openCashFlow()
         for element in self.elements:
             element.tock()
         for contract in self.contracts:
-            contract.tock()
+            if contract.clock is None:
+                contract.tock()
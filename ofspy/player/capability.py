@@ -0,0 +1,115 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+Copyright 2017 Paul T. Grogan, Stevens Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+"""
+The L{ofspy.player.capability} package interns the protocols and
+phenomena of modules so element capabilities can be held as bitmasks.
+"""
+
+class Registry(object):
+    """
+    A L{Registry} interns names as single-bit integer codes in order of
+    registration. The name C{None} has the empty code 0.
+    """
+    def __init__(self, isOpen=None):
+        """
+        @param isOpen: the default test if a name is open to federation
+            partners (defaults to closed)
+        @type isOpen: L{function}
+        """
+        self._isOpen = isOpen
+        self._names = []
+        self._bits = {None: 0}
+        self._openMask = 0
+
+    def register(self, name, isOpen=None):
+        """
+        Registers a name, if not already registered.
+        @param name: the name
+        @type name: L{str}
+        @param isOpen: true, if the name is open to federation partners
+            (defaults to the test of this registry)
+        @type isOpen: L{bool}
+        @return: L{int}
+        """
+        if name is None:
+            return 0
+        bit = self._bits.get(name)
+        if bit is None:
+            bit = 1 << len(self._names)
+            self._bits[name] = bit
+            self._names.append(name)
+            if isOpen is None and self._isOpen is not None:
+                isOpen = self._isOpen(name)
+        if isOpen is not None:
+            self._openMask = (self._openMask | bit if isOpen
+                              else self._openMask & ~bit)
+        return bit
+
+    def getBit(self, name):
+        """
+        Gets the code of a name, registering it if needed.
+        @param name: the name
+        @type name: L{str}
+        @return: L{int}
+        """
+        bit = self._bits.get(name)
+        if bit is None:
+            bit = self.register(name)
+        return bit
+
+    def getMask(self, names):
+        """
+        Gets the mask of a set of names.
+        @param names: the names
+        @type names: L{list}
+        @return: L{int}
+        """
+        mask = 0
+        for name in names:
+            mask |= self.getBit(name)
+        return mask
+
+    def getNames(self, mask=None):
+        """
+        Gets the registered names, in order of registration, within a mask.
+        @param mask: the mask (defaults to all names)
+        @type mask: L{int}
+        @return: L{list}
+        """
+        return [name for name in self._names
+                if mask is None or self._bits[name] & mask]
+
+    def getOpenMask(self):
+        """
+        Gets the mask of names open to federation partners.
+        @return: L{int}
+        """
+        return self._openMask
+
+    def isOpen(self, name):
+        """
+        Checks if a name is open to federation partners.
+        @param name: the name
+        @type name: L{str}
+        @return: L{bool}
+        """
+        return (self.getBit(name) & self._openMask) != 0
+
+# open protocols follow the naming convention of an 'o' prefix
+PROTOCOLS = Registry(isOpen=lambda name: 'o' in name)
+PHENOMENA = Registry()
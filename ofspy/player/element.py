@@ -23,6 +23,8 @@ player-controlled elements.
 import logging
 
 from ..simulation import Entity
+from ..context.location import COMMISSION_FACTORS
+from .capability import PROTOCOLS, PHENOMENA
 
 class Element(Entity):
     def __init__(self, name=None, cost=0, capacity=0, modules=None):
@@ -49,6 +51,178 @@ class Element(Entity):
         else:
             self._initModules = modules[:]
         self.modules = self._initModules
+        self._capabilityVersion = 0
+        self._stateVersion = 0
+        self._schedule = None
+        self.updateCapabilities()
+
+    def updateCapabilities(self):
+        """
+        Updates the capability vectors and running totals of this element
+        from its modules. Called on design and when a module is removed.
+        """
+        self._maxSensed = {None: 0}
+        self._sensed = {None: 0}
+        self._maxStored = {None: 0}
+        self._maxStorage = 0
+        self._maxTransmitted = {}
+        self._transmitted = {}
+        self._maxReceived = {}
+        self._received = {}
+        self._stores = [m for m in self.modules if m.isStorage()]
+        self._storages = [m for m in self._stores if not m.isSensor()]
+        self._sensors = [m for m in self._stores if m.isSensor()]
+        self._containers = {}
+        self._links = {}
+        self._sglMask = 0
+        self._islMask = 0
+        self._phenomenonMask = 0
+        self._couldTransmitMemo = {}
+        self._couldReceiveMemo = {}
+        self._couldStoreMemo = {}
+        self._couldSenseMemo = {}
+        self._capabilityVersion += 1
+        self._stateVersion += 1
+        if self._schedule is not None:
+            self._schedule.invalidate()
+        for m in self.modules:
+            m.element = self
+            for d in m.data:
+                self._containers[d] = m
+            if m.isSensor():
+                self._phenomenonMask |= m.phenomenonBit
+                self._maxSensed[None] += m.maxSensed
+                self._sensed[None] += m.sensed
+                self._maxStored[None] += m.capacity
+                if m.phenomenon is not None:
+                    self._maxSensed[m.phenomenon] = (
+                        self._maxSensed.get(m.phenomenon, 0) + m.maxSensed)
+                    self._sensed[m.phenomenon] = (
+                        self._sensed.get(m.phenomenon, 0) + m.sensed)
+                    self._maxStored[m.phenomenon] = (
+                        self._maxStored.get(m.phenomenon, 0) + m.capacity)
+            elif m.isStorage():
+                self._maxStorage += m.capacity
+            if m.isLink():
+                if m.isSGL():
+                    self._sglMask |= m.protocolBit
+                if m.isISL():
+                    self._islMask |= m.protocolBit
+                self._links.setdefault(m.protocol, []).append(m)
+                self._maxTransmitted[m.protocol] = (
+                    self._maxTransmitted.get(m.protocol, 0) + m.maxTransmitted)
+                self._transmitted[m.protocol] = (
+                    self._transmitted.get(m.protocol, 0) + m.transmitted)
+                self._maxReceived[m.protocol] = (
+                    self._maxReceived.get(m.protocol, 0) + m.maxReceived)
+                self._received[m.protocol] = (
+                    self._received.get(m.protocol, 0) + m.received)
+
+    def getLinks(self, protocol):
+        """
+        Gets the link modules in this element using a protocol.
+        @param protocol: the transmission protocol
+        @type protocol: L{str}
+        @return: L{list}
+        """
+        return self._links.get(protocol, [])
+
+    def getProtocolMask(self):
+        """
+        Gets the mask of protocols of the link modules in this element.
+        @return: L{int}
+        """
+        return self._sglMask | self._islMask
+
+    def getSGLMask(self):
+        """
+        Gets the mask of protocols of the space-to-ground link modules in
+        this element.
+        @return: L{int}
+        """
+        return self._sglMask
+
+    def getISLMask(self):
+        """
+        Gets the mask of protocols of the inter-satellite link modules in
+        this element.
+        @return: L{int}
+        """
+        return self._islMask
+
+    def getPhenomenonMask(self):
+        """
+        Gets the mask of phenomena of the sensor modules in this element.
+        @return: L{int}
+        """
+        return self._phenomenonMask
+
+    def getSharedProtocolMask(self, element):
+        """
+        Gets the mask of protocols shared by this and another element.
+        @param element: the other element
+        @type element: L{Element}
+        @return: L{int}
+        """
+        return (self._sglMask | self._islMask) \
+                & (element._sglMask | element._islMask)
+
+    def getStateVersion(self):
+        """
+        Gets the version of the state of this element, which changes
+        whenever its location, contents, or sensing may have changed.
+        @return: L{int}
+        """
+        return self._stateVersion
+
+    def getContainer(self, data):
+        """
+        Gets the module in this element containing data.
+        @param data: the data
+        @type data: L{Data}
+        @return: L{Module}
+        """
+        return self._containers.get(data)
+
+    def setContainer(self, data, module):
+        """
+        Records the module in this element containing data.
+        @param data: the data
+        @type data: L{Data}
+        @param module: the module containing the data
+        @type module: L{Module}
+        """
+        self._containers[data] = module
+        self._stateVersion += 1
+
+    def clearContainer(self, data, module):
+        """
+        Clears the record of a module in this element containing data.
+        @param data: the data
+        @type data: L{Data}
+        @param module: the module no longer containing the data
+        @type module: L{Module}
+        """
+        if self._containers.get(data) is module:
+            del self._containers[data]
+        self._stateVersion += 1
+
+    def removeModule(self, module):
+        """
+        Removes a module from this element.
+        @param module: the module to remove
+        @type module: L{Module}
+        @return: L{bool}
+        """
+        if module in self.modules:
+            self.modules.remove(module)
+            module.element = None
+            # data in a removed module is lost
+            for data in module.data:
+                data.release(module)
+            self.updateCapabilities()
+            return True
+        return False
 
     def getContentsSize(self):
         """
@@ -86,6 +260,9 @@ class Element(Entity):
         """
         if self.canCommission(location, context):
             self.location = location
+            self._stateVersion += 1
+            if self._schedule is not None:
+                self._schedule.invalidate()
             return True
         return False
 
@@ -145,13 +322,38 @@ class Element(Entity):
         @type context: L{Context}
         @return: L{bool}
         """
-        return any(t.isLink()
-                   and t.protocol == protocol
-                   and any(r.isLink()
-                           and r.protocol == protocol
-                           and t.couldTransmit(data, r, txLocation, rxLocation, context)
-                           for r in rxElement.modules)
-                   for t in self.modules)
+        return self.couldTransmitSize(protocol, data.size, rxElement,
+                                      txLocation, rxLocation, context)
+
+    def couldTransmitSize(self, protocol, size, rxElement, txLocation, rxLocation, context):
+        """
+        Checks if this element could transmit data of a size (state-independent).
+        @param protocol: the transmission protocol
+        @type protocol: L{str}
+        @param size: the data size
+        @type size: L{int}
+        @param rxElement: the receiving element
+        @type rxElement: L{Element}
+        @param txLocation: the transmitting location
+        @type txLocation: L{Location}
+        @param rxLocation: the receiving location
+        @type rxLocation: L{Location}
+        @param context: the context
+        @type context: L{Context}
+        @return: L{bool}
+        """
+        if protocol is not None and not (PROTOCOLS.getBit(protocol)
+                                         & self.getSharedProtocolMask(rxElement)):
+            return False
+        key = (rxElement, rxElement._capabilityVersion, protocol,
+               size, txLocation, rxLocation, context)
+        if key not in self._couldTransmitMemo:
+            rxLinks = rxElement.getLinks(protocol)
+            self._couldTransmitMemo[key] = any(
+                any(t.couldTransmitSize(size, r, txLocation, rxLocation, context)
+                    for r in rxLinks)
+                for t in self.getLinks(protocol))
+        return self._couldTransmitMemo[key]
 
     def canTransmit(self, protocol, data, rxElement, context):
         """
@@ -171,16 +373,13 @@ class Element(Entity):
         if  self.isCommissioned() \
                 and rxElement.isCommissioned() \
                 and self.couldTransmit(protocol, data, rxElement, txLocation, rxLocation, context):
-            container = next((m for m in self.modules if data in m.data), None)
+            container = self.getContainer(data)
+            rxLinks = rxElement.getLinks(protocol)
             return container is not None \
-                    and any(t.isLink()
-                            and t.protocol == protocol
-                            and self.canTransfer(data, container, t)
-                            and any(r.isLink()
-                                    and r.protocol == protocol
-                                    and t.canTransmit(data, r, txLocation, rxLocation, context)
-                                    for r in rxElement.modules)
-                            for t in self.modules)
+                    and any(self.canTransfer(data, container, t)
+                            and any(t.canTransmit(data, r, txLocation, rxLocation, context)
+                                    for r in rxLinks)
+                            for t in self.getLinks(protocol))
         return False
 
     def transmit(self, protocol, data, rxElement, context):
@@ -199,18 +398,15 @@ class Element(Entity):
         txLocation = self.location
         rxLocation = rxElement.location
         if self.canTransmit(protocol, data, rxElement, context):
-            container = next((m for m in self.modules if data in m.data), None)
+            container = self.getContainer(data)
+            rxLinks = rxElement.getLinks(protocol)
             if container is not None \
-                    and any(t.isLink()
-                            and t.protocol == protocol
-                            and self.canTransfer(data, container, t)
-                            and any(r.isLink()
-                                    and r.protocol == protocol
-                                    and t.canTransmit(data, r, txLocation, rxLocation, context)
+                    and any(self.canTransfer(data, container, t)
+                            and any(t.canTransmit(data, r, txLocation, rxLocation, context)
                                     and self.transfer(data, container, t)
                                     and t.transmit(data, r, txLocation, rxLocation, context)
-                                    for r in rxElement.modules)
-                            for t in self.modules):
+                                    for r in rxLinks)
+                            for t in self.getLinks(protocol)):
                 logging.debug(
                     '{0} transmitted {1} to {2} via {3}'
                     .format(self.name, str(data), rxElement.name, protocol))
@@ -237,13 +433,38 @@ class Element(Entity):
         @type context: L{Context}
         @return: L{bool}
         """
-        return any(r.isLink()
-                   and r.protocol == protocol
-                   and any(t.isLink()
-                           and t.protocol == protocol
-                           and r.couldReceive(data, r, txLocation, rxLocation, context)
-                           for t in txElement.modules)
-                   for r in self.modules)
+        return self.couldReceiveSize(protocol, data.size, txElement,
+                                     txLocation, rxLocation, context)
+
+    def couldReceiveSize(self, protocol, size, txElement, txLocation, rxLocation, context):
+        """
+        Checks if this element could receive data of a size (state-independent).
+        @param protocol: the transmission protocol
+        @type protocol: L{str}
+        @param size: the data size
+        @type size: L{int}
+        @param txElement: the transmitting element
+        @type txElement: L{Element}
+        @param txLocation: the transmitting location
+        @type txLocation: L{Location}
+        @param rxLocation: the receiving location
+        @type rxLocation: L{Location}
+        @param context: the context
+        @type context: L{Context}
+        @return: L{bool}
+        """
+        if protocol is not None and not (PROTOCOLS.getBit(protocol)
+                                         & self.getSharedProtocolMask(txElement)):
+            return False
+        key = (txElement, txElement._capabilityVersion, protocol,
+               size, txLocation, rxLocation, context)
+        if key not in self._couldReceiveMemo:
+            txLinks = txElement.getLinks(protocol)
+            self._couldReceiveMemo[key] = any(
+                any(r.couldReceiveSize(size, t, txLocation, rxLocation, context)
+                    for t in txLinks)
+                for r in self.getLinks(protocol))
+        return self._couldReceiveMemo[key]
 
     def canReceive(self, protocol, data, txElement, context):
         """
@@ -263,13 +484,10 @@ class Element(Entity):
         if self.isCommissioned() \
                 and txElement.isCommissioned() \
                 and self.couldReceive(protocol, data, txElement, txLocation, rxLocation, context):
-            return any(r.isLink()
-                       and r.protocol == protocol
-                       and any(t.isLink()
-                               and t.protocol == protocol
-                               and r.canReceive(data, t, txLocation, rxLocation, context)
-                               for t in txElement.modules)
-                       for r in self.modules)
+            txLinks = txElement.getLinks(protocol)
+            return any(any(r.canReceive(data, t, txLocation, rxLocation, context)
+                           for t in txLinks)
+                       for r in self.getLinks(protocol))
         return False
 
     def receive(self, protocol, data, txElement, context):
@@ -288,13 +506,10 @@ class Element(Entity):
         rxLocation = self.location
         txLocation = txElement.location
         if self.canReceive(protocol, data, txElement, context):
-            if any(r.isLink()
-                    and r.protocol == protocol
-                    and any(t.isLink()
-                            and t.protocol == protocol
-                            and r.receive(data, t, txLocation, rxLocation, context)
-                            for t in txElement.modules)
-                    for r in self.modules):
+            txLinks = txElement.getLinks(protocol)
+            if any(any(r.receive(data, t, txLocation, rxLocation, context)
+                       for t in txLinks)
+                   for r in self.getLinks(protocol)):
                 logging.debug(
                     '{0} received {1} from {2} via {3}'
                     .format(self.name, str(data), txElement.name, protocol))
@@ -381,7 +596,37 @@ class Element(Entity):
         @type data: L{Data}
         @return: L{bool}
         """
-        return any(m.isStorage() and m.couldStore(data) for m in self.modules)
+        return self.couldStorePhenomenon(data.phenomenon, data.size)
+
+    def couldStorePhenomenon(self, phenomenon, size):
+        """
+        Checks if this element could store data of a phenomenon and size
+        (state-independent).
+        @param phenomenon: the data phenomenon
+        @type phenomenon: L{str}
+        @param size: the data size
+        @type size: L{int}
+        @return: L{bool}
+        """
+        key = (phenomenon, size)
+        if key not in self._couldStoreMemo:
+            self._couldStoreMemo[key] = any(m.couldAccept(phenomenon, size)
+                                            for m in self._stores)
+        return self._couldStoreMemo[key]
+
+    def canStorePhenomenon(self, phenomenon, size):
+        """
+        Checks if this element can store new data of a phenomenon and size
+        (state-dependent).
+        @param phenomenon: the data phenomenon
+        @type phenomenon: L{str}
+        @param size: the data size
+        @type size: L{int}
+        @return: L{bool}
+        """
+        return self.isCommissioned() \
+                and self.couldStorePhenomenon(phenomenon, size) \
+                and any(m.canAccept(phenomenon, size) for m in self._stores)
 
     def canStore(self, data):
         """
@@ -392,17 +637,30 @@ class Element(Entity):
         """
         if self.isCommissioned() \
                 and self.couldStore(data):
-            container = next((m for m in self.modules
-                              if data in m.data), None)
+            container = self.getContainer(data)
             return ((container is not None
                      and container.isStorage())
                 or ((container is None
                      or container.canTransferOut(data))
-                    and any(m.isStorage()
-                            and m.canStore(data)
-                            for m in self.modules)))
+                    and any(m.canStore(data) for m in self._stores)))
         return False
 
+    def _placeData(self, data, modules, container=None):
+        """
+        Places data in the first module that can store it.
+        @param data: the data to place
+        @type data: L{Data}
+        @param modules: the candidate modules in order of preference
+        @type modules: L{list}
+        @param container: the module currently containing the data
+        @type container: L{Module}
+        @return: L{bool}
+        """
+        module = next((m for m in modules if m.canStore(data)), None)
+        return (module is not None
+                and (container is None or container.transferOut(data))
+                and module.store(data))
+
     def store(self, data):
         """
         Stores data in this element.
@@ -410,25 +668,16 @@ class Element(Entity):
         @type data: L{Data}
         @return: L{bool}
         """
+        container = self.getContainer(data)
         if self.canStore(data):
-            container = next((m for m in self.modules
-                              if data in m.data), None)
             if container is None:
-                if any(m.isStorage()
-                        and not m.isSensor()
-                        and m.canStore(data)
-                        and m.store(data)
-                        for m in self.modules):
+                if self._placeData(data, self._storages):
                     logging.debug(
                         '{0} stored new {1} in a storage module'
                         .format(self.name, str(data)))
                     self.trigger('store', self, data)
                     return True
-                elif any(m.isStorage()
-                        and m.isSensor()
-                        and m.canStore(data)
-                        and m.store(data)
-                        for m in self.modules):
+                elif self._placeData(data, self._sensors):
                     logging.debug(
                         '{0} stored new {1} in a sensor module'
                         .format(self.name, str(data)))
@@ -441,12 +690,7 @@ class Element(Entity):
                         '{0} already stored {1} in a sensor module'
                         .format(self.name, str(data)))
                     return True
-                elif (any(m.isStorage()
-                          and m.isSensor()
-                          and m.canStore(data)
-                          and container.transferOut(data)
-                          and m.store(data)
-                          for m in self.modules)):
+                elif self._placeData(data, self._sensors, container):
                     logging.debug(
                         '{0} stored {1} in a sensor module'
                         .format(self.name, str(data)))
@@ -458,12 +702,7 @@ class Element(Entity):
                         '{0} already stored {1} in a storage module'
                         .format(self.name, str(data)))
                     return True
-                elif (any(m.isStorage()
-                          and not m.isSensor()
-                          and m.canStore(data)
-                          and container.transferOut(data)
-                          and m.store(data)
-                          for m in self.modules)):
+                elif self._placeData(data, self._storages, container):
                     logging.debug(
                         '{0} stored {1} in a storage module'
                         .format(self.name, str(data)))
@@ -471,23 +710,17 @@ class Element(Entity):
                     return True
         else:
             # cannot directly store data: try to exchange
-            container = next((m for m in self.modules
-                              if data in m.data), None)
             if (container is not None
-                and any(module.isStorage()
-                        and module.isSensor()
-                        and self.canTransfer(data, container, module)
+                and any(self.canTransfer(data, container, module)
                         and self.transfer(data, container, module)
-                        for module in self.modules)):
+                        for module in self._sensors)):
                 logging.info('{0} stored {1} in a sensor module via exchange'
                              .format(self.name, str(data)))
                 return True
             elif (container is not None
-                and any(module.isStorage()
-                        and not module.isSensor()
-                        and self.canTransfer(data, container, module)
+                and any(self.canTransfer(data, container, module)
                         and self.transfer(data, container, module)
-                        for module in self.modules)):
+                        for module in self._storages)):
                 logging.info('{0} stored {1} in a storage module via exchange'
                              .format(self.name, str(data)))
                 return True
@@ -502,10 +735,28 @@ class Element(Entity):
         @type data: L{Data}
         @return: L{bool}
         """
-        return self.couldStore(data) and \
-                any(m.isSensor()
-                    and m.couldSense(data)
-                    for m in self.modules)
+        return self.couldSensePhenomenon(data.phenomenon, data.size)
+
+    def couldSensePhenomenon(self, phenomenon, size):
+        """
+        Checks if this element could sense data of a phenomenon and size
+        (state-independent).
+        @param phenomenon: the data phenomenon
+        @type phenomenon: L{str}
+        @param size: the data size
+        @type size: L{int}
+        @return: L{bool}
+        """
+        if phenomenon is not None \
+                and not PHENOMENA.getBit(phenomenon) & self._phenomenonMask:
+            return False
+        key = (phenomenon, size)
+        if key not in self._couldSenseMemo:
+            self._couldSenseMemo[key] = (
+                self.couldStorePhenomenon(phenomenon, size)
+                and any(m.couldSensePhenomenon(phenomenon, size)
+                        for m in self._sensors))
+        return self._couldSenseMemo[key]
 
     def canSense(self, demand):
         """
@@ -514,13 +765,11 @@ class Element(Entity):
         @type demand: L{Demand}
         @return: L{bool}
         """
-        data = demand.generateData()
         if self.isCommissioned() \
-                and self.couldSense(data):
-            return (any(m.isSensor()
-                       and m.canSense(self.location, demand)
-                       for m in self.modules)
-                    and self.canStore(data))
+                and self.couldSensePhenomenon(demand.phenomenon, demand.size):
+            return (any(m.canSense(self.location, demand)
+                        for m in self._sensors)
+                    and self.canStorePhenomenon(demand.phenomenon, demand.size))
         return False
 
     def senseAndStore(self, contract):
@@ -530,20 +779,18 @@ class Element(Entity):
         @type contract: L{Contract}
         @return: L{bool}
         """
-        data = contract.demand.generateData()
-        if self.canSense(contract.demand):
-            if any(m.isSensor()
-                    and m.canSense(self.location, contract.demand)
-                    and (m.canStore(data)
+        demand = contract.demand
+        if self.canSense(demand):
+            if any(m.canSense(self.location, demand)
+                    and (m.canAccept(demand.phenomenon, demand.size)
                          or any(any(s is not m
-                                    and s.isStorage()
                                     and s.canStore(d)
                                     and self.canTransfer(d, m, s)
                                     and self.transfer(d, m, s)
-                                    for s in self.modules)
+                                    for s in self._stores)
                                 for d in m.data))
                     and m.senseAndStore(self.location, contract)
-                    for m in self.modules):
+                    for m in self._sensors):
                 self.trigger('sense', self, contract)
                 return True
         logging.warning('{0} could not sense and store {1}'
@@ -557,11 +804,7 @@ class Element(Entity):
         @type phenomenon: L{str}
         @return: L{int}
         """
-        return sum(m.maxSensed
-                   for m in self.modules
-                   if m.isSensor()
-                   and (m.phenomenon == phenomenon
-                        or phenomenon is None))
+        return self._maxSensed.get(phenomenon, 0)
 
     def getSensed(self, phenomenon=None):
         """
@@ -570,11 +813,20 @@ class Element(Entity):
         @type phenomenon: L{str}
         @return: L{int}
         """
-        return sum(m.sensed
-                   for m in self.modules
-                   if m.isSensor()
-                   and (m.phenomenon == phenomenon
-                        or phenomenon is None))
+        return self._sensed.get(phenomenon, 0)
+
+    def addSensed(self, phenomenon, size):
+        """
+        Adds to the running total of data sensed by this element.
+        @param phenomenon: the data phenomenon
+        @type phenomenon: L{str}
+        @param size: the size of data sensed
+        @type size: L{int}
+        """
+        self._sensed[None] += size
+        self._stateVersion += 1
+        if phenomenon is not None:
+            self._sensed[phenomenon] = self._sensed.get(phenomenon, 0) + size
 
     def getMaxStored(self, phenomenon=None):
         """
@@ -583,13 +835,7 @@ class Element(Entity):
         @type phenomenon: L{str}
         @return: L{int}
         """
-        return sum(m.capacity
-                   for m in self.modules
-                   if (m.isStorage()
-                       and not m.isSensor())
-                   or (m.isSensor()
-                       and (m.phenomenon == phenomenon
-                            or phenomenon is None)))
+        return self._maxStorage + self._maxStored.get(phenomenon, 0)
 
     def getStored(self, phenomenon=None):
         """
@@ -598,61 +844,66 @@ class Element(Entity):
         @type phenomenon: L{str}
         @return: L{int}
         """
-        return sum(m.getContentsSize()
-                   for m in self.modules
-                   if (m.isStorage()
-                       and not m.isSensor())
-                   or (m.isSensor()
-                       and (m.phenomenon == phenomenon
-                            or phenomenon is None)))
+        return (sum(m.getContentsSize() for m in self._storages)
+                + sum(m.getContentsSize() for m in self._sensors
+                      if m.phenomenon == phenomenon
+                      or phenomenon is None))
 
     def getTransmitted(self, protocol):
         """
-        Gets the maximum amount of data transmitted by this element.
+        Gets the amount of data currently transmitted by this element.
         @param protocol: the transmission protocol
         @type protocol: L{str}
         @return: L{int}
         """
-        return sum(m.transmitted
-                   for m in self.modules
-                   if m.isLink()
-                   and m.protocol == protocol)
+        return self._transmitted.get(protocol, 0)
+
+    def addTransmitted(self, protocol, size):
+        """
+        Adds to the running total of data transmitted by this element.
+        @param protocol: the transmission protocol
+        @type protocol: L{str}
+        @param size: the size of data transmitted
+        @type size: L{int}
+        """
+        self._transmitted[protocol] = self._transmitted.get(protocol, 0) + size
 
     def getMaxTransmitted(self, protocol):
         """
-        Gets the amount of data currently transmitted by this element.
+        Gets the maximum amount of data transmitted by this element.
         @param protocol: the transmission protocol
         @type protocol: L{str}
         @return: L{int}
         """
-        return sum(m.maxTransmitted
-                   for m in self.modules
-                   if m.isLink()
-                   and m.protocol == protocol)
+        return self._maxTransmitted.get(protocol, 0)
 
     def getReceived(self, protocol):
         """
-        Gets the maximum amount of data received by this element.
+        Gets the amount of data currently received by this element.
         @param protocol: the transmission protocol
         @type protocol: L{str}
         @return: L{int}
         """
-        return sum(m.received
-                   for m in self.modules
-                   if m.isLink()
-                   and m.protocol == protocol)
+        return self._received.get(protocol, 0)
+
+    def addReceived(self, protocol, size):
+        """
+        Adds to the running total of data received by this element.
+        @param protocol: the transmission protocol
+        @type protocol: L{str}
+        @param size: the size of data received
+        @type size: L{int}
+        """
+        self._received[protocol] = self._received.get(protocol, 0) + size
 
     def getMaxReceived(self, protocol):
         """
-        Gets the amount of data currently received by this element.
+        Gets the maximum amount of data received by this element.
         @param protocol: the transmission protocol
         @type protocol: L{str}
         @return: L{int}
         """
-        return sum(m.maxReceived
-                   for m in self.modules
-                   if m.isLink()
-                   and m.protocol == protocol)
+        return self._maxReceived.get(protocol, 0)
 
     def init(self, sim):
         """
@@ -665,6 +916,7 @@ class Element(Entity):
         self.modules = self._initModules[:]
         for module in self.modules:
             module.init(sim)
+        self.updateCapabilities()
 
     def tick(self, sim):
         """
@@ -673,20 +925,58 @@ class Element(Entity):
         @type sim: L{Simulator}
         """
         super(Element, self).tick(sim)
-        if sim.entity('context') is not None:
-            self._nextLocation = sim.entity('context').propagate(
+        context = sim.entity('context')
+        if context is not None:
+            self._nextLocation = context.propagate(
                 self.location, sim.timeStep)
         for module in self.modules:
             module.tick(sim)
 
+    def register(self, schedule):
+        """
+        Registers the per-turn updates of this element in a schedule.
+        Locations are propagated by the context, so only counter resets
+        and module updates are registered.
+        @param schedule: the schedule
+        @type schedule: L{Schedule}
+        """
+        self._schedule = schedule
+        if len(self._sensors) > 0 or len(self._links) > 0:
+            schedule.add('tock', self.resetCounters)
+        for module in self.modules:
+            module.register(schedule)
+
     def tock(self):
         """
         Tocks this element in a simulation.
         """
         super(Element, self).tock()
-        self.location = self._nextLocation
+        self.move(self._nextLocation)
         for module in self.modules:
             module.tock()
+        self.resetCounters()
+
+    def move(self, location):
+        """
+        Moves this element to a propagated location.
+        @param location: the location
+        @type location: L{Location}
+        """
+        self.location = location
+        self._stateVersion += 1
+
+    def resetCounters(self):
+        """
+        Resets the sensed, transmitted, and received counters of this
+        element for the next turn.
+        """
+        for phenomenon in self._sensed:
+            self._sensed[phenomenon] = 0
+        for protocol in self._transmitted:
+            self._transmitted[protocol] = 0
+        for protocol in self._received:
+            self._received[protocol] = 0
+        self._stateVersion += 1
 
 class GroundStation(Element):
     def __init__(self, name=None, cost=0, capacity=0, modules=None):
@@ -787,12 +1077,7 @@ class Satellite(Element):
         @return: L{float}
         """
         if self.canCommission(location, context):
-            if location.altitude == "LEO":
-                return 0
-            elif location.altitude == "MEO":
-                return 0.5*self.cost
-            elif location.altitude == "GEO":
-                return 1.0*self.cost
+            return COMMISSION_FACTORS[location.level]*self.cost
         return 0
 
     def getDecommissionValue(self):
@@ -800,13 +1085,7 @@ class Satellite(Element):
         Gets the decommission value of this satellite.
         @return: L{float}
         """
-        if not self.isCommissioned():
-            return 0.5*self.getDesignCost()
-        elif self.location.altitude == "LEO":
-            return 0.5*self.getDesignCost()
-        elif self.location.altitude == "MEO":
-            return 0.5*self.getDesignCost()
-        elif self.location.altitude == "GEO":
+        if not self.isCommissioned() or self.location.isOrbit():
             return 0.5*self.getDesignCost()
         return 0
 
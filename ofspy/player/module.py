@@ -21,11 +21,16 @@ player-controlled modules.
 """
 
 from ..simulation import Entity
+from ..context.location import SENSING
+from .capability import PROTOCOLS, PHENOMENA
 
 class Module(Entity):
     """
     A L{Module} represents a functional subsystem within an element.
     """
+    __slots__ = ('cost', 'size', 'capacity', 'element',
+                 '_initData', 'data', '_contentsSize')
+
     def __init__(self, name=None, cost=0, size=1, capacity=0):
         """
         @param cost: the cost of this module
@@ -39,15 +44,17 @@ class Module(Entity):
         self.cost = cost
         self.size = size
         self.capacity = capacity
+        self.element = None
         self._initData = []
         self.data = self._initData[:]
+        self._contentsSize = 0
 
     def getContentsSize(self):
         """
         Gets the total size of data in this module.
         @return: L{int}
         """
-        return sum(d.size for d in self.data)
+        return self._contentsSize
 
     def couldExchange(self, data, module):
         """
@@ -100,6 +107,31 @@ class Module(Entity):
                 return True
         return False
 
+    def couldAccept(self, phenomenon, size):
+        """
+        Checks if this module could accept data of a phenomenon and size
+        (state-independent).
+        @param phenomenon: the data phenomenon
+        @type phenomenon: L{str}
+        @param size: the data size
+        @type size: L{int}
+        @return: L{bool}
+        """
+        return self.capacity >= size
+
+    def canAccept(self, phenomenon, size):
+        """
+        Checks if this module can accept data of a phenomenon and size
+        (state-dependent).
+        @param phenomenon: the data phenomenon
+        @type phenomenon: L{str}
+        @param size: the data size
+        @type size: L{int}
+        @return: L{bool}
+        """
+        return self.couldAccept(phenomenon, size) \
+                and self.capacity >= size + self._contentsSize
+
     def couldTransferIn(self, data):
         """
         Checks if this module could transfer in data (state-independent).
@@ -107,7 +139,7 @@ class Module(Entity):
         @type data: L{Data}
         @return: L{bool}
         """
-        return self.capacity >= data.size
+        return self.couldAccept(data.phenomenon, data.size)
 
     def canTransferIn(self, data):
         """
@@ -116,9 +148,7 @@ class Module(Entity):
         @type data: L{Data}
         @return: L{bool}
         """
-        return self.couldTransferIn(data) \
-                and self.capacity >= data.size \
-                        + sum(d.size for d in self.data)
+        return self.canAccept(data.phenomenon, data.size)
 
     def transferIn(self, data):
         """
@@ -129,6 +159,10 @@ class Module(Entity):
         """
         if self.canTransferIn(data):
             self.data.append(data)
+            self._contentsSize += data.size
+            data.container = self
+            if self.element is not None:
+                self.element.setContainer(data, self)
             self.trigger('transferIn', self, data)
             return True
         return False
@@ -160,6 +194,10 @@ class Module(Entity):
         """
         if self.canTransferOut(data):
             self.data.remove(data)
+            self._contentsSize -= data.size
+            data.release(self)
+            if self.element is not None:
+                self.element.clearContainer(data, self)
             self.trigger('transferOut', self, data)
             return True
         return False
@@ -214,19 +252,39 @@ class Module(Entity):
         """
         super(Module, self).init(sim)
         self.data = self._initData[:]
+        self._contentsSize = sum(d.size for d in self.data)
+        for data in self.data:
+            data.container = self
+
+    def register(self, schedule):
+        """
+        Registers the per-turn updates of this module in a schedule. Only
+        non-storage modules able to hold data need to purge it each turn.
+        @param schedule: the schedule
+        @type schedule: L{Schedule}
+        """
+        if not self.isStorage() and self.capacity > 0:
+            schedule.add('tock', self.tock)
 
     def tock(self):
         """
         Tocks this module in a simulation.
         """
         super(Module, self).tock()
-        if not self.isStorage():
+        if not self.isStorage() and len(self.data) > 0:
+            for data in self.data:
+                if self.element is not None:
+                    self.element.clearContainer(data, self)
+                data.release(self)
             del self.data[:]
+            self._contentsSize = 0
 
 class Defense(Module):
     """
     A L{Defense} module provides resilience to disturbances.
     """
+    __slots__ = ()
+
     def __init__(self, name=None, cost=0, size=1):
         """
         @param name: the name of this defense module
@@ -251,6 +309,8 @@ class Storage(Module):
     """
     A L{Storage} module stores data.
     """
+    __slots__ = ()
+
     def __init__(self, name=None, cost=0, size=1, capacity=1):
         """
         @param name: the name of this storage module
@@ -307,6 +367,9 @@ class Sensor(Storage):
     """
     An L{Sensor} senses a phenomenon and stores resulting data.
     """
+    __slots__ = ('phenomenon', 'phenomenonBit', 'maxSensed',
+                 '_initSensed', 'sensed')
+
     def __init__(self, name=None, cost=0, size=1, capacity=1,
                  phenomenon=None, maxSensed=1):
         """
@@ -326,10 +389,24 @@ class Sensor(Storage):
         Storage.__init__(self, name=name, cost=cost,
                          size=size, capacity=capacity)
         self.phenomenon = phenomenon
+        self.phenomenonBit = PHENOMENA.getBit(phenomenon)
         self.maxSensed = maxSensed
         self._initSensed = 0
         self.sensed = self._initSensed
 
+    def couldSensePhenomenon(self, phenomenon, size):
+        """
+        Checks if this sensor could sense data of a phenomenon and size
+        (state-independent).
+        @param phenomenon: the data phenomenon
+        @type phenomenon: L{str}
+        @param size: the data size
+        @type size: L{int}
+        @return: L{bool}
+        """
+        return self.couldAccept(phenomenon, size) \
+                and self.maxSensed >= size
+
     def couldSense(self, data):
         """
         Checks if this sensor could sense data (state-independent).
@@ -337,8 +414,7 @@ class Sensor(Storage):
         @type data: L{Data}
         @return: L{bool}
         """
-        return self.couldStore(data) \
-                and self.maxSensed >= data.size
+        return self.couldSensePhenomenon(data.phenomenon, data.size)
 
     def canSense(self, location, demand):
         """
@@ -349,11 +425,9 @@ class Sensor(Storage):
         @type demand: L{Demand}
         @return: L{bool}
         """
-        data = demand.generateData()
-        return self.couldSense(data) \
-                and self.maxSensed >= self.sensed + data.size \
-                and location.isOrbit() \
-                and location.altitude != "GEO" \
+        return self.couldSensePhenomenon(demand.phenomenon, demand.size) \
+                and self.maxSensed >= self.sensed + demand.size \
+                and SENSING[location.level] \
                 and demand.sector == location.sector
 
     def senseAndStore(self, location, contract):
@@ -365,24 +439,30 @@ class Sensor(Storage):
         @type contract: L{Contract}
         @return: L{bool}
         """
-        data = contract.demand.generateData(contract)
-        if self.canSense(location, contract.demand) \
-                and self.canStore(data):
+        demand = contract.demand
+        if self.canSense(location, demand) \
+                and self.canAccept(demand.phenomenon, demand.size):
+            data = demand.generateData(contract)
             self.sensed += data.size
+            if self.element is not None:
+                self.element.addSensed(self.phenomenon, data.size)
             self.trigger('sense', self, contract)
             self.store(data)
             return True
         return False
 
-    def couldTransferIn(self, data):
+    def couldAccept(self, phenomenon, size):
         """
-        Checks if this sensor could transfer in data (state-independent).
-        @param data: the data to transfer in
-        @type data: L{Data}
+        Checks if this sensor could accept data of a phenomenon and size
+        (state-independent).
+        @param phenomenon: the data phenomenon
+        @type phenomenon: L{str}
+        @param size: the data size
+        @type size: L{int}
         @return: L{bool}
         """
-        return super(Sensor, self).couldTransferIn(data) \
-                and self.phenomenon == data.phenomenon
+        return super(Sensor, self).couldAccept(phenomenon, size) \
+                and self.phenomenon == phenomenon
 
     def isSensor(self):
         """
@@ -400,6 +480,14 @@ class Sensor(Storage):
         super(Sensor, self).init(sim)
         self.sensed = self._initSensed
 
+    def register(self, schedule):
+        """
+        Registers the per-turn updates of this sensor in a schedule.
+        @param schedule: the schedule
+        @type schedule: L{Schedule}
+        """
+        schedule.add('tock', self.tock)
+
     def tock(self):
         """
         Tocks this sensor in a simulation.
@@ -411,6 +499,10 @@ class Link(Module):
     """
     An L{Link} transports data between two elements.
     """
+    __slots__ = ('protocol', 'protocolBit', 'maxTransmitted', 'maxReceived',
+                 '_initTransmitted', 'transmitted',
+                 '_initReceived', 'received')
+
     def __init__(self, name=None, cost=0, size=1, capacity=1,
                  protocol=None, maxTransmitted=1, maxReceived=1):
         """
@@ -432,6 +524,7 @@ class Link(Module):
         Module.__init__(self, name=name, cost=cost,
                         size=size, capacity=capacity)
         self.protocol = protocol
+        self.protocolBit = PROTOCOLS.getBit(protocol)
         self.maxTransmitted = maxTransmitted
         self.maxReceived = maxReceived
         self._initTransmitted = 0
@@ -439,6 +532,23 @@ class Link(Module):
         self._initReceived = 0
         self.received = self._initReceived
 
+    def couldTransmitSize(self, size, receiver, txLocation=None, rxLocation=None, context=None):
+        """
+        Checks if this Link could transmit data of a size (state-independent).
+        @param size: the data size
+        @type size: L{int}
+        @param receiver: the receiver receiving the data
+        @type receiver: L{Link}
+        @type txLocation: L{Location}
+        @param rxLocation: the receiver location
+        @type rxLocation: L{Location}
+        @param context: the context
+        @type context: L{Context}
+        @return: L{bool}
+        """
+        return self.maxTransmitted >= size \
+                and self.protocolBit == receiver.protocolBit
+
     def couldTransmit(self, data, receiver, txLocation=None, rxLocation=None, context=None):
         """
         Checks if this Link could transmit data (state-independent).
@@ -453,8 +563,7 @@ class Link(Module):
         @type context: L{Context}
         @return: L{bool}
         """
-        return self.maxTransmitted >= data.size \
-                and self.protocol == receiver.protocol
+        return self.couldTransmitSize(data.size, receiver, txLocation, rxLocation, context)
 
     def canTransmit(self, data, receiver, txLocation=None, rxLocation=None, context=None):
         """
@@ -492,10 +601,29 @@ class Link(Module):
                 and self.canTransferOut(data) \
                 and self.transferOut(data):
             self.transmitted += data.size
+            if self.element is not None:
+                self.element.addTransmitted(self.protocol, data.size)
             self.trigger('transmit', self, data, receiver)
             return True
         return False
 
+    def couldReceiveSize(self, size, transmitter, txLocation=None, rxLocation=None, context=None):
+        """
+        Checks if this Link could receive data of a size (state-independent).
+        @param size: the data size
+        @type size: L{int}
+        @param transmitter: the transmitter transmitting the data
+        @type receiver: L{Link}
+        @type txLocation: L{Location}
+        @param rxLocation: the receiver location
+        @type rxLocation: L{Location}
+        @param context: the context
+        @type context: L{Context}
+        @return: L{bool}
+        """
+        return self.maxReceived >= size \
+                and self.protocolBit == transmitter.protocolBit
+
     def couldReceive(self, data, transmitter, txLocation=None, rxLocation=None, context=None):
         """
         Checks if this Link could receive data (state-independent).
@@ -510,8 +638,7 @@ class Link(Module):
         @type context: L{Context}
         @return: L{bool}
         """
-        return self.maxReceived >= data.size \
-                and self.protocol == transmitter.protocol
+        return self.couldReceiveSize(data.size, transmitter, txLocation, rxLocation, context)
 
     def canReceive(self, data, transmitter, txLocation=None, rxLocation=None, context=None):
         """
@@ -548,6 +675,8 @@ class Link(Module):
         if self.canReceive(data, transmitter, txLocation, rxLocation, context) \
                 and self.transferIn(data):
             self.received += data.size
+            if self.element is not None:
+                self.element.addReceived(self.protocol, data.size)
             self.trigger('receive', self, data, transmitter)
             return True
         return False
@@ -569,6 +698,14 @@ class Link(Module):
         self.transmitted = self._initTransmitted
         self.received = self._initReceived
 
+    def register(self, schedule):
+        """
+        Registers the per-turn updates of this Link in a schedule.
+        @param schedule: the schedule
+        @type schedule: L{Schedule}
+        """
+        schedule.add('tock', self.tock)
+
     def tock(self):
         """
         Tocks this Link in a simulation.
@@ -581,6 +718,8 @@ class SpaceGroundLink(Link):
     """
     An L{SpaceGroundLink} transports data from a satellite to a ground station.
     """
+    __slots__ = ()
+
     def __init__(self, name=None, cost=0, size=1, capacity=1,
                  protocol=None, maxTransmitted=1, maxReceived=1):
         """
@@ -605,11 +744,11 @@ class SpaceGroundLink(Link):
                              maxTransmitted=maxTransmitted,
                              maxReceived=maxReceived)
 
-    def couldTransmit(self, data, receiver, txLocation, rxLocation, context=None):
+    def couldTransmitSize(self, size, receiver, txLocation, rxLocation, context=None):
         """
-        Checks if this space-to-ground link could transmit data (state-independent).
-        @param data: the data to transmit
-        @type data: L{Data}
+        Checks if this space-to-ground link could transmit data of a size (state-independent).
+        @param size: the data size
+        @type size: L{int}
         @param receiver: the receiver receiving the data
         @type receiver: L{Link}
         @param txLocation: the transmitter location
@@ -620,16 +759,16 @@ class SpaceGroundLink(Link):
         @type context: L{Context}
         @return: L{bool}
         """
-        return super(SpaceGroundLink, self).couldTransmit(data, receiver) \
+        return super(SpaceGroundLink, self).couldTransmitSize(size, receiver) \
                 and txLocation.isOrbit() \
                 and rxLocation.isSurface() \
                 and txLocation.sector == rxLocation.sector
 
-    def couldReceive(self, data, transmitter, txLocation, rxLocation, context=None):
+    def couldReceiveSize(self, size, transmitter, txLocation, rxLocation, context=None):
         """
-        Checks if this space-to-ground link could receive data (state-independent).
-        @param data: the data to transmit
-        @type data: L{Data}
+        Checks if this space-to-ground link could receive data of a size (state-independent).
+        @param size: the data size
+        @type size: L{int}
         @param transmitter: the transmitter transmitting the data
         @type transmitter: L{Link}
         @param txLocation: the transmitter location
@@ -640,7 +779,7 @@ class SpaceGroundLink(Link):
         @type context: L{Context}
         @return: L{bool}
         """
-        return super(SpaceGroundLink, self).couldReceive(data, transmitter) \
+        return super(SpaceGroundLink, self).couldReceiveSize(size, transmitter) \
                 and txLocation.isOrbit() \
                 and rxLocation.isSurface() \
                 and txLocation.sector == rxLocation.sector
@@ -656,6 +795,8 @@ class InterSatelliteLink(Link):
     """
     An L{InterSatelliteLink} transports data between two satellites.
     """
+    __slots__ = ()
+
     def __init__(self, name=None, cost=0, size=1, capacity=1,
                  protocol=None, maxTransmitted=1, maxReceived=1):
         """
@@ -680,11 +821,11 @@ class InterSatelliteLink(Link):
                              maxTransmitted=maxTransmitted,
                              maxReceived=maxReceived)
 
-    def couldTransmit(self, data, receiver, txLocation, rxLocation, context):
+    def couldTransmitSize(self, size, receiver, txLocation, rxLocation, context):
         """
-        Checks if this inter-satellite link could transmit data (state-independent).
-        @param data: the data to transmit
-        @type data: L{Data}
+        Checks if this inter-satellite link could transmit data of a size (state-independent).
+        @param size: the data size
+        @type size: L{int}
         @param receiver: the receiver receiving the data
         @type receiver: L{Link}
         @param txLocation: the transmitter location
@@ -695,18 +836,18 @@ class InterSatelliteLink(Link):
         @type context: L{Context}
         @return: L{bool}
         """
-        return super(InterSatelliteLink, self).couldTransmit(data, receiver) \
+        return super(InterSatelliteLink, self).couldTransmitSize(size, receiver) \
                 and txLocation.isOrbit() \
                 and rxLocation.isOrbit() \
                 and (abs(txLocation.sector - rxLocation.sector) <= 1
                      or abs(txLocation.sector - rxLocation.sector)
                      >= context.getNumSectors() - 1)
 
-    def couldReceive(self, data, transmitter, txLocation, rxLocation, context):
+    def couldReceiveSize(self, size, transmitter, txLocation, rxLocation, context):
         """
-        Checks if this inter-satellite link could receive data (state-independent).
-        @param data: the data to transmit
-        @type data: L{Data}
+        Checks if this inter-satellite link could receive data of a size (state-independent).
+        @param size: the data size
+        @type size: L{int}
         @param transmitter: the transmitter transmitting the data
         @type transmitter: L{Link}
         @param txLocation: the transmitter location
@@ -717,7 +858,7 @@ class InterSatelliteLink(Link):
         @type context: L{Context}
         @return: L{bool}
         """
-        return super(InterSatelliteLink, self).couldReceive(data, transmitter) \
+        return super(InterSatelliteLink, self).couldReceiveSize(size, transmitter) \
                 and txLocation.isOrbit() \
                 and rxLocation.isOrbit() \
                 and (abs(txLocation.sector - rxLocation.sector) <= 1
@@ -17,11 +17,52 @@ limitations under the License.
 
 """
 L{ofspy.player.operations} package.
+
+Operations models are registered by the first letter of their
+specification (e.g. C{d6}) and imported on first use, so solver
+dependencies are only loaded by contexts which use them. Third-party
+models register with L{registerOperations}.
 """
 
+import importlib
 import math
 from functools import reduce
 
+_registry = {}
+
+def registerOperations(key, target):
+    """
+    Registers an operations model for a specification key.
+    @param key: the first letter of the specification
+    @type key: L{str}
+    @param target: the operations class, or its import path as
+        C{'package.module:ClassName'} to import on first use
+    @type target: L{type}
+    """
+    _registry[key] = target
+
+def getOperations(key):
+    """
+    Gets the operations model for a specification key, importing it if
+    needed.
+    @param key: the first letter of the specification
+    @type key: L{str}
+    @return: L{type}
+    """
+    target = _registry.get(key)
+    if isinstance(target, str):
+        module, name = target.split(':')
+        target = getattr(importlib.import_module(module), name)
+        _registry[key] = target
+    return target
+
+def getOperationsKeys():
+    """
+    Gets the registered specification keys.
+    @return: L{list}
+    """
+    return sorted(_registry.keys())
+
 class Operations(object):
     """
     L{Operations} represents an operational decision-making algorithm.
@@ -43,7 +84,7 @@ class Operations(object):
         if not element in self.penaltyMemo:
             demands = [e for e in context.events
                        if e.isDemand()
-                       and element.couldSense(e.generateData())]
+                       and element.couldSensePhenomenon(e.phenomenon, e.size)]
                        #and (element.couldSense(e.generateData())
                        #     or (any(m.isLink() and m.isISL()
                        #             for m in element.modules)))]
@@ -59,3 +100,7 @@ class Operations(object):
                                / math.pow(sum(counts),1), values)
             self.penaltyMemo[element] = -1*max(100, expValMax) # minimum penalty 100
         return self.penaltyMemo[element]
+
+registerOperations('d', __name__ + '.dynamic:DynamicOperations')
+registerOperations('p', __name__ + '.path:PathDynamicOperations')
+registerOperations('x', __name__ + '.fixed_cost:FixedCostDynamicOperations')
@@ -22,6 +22,7 @@ L{ofspy.player.operations.dynamic} package.
 import logging
 
 from . import Operations
+from ..capability import PROTOCOLS, PHENOMENA
 
 from gurobipy import Model, LinExpr, GRB, GurobiError
 
@@ -45,6 +46,172 @@ class DynamicOperations(Operations):
         self.storagePenalty = storagePenalty
         self.islPenalty = islPenalty
 
+    def addISLVariables(self, lp, J, controller, context, satellitesISL,
+                        protocolsISL, demands, contracts, time, minTime):
+        """
+        Adds the inter-satellite link variables, objective terms, and
+        transmit and receive constraints at one time to a model.
+        @param lp: the model
+        @type lp: L{Model}
+        @param J: the objective function
+        @type J: L{LinExpr}
+        @param controller: the controller
+        @type controller: L{Controller}
+        @param context: the context
+        @type context: L{Context}
+        @param satellitesISL: the ISL satellites
+        @type satellitesISL: L{list}
+        @param protocolsISL: the ISL protocols
+        @type protocolsISL: L{list}
+        @param demands: the demands
+        @type demands: L{list}
+        @param contracts: the contracts
+        @type contracts: L{list}
+        @param time: the time
+        @type time: L{int}
+        @param minTime: the first time in the planning horizon
+        @type minTime: L{int}
+        @return: L{tuple} of the variables for demands and contracts
+        """
+        L_d = []    # L_d[i][j][k][l]: transmit data from isl satellite i to isl satellite j using protocol k for demand l
+        L_c = []    # L_c[i][j][k][l]: transmit data from isl satellite i to isl satellite j using protocol k for contract l
+        for i, txSatellite in enumerate(satellitesISL):
+            L_d.insert(i, [])
+            L_c.insert(i, [])
+            txLocation = context.propagate(txSatellite.location, time-context.time)
+            for j, rxSatellite in enumerate(satellitesISL):
+                L_d[i].insert(j, [])
+                L_c[i].insert(j, [])
+                rxLocation = context.propagate(rxSatellite.location, time-context.time)
+                for k, protocol in enumerate(protocolsISL):
+                    L_d[i][j].insert(k, [])
+                    L_c[i][j].insert(k, [])
+                    for l, demand in enumerate(demands):
+                        L_d[i][j][k].insert(l, lp.addVar(
+                            vtype=GRB.BINARY,
+                            name='{}-T({}/{})-{}@{}'.format(
+                            txSatellite.name, demand.name,
+                            protocol, rxSatellite.name, time)))
+                        # small penalty for opportunity cost
+                        J.add(L_d[i][j][k][l], self.islPenalty*demand.size)
+                        r = LinExpr()
+                        r.add(L_d[i][j][k][l], demand.size)
+                        maxSize = (
+                            demand.size
+                            if controller.couldTransportSize(
+                                    protocol, demand.size, txSatellite,
+                                    rxSatellite, txLocation, rxLocation, context)
+                            and not demand.isDefaultedAt(time-context.time)
+                            else 0
+                        )
+                        # constrain transmission by visibility
+                        lp.addConstr(
+                            r <= maxSize,
+                            '{}-({}/{})-{} visibility at {}'.format(
+                                 txSatellite.name, demand.name,
+                                 protocol, rxSatellite.name, time))
+                    for l, contract in enumerate(contracts):
+                        L_c[i][j][k].insert(l, lp.addVar(
+                            vtype=GRB.BINARY,
+                            name='{}-T({}/{})-{}@{}'.format(
+                                txSatellite.name, contract.name,
+                                protocol, rxSatellite.name, time)))
+                        # small penalty for opportunity cost
+                        J.add(L_c[i][j][k][l], self.islPenalty*contract.demand.size)
+                        r = LinExpr()
+                        r.add(L_c[i][j][k][l], contract.demand.size)
+                        maxSize = (
+                            contract.demand.size
+                            if controller.couldTransportSize(
+                                    protocol, contract.demand.size,
+                                    txSatellite, rxSatellite, txLocation, rxLocation, context)
+                            and not contract.demand.isDefaultedAt(
+                                    contract.elapsedTime+time-context.time)
+                            else 0
+                        )
+                        # constrain transmission by visibility
+                        lp.addConstr(
+                            r <= maxSize,
+                            '{}-({}/{})-{} visibility at {}'.format(
+                                 txSatellite.name, contract.name,
+                                 protocol, rxSatellite.name, time))
+        for i, txSatellite in enumerate(satellitesISL):
+            for k, protocol in enumerate(protocolsISL):
+                r = LinExpr()
+                for j, rxSatellite in enumerate(satellitesISL):
+                    for l, demand in enumerate(demands):
+                        r.add(L_d[i][j][k][l], demand.size)
+                    for l, contract in enumerate(contracts):
+                        r.add(L_c[i][j][k][l], contract.demand.size)
+                # constrain data transmitted by satellite
+                lp.addConstr(r <= (txSatellite.getMaxTransmitted(protocol)
+                    - (txSatellite.getTransmitted(protocol) if time == minTime else 0)),
+                    '{} max transmit {} at {}'.format(txSatellite.name, protocol, time))
+        for j, rxSatellite in enumerate(satellitesISL):
+            for k, protocol in enumerate(protocolsISL):
+                r = LinExpr()
+                for i, txSatellite in enumerate(satellitesISL):
+                    for l, demand in enumerate(demands):
+                        r.add(L_d[i][j][k][l], demand.size)
+                    for l, contract in enumerate(contracts):
+                        r.add(L_c[i][j][k][l], contract.demand.size)
+                # constrain data received by station
+                lp.addConstr(r <= (rxSatellite.getMaxReceived(protocol)
+                    - (rxSatellite.getReceived(protocol) if time == minTime else 0)),
+                    '{} max receive {} at {}'.format(rxSatellite.name, protocol, time))
+        return L_d, L_c
+
+    def addISLFlow(self, r, variables, i, j):
+        """
+        Adds the net inter-satellite link flow into a satellite to a net
+        flow expression.
+        @param r: the net flow expression
+        @type r: L{LinExpr}
+        @param variables: the ISL variables for demands or contracts at one
+            time from L{addISLVariables}
+        @type variables: L{list}
+        @param i: the ISL satellite index
+        @type i: L{int}
+        @param j: the demand or contract index
+        @type j: L{int}
+        """
+        for k in range(len(variables)):
+            for l in range(len(variables[i][k])):
+                r.add(variables[i][k][l][j],-1)
+                r.add(variables[k][i][l][j],1)
+
+    def transportISL(self, controller, context, variables, satellitesISL,
+                     protocolsISL, i, j, data):
+        """
+        Transports data from a satellite over the inter-satellite links
+        selected by a solved model at the current time.
+        @param controller: the controller
+        @type controller: L{Controller}
+        @param context: the context
+        @type context: L{Context}
+        @param variables: the ISL variables for demands or contracts at the
+            current time from L{addISLVariables}
+        @type variables: L{list}
+        @param satellitesISL: the ISL satellites
+        @type satellitesISL: L{list}
+        @param protocolsISL: the ISL protocols
+        @type protocolsISL: L{list}
+        @param i: the ISL satellite index
+        @type i: L{int}
+        @param j: the demand or contract index
+        @type j: L{int}
+        @param data: the data to transport
+        @type data: L{Data}
+        @return: L{Element} the satellite receiving the data, or None
+        """
+        satellite = satellitesISL[i]
+        for k, rxSatellite in enumerate(satellitesISL):
+            for l, protocol in enumerate(protocolsISL):
+                if(variables[i][k][l][j].x
+                        and controller.transport(protocol, data, satellite, rxSatellite, context)):
+                    return rxSatellite
+        return None
+
     def execute(self, controller, context):
         """
         Executes this operations model.
@@ -67,8 +234,8 @@ class DynamicOperations(Operations):
             E_c = []    # E_c[t][i][j]: at time t satellite i holds data for contract j
             T_d = []    # T_d[t][i][j][k][l]: at time t transmit data from satellite i to ground station j using protocol k for demand l
             T_c = []    # T_c[t][i][j][k][l]: at time t transmit data from satellite i to ground station j using protocol k for contract l
-            L_d = []    # L_d[t][i][j][k][l]: at time t transmit data from isl satellite i to isl satellite j using protocol k for demand l
-            L_c = []    # L_c[t][i][j][k][l]: at time t transmit data from isl satellite i to isl satellite j using protocol k for contract l
+            L_d = []    # L_d[t]: at time t isl variables for demands (see addISLVariables)
+            L_c = []    # L_c[t]: at time t isl variables for contracts (see addISLVariables)
             R_d = []    # R_d[t][i][j]: at time t resolve data in system i for demand j
             R_c = []    # R_c[t][i][j]: at time t resolve data in system i for contract j
             J = LinExpr()   # objective function
@@ -82,11 +249,21 @@ class DynamicOperations(Operations):
             stations = [e for e in elements if e.isGround()]
             contracts = controller.getContracts()
 
-            protocolsSGL = list(set([m.protocol for e in elements
-                for m in e.modules if m.isLink() and m.isSGL()]))
-            protocolsISL = list(set([m.protocol for e in elements
-                for m in e.modules if m.isLink() and m.isISL()]))
-            phenomena = ['VIS','SAR',None]
+            # value vectors over the planning horizon for objective coefficients
+            V_d = [demand.getValues(0, maxTime-minTime+1) for demand in demands]
+            V_c = [contract.demand.getValues(contract.elapsedTime, maxTime-minTime+1)
+                   for contract in contracts]
+
+            sglMask = 0
+            islMask = 0
+            for element in elements:
+                sglMask |= element.getSGLMask()
+                islMask |= element.getISLMask()
+            protocolsSGL = PROTOCOLS.getNames(sglMask)
+            protocolsISL = PROTOCOLS.getNames(islMask)
+            phenomena = PHENOMENA.getNames(PHENOMENA.getMask(
+                [demand.phenomenon for demand in demands]
+                + [contract.demand.phenomenon for contract in contracts])) + [None]
 
             for i, satellite in enumerate(satellites):
                 S.insert(i, [])
@@ -95,7 +272,7 @@ class DynamicOperations(Operations):
                     S[i].insert(j, lp.addVar(vtype=GRB.BINARY,
                         name='{}-S-{}'.format(satellite.name, demand.name)))
                     # constrain sensing per satellite
-                    lp.addConstr(S[i][j] <= (1 if satellite.canSense(demand) else 0),
+                    lp.addConstr(S[i][j] <= (1 if context.eligibility.canSense(satellite, demand) else 0),
                                  '{} can sense {}'.format(satellite.name, demand.name))
                 for phenomenon in phenomena:
                     r = LinExpr()
@@ -175,8 +352,8 @@ class DynamicOperations(Operations):
                                 r.add(T_d[t][i][j][k][l], demand.size)
                                 maxSize = (
                                     demand.size
-                                    if controller.couldTransport(
-                                            protocol, demand.generateData(), satellite,
+                                    if controller.couldTransportSize(
+                                            protocol, demand.size, satellite,
                                             station, txLocation, rxLocation, context)
                                     and not demand.isDefaultedAt(time-context.time)
                                     else 0
@@ -197,8 +374,8 @@ class DynamicOperations(Operations):
                                 r.add(T_c[t][i][j][k][l], contract.demand.size)
                                 maxSize = (
                                     contract.demand.size
-                                    if controller.couldTransport(
-                                            protocol, contract.demand.generateData(), satellite,
+                                    if controller.couldTransportSize(
+                                            protocol, contract.demand.size, satellite,
                                             station, txLocation, rxLocation, context)
                                     and not contract.demand.isDefaultedAt(
                                             contract.elapsedTime+time-context.time)
@@ -234,92 +411,11 @@ class DynamicOperations(Operations):
                         lp.addConstr(r <= station.getMaxReceived(protocol)
                             - (station.getReceived(protocol) if time == minTime else 0),
                             '{} max receive {} at {}'.format(station.name, protocol, time))
-                L_d.insert(t, [])
-                L_c.insert(t, [])
-                for i, txSatellite in enumerate(satellitesISL):
-                    L_d[t].insert(i, [])
-                    L_c[t].insert(i, [])
-                    txLocation = context.propagate(txSatellite.location, time-context.time)
-                    for j, rxSatellite in enumerate(satellitesISL):
-                        L_d[t][i].insert(j, [])
-                        L_c[t][i].insert(j, [])
-                        rxLocation = context.propagate(rxSatellite.location, time-context.time)
-                        for k, protocol in enumerate(protocolsISL):
-                            L_d[t][i][j].insert(k, [])
-                            L_c[t][i][j].insert(k, [])
-                            for l, demand in enumerate(demands):
-                                L_d[t][i][j][k].insert(l, lp.addVar(
-                                    vtype=GRB.BINARY,
-                                    name='{}-T({}/{})-{}@{}'.format(
-                                    txSatellite.name, demand.name,
-                                    protocol, rxSatellite.name, time)))
-                                # small penalty for opportunity cost
-                                J.add(L_d[t][i][j][k][l], self.islPenalty*demand.size)
-                                r = LinExpr()
-                                r.add(L_d[t][i][j][k][l], demand.size)
-                                maxSize = (
-                                    demand.size
-                                    if controller.couldTransport(
-                                            protocol, demand.generateData(), txSatellite,
-                                            rxSatellite, txLocation, rxLocation, context)
-                                    and not demand.isDefaultedAt(time-context.time)
-                                    else 0
-                                )
-                                # constrain transmission by visibility
-                                lp.addConstr(
-                                    r <= maxSize,
-                                    '{}-({}/{})-{} visibility at {}'.format(
-                                         txSatellite.name, demand.name,
-                                         protocol, rxSatellite.name, time))
-                            for l, contract in enumerate(contracts):
-                                L_c[t][i][j][k].insert(l, lp.addVar(
-                                    vtype=GRB.BINARY,
-                                    name='{}-T({}/{})-{}@{}'.format(
-                                        txSatellite.name, contract.name,
-                                        protocol, rxSatellite.name, time)))
-                                # small penalty for opportunity cost
-                                J.add(L_c[t][i][j][k][l], self.islPenalty*contract.demand.size)
-                                r = LinExpr()
-                                r.add(L_c[t][i][j][k][l], contract.demand.size)
-                                maxSize = (
-                                    contract.demand.size
-                                    if controller.couldTransport(
-                                            protocol, contract.demand.generateData(),
-                                            txSatellite, rxSatellite, txLocation, rxLocation, context)
-                                    and not contract.demand.isDefaultedAt(
-                                            contract.elapsedTime+time-context.time)
-                                    else 0
-                                )
-                                # constrain transmission by visibility
-                                lp.addConstr(
-                                    r <= maxSize,
-                                    '{}-({}/{})-{} visibility at {}'.format(
-                                         txSatellite.name, contract.name,
-                                         protocol, rxSatellite.name, time))
-                for i, txSatellite in enumerate(satellitesISL):
-                    for k, protocol in enumerate(protocolsISL):
-                        r = LinExpr()
-                        for j, rxSatellite in enumerate(satellitesISL):
-                            for l, demand in enumerate(demands):
-                                r.add(L_d[t][i][j][k][l], demand.size)
-                            for l, contract in enumerate(contracts):
-                                r.add(L_c[t][i][j][k][l], contract.demand.size)
-                        # constrain data transmitted by satellite
-                        lp.addConstr(r <= (txSatellite.getMaxTransmitted(protocol)
-                            - (txSatellite.getTransmitted(protocol) if time == minTime else 0)),
-                            '{} max transmit {} at {}'.format(txSatellite.name, protocol, time))
-                for j, rxSatellite in enumerate(satellitesISL):
-                    for k, protocol in enumerate(protocolsISL):
-                        r = LinExpr()
-                        for i, txSatellite in enumerate(satellitesISL):
-                            for l, demand in enumerate(demands):
-                                r.add(L_d[t][i][j][k][l], demand.size)
-                            for l, contract in enumerate(contracts):
-                                r.add(L_c[t][i][j][k][l], contract.demand.size)
-                        # constrain data received by station
-                        lp.addConstr(r <= (rxSatellite.getMaxReceived(protocol)
-                            - (rxSatellite.getReceived(protocol) if time == minTime else 0)),
-                            '{} max receive {} at {}'.format(rxSatellite.name, protocol, time))
+                L_d_t, L_c_t = self.addISLVariables(
+                    lp, J, controller, context, satellitesISL, protocolsISL,
+                    demands, contracts, time, minTime)
+                L_d.insert(t, L_d_t)
+                L_c.insert(t, L_c_t)
                 R_d.insert(t, [])
                 R_c.insert(t, [])
                 for i, element in enumerate(elements):
@@ -329,14 +425,13 @@ class DynamicOperations(Operations):
                     for j, demand in enumerate(demands):
                         R_d[t][i].insert(j, lp.addVar(vtype=GRB.BINARY,
                             name='{}-R-{}@{}'.format(element.name, demand.name, time)))
-                        J.add(R_d[t][i][j], demand.getValueAt(time-context.time)
+                        J.add(R_d[t][i][j], V_d[j][t]
                               if demand.isCompletedAt(location)
                               else demand.getDefaultValue())
                     for j, contract in enumerate(contracts):
                         R_c[t][i].insert(j, lp.addVar(vtype=GRB.BINARY,
                             name='{}-R-{}@{}'.format(element.name, contract.name, time)))
-                        J.add(R_c[t][i][j], contract.demand.getValueAt(
-                            contract.elapsedTime + time-context.time)
+                        J.add(R_c[t][i][j], V_c[j][t]
                               if contract.demand.isCompletedAt(location)
                               else contract.demand.getDefaultValue())
                 for i, satellite in enumerate(satellites):
@@ -353,11 +448,8 @@ class DynamicOperations(Operations):
                             for l, protocol in enumerate(protocolsSGL):
                                 r.add(T_d[t][i][k][l][j],-1)
                         if satellite in satellitesISL:
-                            isl_i = satellitesISL.index(satellite)
-                            for k, rxSatellite in enumerate(satellitesISL):
-                                for l, protocol in enumerate(protocolsISL):
-                                    r.add(L_d[t][isl_i][k][l][j],-1)
-                                    r.add(L_d[t][k][isl_i][l][j],1)
+                            self.addISLFlow(r, L_d[t],
+                                            satellitesISL.index(satellite), j)
                         # constrain net flow of new contracts at each satellite
                         lp.addConstr(r == 0, '{} net flow {} at {}'.format(
                             satellite.name, demand.name, time))
@@ -374,11 +466,8 @@ class DynamicOperations(Operations):
                             for l, protocol in enumerate(protocolsSGL):
                                 r.add(T_c[t][i][k][l][j],-1)
                         if satellite in satellitesISL:
-                            isl_i = satellitesISL.index(satellite)
-                            for k, rxSatellite in enumerate(satellitesISL):
-                                for l, protocol in enumerate(protocolsISL):
-                                    r.add(L_c[t][isl_i][k][l][j],-1)
-                                    r.add(L_c[t][k][isl_i][l][j],1)
+                            self.addISLFlow(r, L_c[t],
+                                            satellitesISL.index(satellite), j)
                         # constrain net flow of contracts at each satellite
                         lp.addConstr(r == (-1*(E_c0[i][j] if time == minTime else 0)),
                                      '{} net flow {} at {}'.format(
@@ -418,14 +507,14 @@ class DynamicOperations(Operations):
                     if federate.canContract(demand, context): # TODO does not consider priority
                         for i, element in enumerate(elements):
                             location = context.propagate(element.location, time-context.time)
-                            r.add(R_d[0][i][j], demand.getValueAt(0)
+                            r.add(R_d[0][i][j], V_d[j][0]
                                 if demand.isCompletedAt(location)
                                 else demand.getDefaultValue())
                 for j, contract in enumerate(contracts):
-                    if contract in federate.contracts:
+                    if contract in federate.getContracts():
                         for i, element in enumerate(elements):
                             location = context.propagate(element.location, time-context.time)
-                            r.add(R_c[0][i][j], contract.demand.getValueAt(contract.elapsedTime)
+                            r.add(R_c[0][i][j], V_c[j][0]
                                 if contract.demand.isCompletedAt(location)
                                 else contract.demand.getDefaultValue())
                 lp.addConstr(r >= -1 - federate.getCash(),
@@ -454,12 +543,11 @@ class DynamicOperations(Operations):
                                         and controller.transport(protocol, data, satellite, station, context)):
                                     controller.resolve(contract, context)
                     elif satellite in satellitesISL:
-                        isl_i = satellitesISL.index(satellite)
-                        for k, rxSatellite in enumerate(satellitesISL):
-                            for l, protocol in enumerate(protocolsISL):
-                                if(L_c[0][isl_i][k][l][j].x
-                                        and controller.transport(protocol, data, satellite, rxSatellite, context)):
-                                    _transportContract(operations, rxSatellite, contract, context)
+                        rxSatellite = operations.transportISL(
+                            controller, context, L_c[0], satellitesISL,
+                            protocolsISL, satellitesISL.index(satellite), j, data)
+                        if rxSatellite is not None:
+                            _transportContract(operations, rxSatellite, contract, context)
 
             def _transportDemand(operations, satellite, demand, context):
                 i = satellites.index(satellite)
@@ -481,12 +569,11 @@ class DynamicOperations(Operations):
                                         and controller.transport(protocol, data, satellite, station, context)):
                                      controller.resolve(contract, context)
                     elif satellite in satellitesISL:
-                        isl_i = satellitesISL.index(satellite)
-                        for k, rxSatellite in enumerate(satellitesISL):
-                            for l, protocol in enumerate(protocolsISL):
-                                if(L_d[0][isl_i][k][l][j].x
-                                        and controller.transport(protocol, data, satellite, rxSatellite, context)):
-                                    _transportDemand(operations, rxSatellite, demand, context)
+                        rxSatellite = operations.transportISL(
+                            controller, context, L_d[0], satellitesISL,
+                            protocolsISL, satellitesISL.index(satellite), j, data)
+                        if rxSatellite is not None:
+                            _transportDemand(operations, rxSatellite, demand, context)
 
             # first, transport contracts to resolution
             for j, contract in enumerate(contracts):
@@ -19,10 +19,11 @@ limitations under the License.
 L{ofspy.player.operations.fixed_cost} package.
 """
 
-import random
 import logging
 
 from .dynamic import DynamicOperations
+from ..capability import PROTOCOLS, PHENOMENA
+from ...context.stream import shuffle
 
 from gurobipy import Model, LinExpr, GRB, GurobiError
 
@@ -66,18 +67,19 @@ class FixedCostDynamicOperations(DynamicOperations):
                                    for m in e.modules)]
         allStations = [e for e in allElements if e.isGround()]
 
-        protocolsSGL = list(set([m.protocol for e in allElements
-                                 for m in e.modules
-                                 if m.isLink()
-                                 and m.isSGL()]))
-        protocolsISL = list(set([m.protocol for e in allElements
-                                 for m in e.modules
-                                 if m.isLink()
-                                 and m.isISL()]))
-        phenomena = ['VIS','SAR',None]
+        sglMask = 0
+        islMask = 0
+        for element in allElements:
+            sglMask |= element.getSGLMask()
+            islMask |= element.getISLMask()
+        protocolsSGL = PROTOCOLS.getNames(sglMask)
+        protocolsISL = PROTOCOLS.getNames(islMask)
+        phenomena = PHENOMENA.getNames(PHENOMENA.getMask(
+            [e.phenomenon for e in context.currentEvents if e.isDemand()]
+            + [c.demand.phenomenon for c in controller.getContracts()])) + [None]
 
-        federates = controller.getFederates()
-        random.shuffle(federates, context.orderStream.random)
+        federates = list(controller.getFederates())
+        shuffle(federates, context.orderStream)
         for federate in federates:
             try:
                 lp = Model('OFS LP for {}'.format(controller.name))
@@ -96,11 +98,16 @@ class FixedCostDynamicOperations(DynamicOperations):
 
                 demands = [e for e in context.currentEvents if e.isDemand()]
                 ownElements = [e for e in controller.getElements()
-                    if e in federate.elements]
+                    if e in federate.getElements()]
                 ownSatellites = [e for e in ownElements if e.isSpace()]
                 ownStations = [e for e in ownElements if e.isGround()]
                 ownContracts = [c for c in controller.getContracts()
-                    if c in federate.contracts]
+                    if c in federate.getContracts()]
+
+                # value vectors over the planning horizon for objective coefficients
+                V_d = [demand.getValues(0, maxTime-minTime+1) for demand in demands]
+                V_c = [contract.demand.getValues(contract.elapsedTime, maxTime-minTime+1)
+                       for contract in ownContracts]
 
                 for i, satellite in enumerate(ownSatellites):
                     S.insert(i, [])
@@ -109,7 +116,7 @@ class FixedCostDynamicOperations(DynamicOperations):
                         S[i].insert(j, lp.addVar(vtype=GRB.BINARY,
                             name='{}-S-{}'.format(satellite.name, demand.name)))
                         # constrain sensing per satellite
-                        lp.addConstr(S[i][j] <= (1 if satellite.canSense(demand) else 0),
+                        lp.addConstr(S[i][j] <= (1 if context.eligibility.canSense(satellite, demand) else 0),
                                      '{} can sense {}'.format(satellite.name, demand.name))
                     for phenomenon in phenomena:
                         r = LinExpr()
@@ -192,8 +199,8 @@ class FixedCostDynamicOperations(DynamicOperations):
                                     r.add(T_d[t][i][j][k][l], demand.size)
                                     maxSize = (
                                         demand.size
-                                        if controller.couldTransport(
-                                                protocol, demand.generateData(), satellite,
+                                        if controller.couldTransportSize(
+                                                protocol, demand.size, satellite,
                                                 station, txLocation, rxLocation, context)
                                         and not demand.isDefaultedAt(time-context.time)
                                         else 0
@@ -217,8 +224,8 @@ class FixedCostDynamicOperations(DynamicOperations):
                                     r.add(T_c[t][i][j][k][l], contract.demand.size)
                                     maxSize = (
                                         contract.demand.size
-                                        if controller.couldTransport(
-                                                protocol, contract.demand.generateData(), satellite,
+                                        if controller.couldTransportSize(
+                                                protocol, contract.demand.size, satellite,
                                                 station, txLocation, rxLocation, context)
                                         and not contract.demand.isDefaultedAt(
                                                 contract.elapsedTime + time-context.time)
@@ -289,8 +296,8 @@ class FixedCostDynamicOperations(DynamicOperations):
                                     r.add(L_d[t][i][j][k][l], demand.size)
                                     maxSize = (
                                         demand.size
-                                        if controller.couldTransport(
-                                                protocol, demand.generateData(), txSatellite, rxSatellite,
+                                        if controller.couldTransportSize(
+                                                protocol, demand.size, txSatellite, rxSatellite,
                                                 txLocation, rxLocation, context)
                                         and not demand.isDefaultedAt(
                                                 time-context.time)
@@ -319,8 +326,8 @@ class FixedCostDynamicOperations(DynamicOperations):
                                     r.add(L_c[t][i][j][k][l], contract.demand.size)
                                     maxSize = (
                                         contract.demand.size
-                                        if controller.couldTransport(
-                                                protocol, contract.demand.generateData(),
+                                        if controller.couldTransportSize(
+                                                protocol, contract.demand.size,
                                                 txSatellite, rxSatellite, txLocation,
                                                 rxLocation, context)
                                         and not contract.demand.isDefaultedAt(
@@ -372,14 +379,13 @@ class FixedCostDynamicOperations(DynamicOperations):
                         for j, demand in enumerate(demands):
                             R_d[t][i].insert(j, lp.addVar(vtype=GRB.BINARY,
                                 name='{}-R-{}@{}'.format(element.name, demand.name, time)))
-                            J.add(R_d[t][i][j], demand.getValueAt(time-context.time)
+                            J.add(R_d[t][i][j], V_d[j][t]
                                   if demand.isCompletedAt(location)
                                   else demand.getDefaultValue())
                         for j, contract in enumerate(ownContracts):
                             R_c[t][i].insert(j, lp.addVar(vtype=GRB.BINARY,
                                 name='{}-R-{}@{}'.format(element.name, contract.name, time)))
-                            J.add(R_c[t][i][j], contract.demand.getValueAt(
-                                contract.elapsedTime + time-context.time)
+                            J.add(R_c[t][i][j], V_c[j][t]
                                   if contract.demand.isCompletedAt(location)
                                   else contract.demand.getDefaultValue())
                     for i, satellite in enumerate(allSatellites):
@@ -468,7 +474,7 @@ class FixedCostDynamicOperations(DynamicOperations):
                 for l, demand in enumerate(demands):
                     for i, element in enumerate(allElements):
                         location = context.propagate(element.location, time-context.time)
-                        r.add(R_d[0][i][l], (demand.getValueAt(0)
+                        r.add(R_d[0][i][l], (V_d[l][0]
                             if demand.isCompletedAt(location)
                             else demand.getDefaultValue()))
                     for i, satellite in enumerate(allSatellites):
@@ -486,7 +492,7 @@ class FixedCostDynamicOperations(DynamicOperations):
                 for l, contract in enumerate(ownContracts):
                     for i, element in enumerate(allElements):
                         location = context.propagate(element.location, time-context.time)
-                        r.add(R_c[0][i][l], (contract.demand.getValueAt(contract.elapsedTime)
+                        r.add(R_c[0][i][l], (V_c[l][0]
                             if contract.demand.isCompletedAt(location)
                             else contract.demand.getDefaultValue()))
                     for i, satellite in enumerate(allSatellites):
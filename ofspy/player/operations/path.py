@@ -0,0 +1,290 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+Copyright 2017 Paul T. Grogan, Stevens Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+"""
+L{ofspy.player.operations.path} package.
+"""
+
+import logging
+
+from .dynamic import DynamicOperations
+
+from gurobipy import LinExpr, GRB
+
+class PathDynamicOperations(DynamicOperations):
+    """
+    L{PathDynamicOperations} represents an operational decision-making
+    algorithm using a mixed-integer linear program to route data within a
+    controller to maximize expected revenue. Inter-satellite links are
+    modeled with variables for precomputed multi-hop routes rather than
+    for every pair of satellites. The number of simple routes grows
+    exponentially with their length, so routes are limited to C{maxHops}
+    hops (2 by default).
+    """
+    def __init__(self, planningHorizon=6, storagePenalty=-100, islPenalty=-10,
+                 maxHops=2):
+        """
+        @param planningHorizon: the planning horizon
+        @type planningHorizon: L{int}
+        @param storagePenalty: the storage opportuntiy cost
+        @type storagePenalty: L{float}
+        @param islPenalty: the ISL opportuntiy cost per hop
+        @type islPenalty: L{float}
+        @param maxHops: the maximum hops in a route (None for no limit,
+            which is only tractable for a few ISL satellites)
+        @type maxHops: L{int}
+        """
+        super(PathDynamicOperations, self).__init__(
+            planningHorizon=planningHorizon,
+            storagePenalty=storagePenalty,
+            islPenalty=islPenalty)
+        self.maxHops = maxHops
+
+    def getAdjacency(self, controller, context, satellites, protocols,
+                     size, time):
+        """
+        Gets the inter-satellite links able to transport data of a size at
+        a time as an adjacency list of (receiver, protocol) index pairs.
+        @param controller: the controller
+        @type controller: L{Controller}
+        @param context: the context
+        @type context: L{Context}
+        @param satellites: the ISL satellites
+        @type satellites: L{list}
+        @param protocols: the ISL protocols
+        @type protocols: L{list}
+        @param size: the data size
+        @type size: L{int}
+        @param time: the time
+        @type time: L{int}
+        @return: L{list}
+        """
+        locations = [context.propagate(satellite.location, time-context.time)
+                     for satellite in satellites]
+        return [[(j, k) for j, rxSatellite in enumerate(satellites)
+                 for k, protocol in enumerate(protocols)
+                 if j != i and controller.couldTransportSize(
+                     protocol, size, txSatellite, rxSatellite,
+                     locations[i], locations[j], context)]
+                for i, txSatellite in enumerate(satellites)]
+
+    def getRoutes(self, adjacency):
+        """
+        Enumerates the simple routes in an adjacency list with at most
+        C{maxHops} hops. Each route is a tuple of (transmitter, receiver,
+        protocol) index hops.
+        @param adjacency: the adjacency list
+        @type adjacency: L{list}
+        @return: L{list}
+        """
+        maxHops = (len(adjacency) - 1 if self.maxHops is None
+                   else self.maxHops)
+        routes = []
+        stack = [((i, j, k),) for i in reversed(range(len(adjacency)))
+                 for j, k in reversed(adjacency[i])]
+        while len(stack) > 0:
+            route = stack.pop()
+            routes.append(route)
+            if len(route) < maxHops:
+                visited = set([route[0][0]] + [hop[1] for hop in route])
+                tail = route[-1][1]
+                for j, k in reversed(adjacency[tail]):
+                    if j not in visited:
+                        stack.append(route + ((tail, j, k),))
+        return routes
+
+    def addISLVariables(self, lp, J, controller, context, satellitesISL,
+                        protocolsISL, demands, contracts, time, minTime):
+        """
+        Adds one variable per inter-satellite link route, the per-hop
+        objective terms, and transmit and receive constraints at one time
+        to a model. The variables for each demand or contract are a list of
+        (route, variable) pairs.
+        @param lp: the model
+        @type lp: L{Model}
+        @param J: the objective function
+        @type J: L{LinExpr}
+        @param controller: the controller
+        @type controller: L{Controller}
+        @param context: the context
+        @type context: L{Context}
+        @param satellitesISL: the ISL satellites
+        @type satellitesISL: L{list}
+        @param protocolsISL: the ISL protocols
+        @type protocolsISL: L{list}
+        @param demands: the demands
+        @type demands: L{list}
+        @param contracts: the contracts
+        @type contracts: L{list}
+        @param time: the time
+        @type time: L{int}
+        @param minTime: the first time in the planning horizon
+        @type minTime: L{int}
+        @return: L{tuple} of the variables for demands and contracts
+        """
+        P_d = []    # P_d[l]: (route, variable) pairs to transmit data along an isl route for demand l
+        P_c = []    # P_c[l]: (route, variable) pairs to transmit data along an isl route for contract l
+        routes = {} # routes[size]: isl routes for data size
+        txISL = {}  # txISL[(i, k)]: data transmitted by isl satellite i using protocol k
+        rxISL = {}  # rxISL[(j, k)]: data received by isl satellite j using protocol k
+        items = ([(demand, demand.name, demand.isDefaultedAt(time-context.time), P_d)
+                  for demand in demands]
+                 + [(contract.demand, contract.name, contract.demand.isDefaultedAt(
+                        contract.elapsedTime+time-context.time), P_c)
+                    for contract in contracts])
+        for demand, name, defaulted, P in items:
+            P.append([])
+            if defaulted:
+                continue
+            if demand.size not in routes:
+                routes[demand.size] = self.getRoutes(self.getAdjacency(
+                    controller, context, satellitesISL, protocolsISL,
+                    demand.size, time))
+            for route in routes[demand.size]:
+                var = lp.addVar(vtype=GRB.BINARY,
+                    name='{}-P({})-{}@{}'.format(
+                    satellitesISL[route[0][0]].name, name,
+                    '-'.join('{}/{}'.format(protocolsISL[k], satellitesISL[j].name)
+                             for i, j, k in route), time))
+                # small penalty for opportunity cost of each hop
+                J.add(var, self.islPenalty*demand.size*len(route))
+                P[-1].append((route, var))
+                for i, j, k in route:
+                    txISL.setdefault((i, k), LinExpr()).add(var, demand.size)
+                    rxISL.setdefault((j, k), LinExpr()).add(var, demand.size)
+        for i, k in sorted(txISL):
+            txSatellite = satellitesISL[i]
+            protocol = protocolsISL[k]
+            # constrain data transmitted by satellite
+            lp.addConstr(txISL[(i, k)] <= (txSatellite.getMaxTransmitted(protocol)
+                - (txSatellite.getTransmitted(protocol) if time == minTime else 0)),
+                '{} max transmit {} at {}'.format(txSatellite.name, protocol, time))
+        for j, k in sorted(rxISL):
+            rxSatellite = satellitesISL[j]
+            protocol = protocolsISL[k]
+            # constrain data received by satellite
+            lp.addConstr(rxISL[(j, k)] <= (rxSatellite.getMaxReceived(protocol)
+                - (rxSatellite.getReceived(protocol) if time == minTime else 0)),
+                '{} max receive {} at {}'.format(rxSatellite.name, protocol, time))
+        return P_d, P_c
+
+    def addISLFlow(self, r, variables, i, j):
+        """
+        Adds the net inter-satellite link flow into a satellite to a net
+        flow expression. Routes only contribute at their ends.
+        @param r: the net flow expression
+        @type r: L{LinExpr}
+        @param variables: the route variables for demands or contracts at
+            one time from L{addISLVariables}
+        @type variables: L{list}
+        @param i: the ISL satellite index
+        @type i: L{int}
+        @param j: the demand or contract index
+        @type j: L{int}
+        """
+        for route, var in variables[j]:
+            if route[0][0] == i:
+                r.add(var,-1)
+            if route[-1][1] == i:
+                r.add(var,1)
+
+    def canTransportRoute(self, controller, context, satellitesISL,
+                          protocolsISL, route, data):
+        """
+        Checks if data can be transported along each hop of a route before
+        any hop is taken. Later hops are checked against the remaining
+        transmit and receive capacity of their links.
+        @param controller: the controller
+        @type controller: L{Controller}
+        @param context: the context
+        @type context: L{Context}
+        @param satellitesISL: the ISL satellites
+        @type satellitesISL: L{list}
+        @param protocolsISL: the ISL protocols
+        @type protocolsISL: L{list}
+        @param route: the route of (transmitter, receiver, protocol) hops
+        @type route: L{tuple}
+        @param data: the data to transport
+        @type data: L{Data}
+        @return: L{bool}
+        """
+        i, j, k = route[0]
+        if not controller.canTransport(protocolsISL[k], data, satellitesISL[i],
+                                       satellitesISL[j], context):
+            return False
+        for i, j, k in route[1:]:
+            txSatellite = satellitesISL[i]
+            rxSatellite = satellitesISL[j]
+            protocol = protocolsISL[k]
+            if not (controller.couldTransport(
+                        protocol, data, txSatellite, rxSatellite,
+                        txSatellite.location, rxSatellite.location, context)
+                    and rxSatellite in controller.getElements()
+                    and txSatellite.getMaxTransmitted(protocol)
+                        - txSatellite.getTransmitted(protocol) >= data.size
+                    and rxSatellite.getMaxReceived(protocol)
+                        - rxSatellite.getReceived(protocol) >= data.size):
+                return False
+        return True
+
+    def transportISL(self, controller, context, variables, satellitesISL,
+                     protocolsISL, i, j, data):
+        """
+        Transports data from a satellite along the inter-satellite link
+        route selected by a solved model at the current time. Nothing is
+        moved unless the whole route can carry the data; if a hop still
+        fails, the data are stored at the last satellite reached.
+        @param controller: the controller
+        @type controller: L{Controller}
+        @param context: the context
+        @type context: L{Context}
+        @param variables: the route variables for demands or contracts at
+            the current time from L{addISLVariables}
+        @type variables: L{list}
+        @param satellitesISL: the ISL satellites
+        @type satellitesISL: L{list}
+        @param protocolsISL: the ISL protocols
+        @type protocolsISL: L{list}
+        @param i: the ISL satellite index
+        @type i: L{int}
+        @param j: the demand or contract index
+        @type j: L{int}
+        @param data: the data to transport
+        @type data: L{Data}
+        @return: L{Element} the satellite receiving the data, or None
+        """
+        route = next((route for route, var in variables[j]
+                      if route[0][0] == i and var.x > 0), None)
+        if route is None:
+            return None
+        if not self.canTransportRoute(controller, context, satellitesISL,
+                                      protocolsISL, route, data):
+            logging.warning('{0} could not transport {1} along the route from {2}'
+                            .format(controller.name, str(data),
+                                    satellitesISL[i].name))
+            return None
+        for tx, rx, k in route:
+            if not controller.transport(protocolsISL[k], data,
+                                        satellitesISL[tx], satellitesISL[rx],
+                                        context):
+                satellite = satellitesISL[tx]
+                logging.warning('{0} stopped {1} at {2} along the route from {3}'
+                                .format(controller.name, str(data),
+                                        satellite.name, satellitesISL[i].name))
+                satellite.store(data)
+                return None
+        return satellitesISL[route[-1][1]]
@@ -0,0 +1,304 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+"""
+The L{ofspy.service} package runs a local simulation service over HTTP.
+
+Clients post jobs, one per line in the format of L{ofspy.batch}, to
+C{/jobs} and read one JSON result per line as each finishes. A job may set
+a C{priority} (higher runs first, default 0). Identical jobs share one
+execution while in flight, and repeats are served from a result cache.
+C{/stats} reports the job counts.
+"""
+
+import heapq
+import itertools
+import json
+import logging
+import multiprocessing
+import sys
+import threading
+from collections import OrderedDict
+
+try:
+    # python3
+    from http.client import HTTPConnection
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+    from queue import Queue
+except ImportError:
+    # python2
+    from httplib import HTTPConnection
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+    from Queue import Queue
+
+from .batch import DEFAULTS, executeJob, parseJobs, _initWorker
+from .game import Game
+from .player.operations import getOperations, getOperationsKeys
+
+def _initServiceWorker(level):
+    """
+    Initializes a warm service worker, preloading the game templates,
+    operations models and, if a model uses it, the solver environment.
+    @param level: the logging level
+    @type level: L{int}
+    """
+    _initWorker(level)
+    Game(numPlayers=1, initialCash=0).generateContext()
+    for key in getOperationsKeys():
+        try:
+            getOperations(key)
+        except ImportError as e:
+            logging.warning('Cannot preload operations {}: {}'.format(key, e))
+    if 'gurobipy' in sys.modules:
+        # start the default environment (license check) before the first job
+        import gurobipy
+        try:
+            gurobipy.Model().dispose()
+        except gurobipy.GurobiError as e:
+            logging.warning('Cannot preload solver environment: {}'.format(e))
+
+def getJobKey(job):
+    """
+    Gets the key identifying the simulation of a job, ignoring its id and
+    priority.
+    @param job: the job
+    @type job: L{dict}
+    @return: L{str}
+    """
+    return json.dumps(dict((k, job.get(k)) for k in
+                           ['elements', 'error'] + sorted(DEFAULTS)),
+                      sort_keys=True)
+
+class SimulationService(object):
+    """
+    A L{SimulationService} executes jobs by priority in a pool of warm
+    worker processes.
+    """
+    def __init__(self, numWorkers=None, cacheSize=10000):
+        """
+        @param numWorkers: the number of worker processes (defaults to
+            the number of CPUs)
+        @type numWorkers: L{int}
+        @param cacheSize: the maximum number of cached results
+        @type cacheSize: L{int}
+        """
+        self.numWorkers = (numWorkers if numWorkers is not None
+                           else multiprocessing.cpu_count())
+        self.cacheSize = cacheSize
+        self._pool = multiprocessing.Pool(
+            self.numWorkers, _initServiceWorker,
+            (logging.getLogger().getEffectiveLevel(),))
+        self._lock = threading.Lock()
+        self._queue = []
+        self._order = itertools.count()
+        self._queued = {}
+        self._waiters = {}
+        self._cache = OrderedDict()
+        self._numRunning = 0
+        self.stats = {'submitted': 0, 'executed': 0,
+                      'deduplicated': 0, 'cached': 0}
+
+    def submit(self, job, callback):
+        """
+        Submits a job, calling back with its result when finished.
+        @param job: the job
+        @type job: L{dict}
+        @param callback: the function to call with the result
+        @type callback: L{function}
+        """
+        key = getJobKey(job)
+        priority = job.get('priority', 0)
+        with self._lock:
+            self.stats['submitted'] += 1
+            result = self._cache.get(key)
+            if result is not None:
+                self.stats['cached'] += 1
+                # re-insert so eviction drops the least recently used
+                self._cache[key] = self._cache.pop(key)
+            elif key in self._waiters:
+                self.stats['deduplicated'] += 1
+                self._waiters[key].append(callback)
+                if key in self._queued and priority > self._queued[key][0]:
+                    # promote the queued job (stale entries are skipped)
+                    self._queued[key] = (priority, self._queued[key][1])
+                    heapq.heappush(self._queue,
+                                   (-priority, next(self._order), key))
+            else:
+                self._waiters[key] = [callback]
+                self._queued[key] = (priority, job)
+                heapq.heappush(self._queue,
+                               (-priority, next(self._order), key))
+                self._dispatch()
+        if result is not None:
+            callback(result)
+
+    def _dispatch(self):
+        """
+        Dispatches queued jobs in priority order to idle workers. Called
+        with the lock held.
+        """
+        while self._numRunning < self.numWorkers and len(self._queue) > 0:
+            priority, order, key = heapq.heappop(self._queue)
+            if key not in self._queued \
+                    or -priority != self._queued[key][0]:
+                continue
+            job = self._queued.pop(key)[1]
+            self._numRunning += 1
+            self.stats['executed'] += 1
+            self._pool.apply_async(executeJob, (job,),
+                                   callback=lambda result, key=key:
+                                   self._complete(key, result))
+
+    def _complete(self, key, result):
+        """
+        Completes a job, caching its result and calling back its waiters.
+        @param key: the job key
+        @type key: L{str}
+        @param result: the job result
+        @type result: L{dict}
+        """
+        with self._lock:
+            self._numRunning -= 1
+            if 'error' not in result:
+                self._cache[key] = result
+                if len(self._cache) > self.cacheSize:
+                    self._cache.popitem(last=False)
+            callbacks = self._waiters.pop(key)
+            self._dispatch()
+        for callback in callbacks:
+            callback(result)
+
+    def evaluate(self, jobs):
+        """
+        Evaluates jobs, yielding each result as it finishes (in any order)
+        keyed by the id of its job.
+        @param jobs: the jobs
+        @type jobs: L{list}
+        @return: L{generator}
+        """
+        results = Queue()
+        count = 0
+        for job in jobs:
+            self.submit(job, lambda result, id=job['id']:
+                        results.put(dict(result, id=id)))
+            count += 1
+        for i in range(count):
+            yield results.get()
+
+    def close(self):
+        """
+        Closes this service, stopping its workers.
+        """
+        self._pool.terminate()
+        self._pool.join()
+
+class _ServiceHandler(BaseHTTPRequestHandler):
+    """
+    A L{_ServiceHandler} handles the HTTP requests of a service.
+    """
+    def do_GET(self):
+        if self.path != '/stats':
+            self.send_error(404)
+            return
+        with self.server.service._lock:
+            body = json.dumps(self.server.service.stats)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.end_headers()
+        self.wfile.write((body + '\n').encode('utf-8'))
+
+    def do_POST(self):
+        if self.path != '/jobs':
+            self.send_error(404)
+            return
+        length = int(self.headers.get('Content-Length', 0))
+        lines = self.rfile.read(length).decode('utf-8').splitlines()
+        jobs = parseJobs(lines, self.server.defaults)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.end_headers()
+        for result in self.server.service.evaluate(jobs):
+            self.wfile.write((json.dumps(result) + '\n').encode('utf-8'))
+            self.wfile.flush()
+
+    def log_message(self, format, *args):
+        logging.info(format % args)
+
+class ServiceServer(ThreadingMixIn, HTTPServer):
+    """
+    A L{ServiceServer} serves a simulation service over HTTP.
+    """
+    daemon_threads = True
+
+    def __init__(self, address, service, defaults=None):
+        """
+        @param address: the (host, port) address
+        @type address: L{tuple}
+        @param service: the simulation service
+        @type service: L{SimulationService}
+        @param defaults: the default job options
+        @type defaults: L{dict}
+        """
+        HTTPServer.__init__(self, address, _ServiceHandler)
+        self.service = service
+        self.defaults = defaults
+
+class ServiceClient(object):
+    """
+    A L{ServiceClient} evaluates jobs on a simulation service.
+    """
+    def __init__(self, host='localhost', port=8080):
+        """
+        @param host: the service host
+        @type host: L{str}
+        @param port: the service port
+        @type port: L{int}
+        """
+        self.host = host
+        self.port = port
+
+    def evaluate(self, jobs):
+        """
+        Evaluates jobs, yielding each result as it finishes.
+        @param jobs: the jobs, as dicts or job lines
+        @type jobs: L{list}
+        @return: L{generator}
+        """
+        body = '\n'.join(job if isinstance(job, str) else json.dumps(job)
+                         for job in jobs)
+        connection = HTTPConnection(self.host, self.port)
+        try:
+            connection.request('POST', '/jobs', body.encode('utf-8'),
+                               {'Content-Type': 'application/x-ndjson'})
+            response = connection.getresponse()
+            for line in response:
+                yield json.loads(line.decode('utf-8'))
+        finally:
+            connection.close()
+
+    def getStats(self):
+        """
+        Gets the job counts of the service.
+        @return: L{dict}
+        """
+        connection = HTTPConnection(self.host, self.port)
+        try:
+            connection.request('GET', '/stats')
+            return json.loads(connection.getresponse().read().decode('utf-8'))
+        finally:
+            connection.close()
@@ -23,31 +23,42 @@ import uuid
 class Observable(object):
     """
     An L{Observable} object conforms to an observer pattern and fires events.
+    The handler table is only created when the first handler is bound.
     """
+    __slots__ = ('_handlers',)
+
     def __init__(self):
-        self._handlers = {}
+        self._handlers = None
 
     def trigger(self, events, *args):
+        if self._handlers is None:
+            return
         for event in events.split(' '):
             if event in self._handlers:
                 for handler in self._handlers[event]:
                     handler(*args)
 
     def on(self, events, handler):
+        if self._handlers is None:
+            self._handlers = {}
         for event in events.split(' '):
             if event not in self._handlers:
                 self._handlers[event] = []
             self._handlers[event].append(handler)
 
     def off(self, events, handler):
+        if self._handlers is None:
+            return
         for event in events.split(' '):
-            if event in self.handler:
+            if event in self._handlers:
                 self._handlers[event].remove(handler)
 
 class Entity(Observable):
     """
     An L{Entity} object is the fundamental unit of simulation.
     """
+    __slots__ = ('name',)
+
     def __init__(self, name=None):
         """
         @param name: the name of this entity
@@ -81,12 +92,88 @@ class Entity(Observable):
         """
         pass
 
+    def register(self, schedule):
+        """
+        Registers the per-turn updates of this entity in a schedule.
+        @param schedule: the schedule
+        @type schedule: L{Schedule}
+        """
+        schedule.add('tick', self.tick)
+        schedule.add('tock', self.tock)
+
     def __str__(self):
         """
         Gets the string representation of this entity.
         """
         return self.name
 
+class Schedule(object):
+    """
+    A L{Schedule} holds the updates registered by entities for each phase
+    of a turn as flat lists which are run in batched passes. It is
+    compiled once and recompiled only after being invalidated by a
+    structural change, such as an element being commissioned.
+    """
+    def __init__(self):
+        self._updates = {}
+        self._valid = False
+
+    def add(self, phase, update):
+        """
+        Adds an update to a phase of this schedule.
+        @param phase: the phase
+        @type phase: L{str}
+        @param update: the update, called with the phase arguments
+        @type update: L{callable}
+        """
+        if phase not in self._updates:
+            self._updates[phase] = []
+        self._updates[phase].append(update)
+
+    def getUpdates(self, phase):
+        """
+        Gets the updates in a phase of this schedule.
+        @param phase: the phase
+        @type phase: L{str}
+        @return: L{list}
+        """
+        return self._updates.get(phase, [])
+
+    def run(self, phase, *args):
+        """
+        Runs the updates in a phase of this schedule in order.
+        @param phase: the phase
+        @type phase: L{str}
+        """
+        for update in self._updates.get(phase, []):
+            update(*args)
+
+    def clear(self):
+        """
+        Clears all updates from this schedule.
+        """
+        self._updates = {}
+        self._valid = False
+
+    def validate(self):
+        """
+        Marks this schedule as compiled.
+        """
+        self._valid = True
+
+    def invalidate(self):
+        """
+        Marks this schedule as requiring recompilation.
+        """
+        self._valid = False
+
+    def isValid(self):
+        """
+        Checks if this schedule is compiled and current.
+        @return: L{bool}
+        """
+        return self._valid
+
 class Simulator(Observable):
     """
     A L{Simulator} executes a time-evoked simulation.
@@ -110,22 +197,55 @@ class Simulator(Observable):
         self.timeStep = timeStep
         self.initTime = initTime
         self.maxTime = maxTime
+        self.schedule = Schedule()
+        self._names = None
+        self._numEntities = 0
 
     def entity(self, name):
-        return next((e for e in self.entities if e.name == name), None)
+        if self._names is not None:
+            if len(self.entities) != self._numEntities:
+                self._indexNames()
+            entity = self._names.get(name)
+            if entity is not None and entity.name == name:
+                return entity
+        entity = next((e for e in self.entities if e.name == name), None)
+        if entity is not None and self._names is not None:
+            # renamed or replaced since indexing
+            self._names[name] = entity
+        return entity
+
+    def _indexNames(self):
+        """
+        Indexes the entities by name (the first of each name).
+        """
+        self._names = {}
+        for entity in self.entities:
+            self._names.setdefault(entity.name, entity)
+        self._numEntities = len(self.entities)
+
+    def compile(self):
+        """
+        Compiles the per-turn update schedule of the entities.
+        """
+        self.schedule.clear()
+        self._indexNames()
+        for entity in self.entities:
+            entity.register(self.schedule)
+        self.schedule.validate()
 
     def init(self):
         self.time = self.initTime
         for entity in self.entities:
             entity.init(self)
+        self.compile()
         self.trigger('init', self.time)
 
     def advance(self):
         if not self.isComplete():
-            for entity in self.entities:
-                entity.tick(self)
-            for entity in self.entities:
-                entity.tock()
+            if not self.schedule.isValid():
+                self.compile()
+            self.schedule.run('tick', self)
+            self.schedule.run('tock')
             self.time += self.timeStep
             self.trigger('advance', self.time)
             if self.isComplete():
@@ -21,7 +21,7 @@ Test cases for L{ofspy.context} package.
 
 import unittest
 
-from ...player import Federation
+from ...player import Federate, Federation
 from ...simulation import Simulator
 from ...context import Context
 from ...context.location import Surface, Orbit
@@ -114,3 +114,46 @@ class ContextTestCase(unittest.TestCase):
         self.assertEqual(len(self.default.currentEvents), 6)
         self.assertEqual(len(self.default.futureEvents),
                          len(self.default.events) - 6)
+
+    def test_getFutureReveals(self):
+        self.default.init(self.sim)
+        reveals = self.default.getFutureReveals(2)
+        self.assertEqual(len(reveals), 2)
+        for turn in reveals:
+            self.default.tick(self.sim)
+            self.default.tock()
+            self.assertEqual(len(turn), 6)
+            for event in self.default.currentEvents:
+                self.assertIs(event.getTemplate(), turn[event.sector])
+
+    def test_getRollStream(self):
+        federates = [Federate(name='P1'), Federate(name='P2')]
+        self.default.federations = [Federation(federates=federates[:1])]
+        self.default.init(self.sim)
+        self.assertIs(self.default.getRollStream(federates[0], 1),
+                      self.default.getRollStream(federates[0], 2))
+        crn = Context(locations=self.locs, events=self.evts,
+                      federations=[Federation(federates=federates)],
+                      seed=0, crn=True)
+        other = Context(locations=self.locs, events=self.evts,
+                        federations=[Federation(federates=federates[:1])],
+                        seed=0, crn=True)
+        crn.init(self.sim)
+        other.init(self.sim)
+        # streams are keyed by turn and sector, not by the other federates
+        self.assertIsNot(crn.getRollStream(federates[0], 1),
+                         crn.getRollStream(federates[0], 2))
+        self.assertEqual(crn.getRollStream(federates[0], 1).random(),
+                         other.getRollStream(federates[0], 1).random())
+        self.assertEqual([e.name for e in crn.futureEvents],
+                         [e.name for e in other.futureEvents])
+        first = crn.getRollStream(federates[0], 1)
+        crn.tick(self.sim)
+        crn.tock()
+        self.assertIsNot(crn.getRollStream(federates[0], 1), first)
+        # per-turn streams are not kept by the manager
+        numStreams = len(crn.streams._streams)
+        crn.tick(self.sim)
+        crn.tock()
+        crn.getRollStream(federates[0], 1)
+        self.assertEqual(len(crn.streams._streams), numStreams)
@@ -0,0 +1,71 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+Copyright 2017 Paul T. Grogan, Stevens Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import unittest
+
+from ...context import Context
+from ...context.event import Demand
+from ...context.location import Surface, Orbit
+from ...context.eligibility import EligibilityMatrix
+from ...player import Contract, Federate, Federation
+from ...player.element import Element
+from ...player.module import Sensor
+
+"""
+Test cases for L{ofspy.context.eligibility.EligibilityMatrix} class.
+"""
+
+class EligibilityMatrixTestCase(unittest.TestCase):
+    def setUp(self):
+        self.default = EligibilityMatrix()
+        self.locations = [Surface(0), Orbit(0,'LEO'), Surface(1), Orbit(1,'LEO')]
+        self.element = Element(capacity=2,
+                               modules=[Sensor(phenomenon='SAR')])
+        self.federate = Federate(elements=[self.element])
+        self.context = Context(locations=self.locations,
+                               federations=[Federation(
+                                   federates=[self.federate])])
+        self.demands = [Demand(0,'SAR',1), Demand(1,'SAR',1),
+                        Demand(0,'VIS',1), Demand(0,'SAR',1)]
+        self.context.currentEvents = self.demands[:]
+    def tearDown(self):
+        self.default = None
+        self.locations = None
+        self.element = None
+        self.federate = None
+        self.context = None
+        self.demands = None
+    def test_update(self):
+        self.default.update(self.context)
+        self.assertEqual(self.default.getDemands(), self.demands)
+        self.assertEqual(self.default.getRow(self.element),
+                         [False, False, False, False])
+        self.element.commission(self.locations[1], self.context)
+        self.assertEqual(self.default.getRow(self.element),
+                         [True, False, False, True])
+    def test_canSense(self):
+        self.element.commission(self.locations[1], self.context)
+        self.default.update(self.context)
+        self.assertTrue(self.default.canSense(self.element, self.demands[0]))
+        self.assertEqual(self.default.getEligibleElements(
+            self.federate, self.demands[3]), [self.element])
+        self.element.senseAndStore(Contract(self.demands[0]))
+        self.assertFalse(self.default.canSense(self.element, self.demands[3]))
+        self.assertEqual(self.default.getEligibleElements(
+            self.federate, self.demands[3]), [])
+        self.assertFalse(self.default.canSense(self.element,
+                                               Demand(0,'SAR',1)))
@@ -70,6 +70,15 @@ class DemandTestCase(unittest.TestCase):
     def test_isDemand(self):
         self.assertTrue(self.default.isDemand())
         self.assertTrue(self.basic.isDemand())
+    def test_instantiate(self):
+        instance = self.basic.instantiate(3, draw=7)
+        self.assertIs(instance.template, self.basic)
+        self.assertEqual(instance.sector, 3)
+        self.assertEqual(instance.draw, 7)
+        self.assertEqual(self.basic.sector, 1)
+        self.assertTrue(instance.isDemand())
+        self.assertEqual(instance.getValueAt(0), 1)
+        self.assertIs(instance.instantiate(4).template, self.basic)
 
 """
 Test cases for L{ofspy.event.ValueSchedule} class.
@@ -113,6 +122,12 @@ class ValueScheduleTestCase(unittest.TestCase):
         self.assertEqual(self.nonZeroTime.getDefaultTime(), 1)
         self.assertEqual(self.multipleTimes.getDefaultTime(), 1)
         self.assertEqual(self.outOfOrderTimes.getDefaultTime(), 1)
+    def test_getValues(self):
+        self.assertEqual(self.default.getValues(0, 3), (0, 0, 0))
+        self.assertEqual(self.nonZeroTime.getValues(0, 3), (1, 1, -1))
+        self.assertEqual(self.multipleTimes.getValues(1, 3), (1, -1, -1))
+        self.assertEqual(self.multipleTimes.getValues(-1, 2), (2, 2))
+        self.assertEqual(self.nonZeroTime.getValueAt(0.5), 1)
 
 """
 Test cases for L{ofspy.event.Disturbance} class.
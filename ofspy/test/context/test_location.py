@@ -21,7 +21,7 @@ Test cases for L{ofspy.location} package.
 
 import unittest
 
-from ...context.location import Location, Surface, Orbit
+from ...context.location import Location, Surface, Orbit, SURFACE, SPEEDS, SENSING, getLevel
 
 """
 Test cases for L{ofspy.location.Location} class.
@@ -64,3 +64,13 @@ class OrbitTestCase(unittest.TestCase):
         self.assertFalse(self.default.isSurface())
     def test_isOrbit(self):
         self.assertTrue(self.default.isOrbit())
+    def test_level(self):
+        self.assertEqual(Surface(0).level, SURFACE)
+        self.assertEqual(self.default.level, getLevel("LEO"))
+        self.assertEqual(SPEEDS[Orbit(0, "MEO").level], 1)
+        self.assertFalse(SENSING[Orbit(0, "GEO").level])
+        self.assertNotEqual(self.default.code, Orbit(1, "LEO").code)
+        self.assertNotEqual(self.default.code, Orbit(0, "MEO").code)
+        self.assertEqual(self.default.code, Orbit(0, "LEO").code)
+        self.assertRaises(ValueError, Orbit, 0, "HEO")
+        self.assertEqual(getLevel("GEO"), len(SPEEDS) - 1)
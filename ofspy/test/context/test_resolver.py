@@ -0,0 +1,56 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+Copyright 2017 Paul T. Grogan, Stevens Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import random
+import unittest
+
+from ...context.resolver import DisturbanceResolver
+
+"""
+Test cases for L{ofspy.context.resolver.DisturbanceResolver} class.
+"""
+
+class DisturbanceResolverTestCase(unittest.TestCase):
+    def setUp(self):
+        self.default = DisturbanceResolver()
+        self.modules = ['a', 'b', 'c', 'd']
+    def tearDown(self):
+        self.default = None
+        self.modules = None
+    def test_drawHits(self):
+        results = self.default.drawHits(random.Random(0),
+                                        [(self.modules, 1, 1),
+                                         (self.modules, 0, 1),
+                                         (self.modules, 1, 4)])
+        self.assertEqual(len(results), 3)
+        for order, hits in results:
+            self.assertEqual(sorted(order), self.modules)
+        self.assertEqual(len(results[0][1]), 1)
+        self.assertEqual(results[0][1][0], results[0][0][0])
+        self.assertEqual(results[1][1], [])
+        self.assertEqual(results[2][1], results[2][0])
+        self.assertEqual(results, self.default.drawHits(
+            random.Random(0), [(self.modules, 1, 1),
+                               (self.modules, 0, 1),
+                               (self.modules, 1, 4)]))
+    def test_drawHitsStream(self):
+        stream = random.Random(0)
+        self.default.drawHits(stream, [(self.modules, 1, 1)])
+        reference = random.Random(0)
+        for i in range(len(self.modules)):
+            reference.random()
+        self.assertEqual(stream.random(), reference.random())
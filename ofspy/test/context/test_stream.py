@@ -0,0 +1,83 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+Copyright 2017 Paul T. Grogan, Stevens Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import random
+import unittest
+
+from ...context.stream import StreamManager, getDraws, getHits, shuffle
+
+"""
+Test cases for L{ofspy.context.stream} package.
+"""
+
+class StreamTestCase(unittest.TestCase):
+    def test_getDraws(self):
+        stream = random.Random(0)
+        reference = random.Random(0)
+        self.assertEqual(getDraws(stream, 5),
+                         [reference.random() for i in range(5)])
+        self.assertEqual(getDraws(stream, 0), [])
+    def test_shuffle(self):
+        items = list(range(10))
+        shuffle(items, random.Random(0))
+        self.assertEqual(sorted(items), list(range(10)))
+        reference = list(range(10))
+        draws = random.Random(0).random
+        for i in reversed(range(1, len(reference))):
+            j = int(draws() * (i+1))
+            reference[i], reference[j] = reference[j], reference[i]
+        self.assertEqual(items, reference)
+        items = []
+        shuffle(items, random.Random(0))
+        self.assertEqual(items, [])
+    def test_getHits(self):
+        items = ['a', 'b', 'c', 'd']
+        self.assertEqual(getHits(items, 1, 2, random.Random(0)), ['a', 'b'])
+        self.assertEqual(getHits(items, 0, 2, random.Random(0)), [])
+        stream = random.Random(0)
+        getHits(items, 1, 1, stream)
+        reference = random.Random(0)
+        reference.random()
+        self.assertEqual(stream.random(), reference.random())
+
+class StreamManagerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.default = StreamManager(0)
+    def tearDown(self):
+        self.default = None
+    def test_getSeed(self):
+        self.assertEqual(self.default.getSeed('roll', 'F1'),
+                         StreamManager(0).getSeed('roll', 'F1'))
+        self.assertNotEqual(self.default.getSeed('roll', 'F1'),
+                            self.default.getSeed('roll', 'F2'))
+        self.assertNotEqual(self.default.getSeed('roll', 'F1'),
+                            StreamManager(1).getSeed('roll', 'F1'))
+    def test_getStream(self):
+        stream = self.default.getStream('order')
+        self.assertIs(self.default.getStream('order'), stream)
+        first = stream.random()
+        self.assertEqual(StreamManager(0).getStream('order').random(), first)
+        # streams do not depend on the order they are created
+        manager = StreamManager(0)
+        manager.getStream('shuffle')
+        self.assertEqual(manager.getStream('order').random(), first)
+    def test_spawn(self):
+        child = self.default.spawn('worker', 3)
+        self.assertEqual(child.getSeed('order'),
+                         self.default.getSeed('worker', 3, 'order'))
+        self.assertNotEqual(child.getSeed('order'),
+                            self.default.getSeed('order'))
@@ -0,0 +1,119 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+"""
+Test cases for L{ofspy.optimize.adaptive} package.
+"""
+
+import statistics
+import unittest
+
+from ...game import Game
+from ...optimize.adaptive import (AdaptiveEvaluator, RunningStats,
+                                  getCriticalValue)
+from ...optimize.design import DesignSpace
+from ...optimize.nsga import NSGAOptimizer
+from ...optimize.pareto import ParetoFront
+
+class FakeService(object):
+    """
+    Simulates designs whose final cash is their first element (a number)
+    plus the seed times their second element (a spread).
+    """
+    def __init__(self):
+        self.stats = {'executed': 0}
+
+    def evaluate(self, jobs):
+        for job in jobs:
+            self.stats['executed'] += 1
+            mean, spread = job['elements']
+            cash = mean + spread*(1 if job['seed'] % 2 else -1)
+            yield {'id': job['id'],
+                   'results': [{'federate': 'P1', 'finalCash': cash},
+                               {'federate': 'P2', 'finalCash': 0}]}
+
+class RunningStatsTestCase(unittest.TestCase):
+    def test_add(self):
+        samples = [3., 1., 4., 1., 5., 9., 2., 6.]
+        stats = RunningStats()
+        self.assertEqual(stats.getHalfWidth(1.96), float('inf'))
+        for x in samples:
+            stats.add(x)
+        self.assertEqual(stats.count, len(samples))
+        self.assertAlmostEqual(stats.mean, statistics.mean(samples))
+        self.assertAlmostEqual(stats.getVariance(),
+                               statistics.variance(samples))
+        self.assertAlmostEqual(stats.getHalfWidth(2.),
+                               2*statistics.stdev(samples)/8**0.5)
+
+    def test_getCriticalValue(self):
+        self.assertAlmostEqual(getCriticalValue(0.95), 1.96, places=2)
+
+class AdaptiveEvaluatorTestCase(unittest.TestCase):
+    def setUp(self):
+        self.service = FakeService()
+        self.default = AdaptiveEvaluator(self.service, width=10,
+                                         batchSize=2, minSeeds=4,
+                                         maxSeeds=16)
+
+    def test_evaluate(self):
+        summaries = self.default.evaluate([(100, 0), (200, 1), (300, 50)],
+                                          [1, 2, 3])
+        # constant values stop at the minimum number of seeds
+        self.assertEqual(summaries[0]['numSeeds'], 4)
+        self.assertEqual(summaries[0]['value'], 100)
+        self.assertEqual(summaries[0]['halfWidth'], 0)
+        # small spreads converge, large spreads run out of seeds
+        self.assertTrue(4 <= summaries[1]['numSeeds'] < 16)
+        self.assertTrue(2*summaries[1]['halfWidth'] <= 10)
+        self.assertEqual(summaries[2]['numSeeds'], 16)
+        self.assertAlmostEqual(summaries[2]['value'], 300)
+        self.assertFalse(any(s['dominated'] for s in summaries))
+        self.assertEqual(set(summaries[2]['stats']), set(['P1', 'P2']))
+        self.assertEqual(self.service.stats['executed'],
+                         sum(s['numSeeds'] for s in summaries))
+        self.assertEqual(self.default.numSimulations,
+                         self.service.stats['executed'])
+
+    def test_evaluate_dominated(self):
+        front = ParetoFront()
+        front.add(0, 1000)
+        summaries = self.default.evaluate([(100, 50), (2000, 50)],
+                                          [1, 1], front)
+        # dominated designs stop at the minimum number of seeds
+        self.assertTrue(summaries[0]['dominated'])
+        self.assertEqual(summaries[0]['numSeeds'], 4)
+        self.assertFalse(summaries[1]['dominated'])
+        self.assertEqual(summaries[1]['numSeeds'], 16)
+
+class AdaptiveOptimizerTestCase(unittest.TestCase):
+    def test_run(self):
+        space = DesignSpace(Game(numPlayers=1, initialCash=0),
+                            maxElements=2)
+        optimizer = NSGAOptimizer(space, populationSize=4, numWorkers=1,
+                                  ops='n', numTurns=2)
+        optimizer.evaluator = AdaptiveEvaluator(
+            optimizer.service, width=10, minSeeds=2, batchSize=2,
+            ops='n', numTurns=2)
+        try:
+            optimizer.run(1)
+            # deterministic operations converge at the minimum seeds
+            self.assertEqual(optimizer.service.stats['executed'],
+                             2*len(optimizer.evaluations))
+            self.assertEqual(optimizer.evaluator.numSimulations,
+                             2*len(optimizer.evaluations))
+        finally:
+            optimizer.close()
@@ -0,0 +1,100 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+"""
+Test cases for L{ofspy.optimize.design} package.
+"""
+
+import random
+import unittest
+
+from ...game import Game
+from ...optimize.design import DesignSpace
+
+class DesignSpaceTestCase(unittest.TestCase):
+    def setUp(self):
+        self.default = DesignSpace(Game(numPlayers=1, initialCash=0),
+                                   maxElements=3)
+        self.design = ('1.SmallSat@MEO6,VIS,pSGL', '1.GroundSta@SUR1,pSGL')
+
+    def tearDown(self):
+        self.default = None
+        self.design = None
+
+    def test_canonicalize(self):
+        self.assertEqual(self.default.canonicalize(self.design),
+                         ('1.GroundSta@SUR1,pSGL', '1.SmallSat@MEO6,VIS,pSGL'))
+        self.assertEqual(self.default.canonicalize(self.design),
+                         self.default.canonicalize(self.design[::-1]))
+
+    def test_getCost(self):
+        # 500+50 station; 200+250+50 satellite with 100 to commission in MEO
+        self.assertEqual(self.default.getCost(self.design), 1150)
+        self.assertEqual(self.default.getCost(('1.LargeSat@GEO1',)), 800)
+
+    def test_getElementCost(self):
+        self.assertEqual(self.default.getElementCost(
+            'SmallSat', 'MEO6', ['VIS', 'pSGL']), 600)
+        self.assertEqual(self.default.getElementCost(
+            'GroundSta', 'SUR1', ['pSGL']), 550)
+
+    def test_rotate(self):
+        self.assertEqual(self.default.rotate(self.design, 1),
+                         ('1.GroundSta@SUR2,pSGL', '1.SmallSat@MEO1,VIS,pSGL'))
+        self.assertEqual(self.default.rotate(self.design, 6),
+                         self.default.canonicalize(self.design))
+
+    def test_getSymmetricForm(self):
+        form = self.default.getSymmetricForm(self.design)
+        for k in range(6):
+            self.assertEqual(self.default.getSymmetricForm(
+                self.default.rotate(self.design, k)), form)
+        self.assertEqual(form, ('1.GroundSta@SUR1,pSGL',
+                                '1.SmallSat@MEO6,VIS,pSGL'))
+
+    def test_getCapacity(self):
+        self.assertEqual(self.default.getElementTypes(),
+                         ['GroundSta', 'SmallSat', 'MediumSat', 'LargeSat'])
+        self.assertEqual(self.default.getCapacity('SmallSat'), 2)
+        self.assertEqual(self.default.getModulesSize(['VIS', 'pSGL']), 2)
+        self.assertEqual(self.default.getModulesSize([]), 0)
+
+    def test_isValid(self):
+        self.assertTrue(self.default.isValid(self.design))
+        self.assertFalse(self.default.isValid(()))
+        self.assertFalse(self.default.isValid(
+            ('1.SmallSat@MEO6,VIS,pSGL,SAR',)))
+        self.assertFalse(self.default.isValid(('1.SmallSat@SUR1,VIS',)))
+        self.assertFalse(self.default.isValid(('1.GroundSta@LEO1,pSGL',)))
+        self.assertFalse(self.default.isValid(('1.GroundSta@SUR1,VIS',)))
+        self.assertFalse(self.default.isValid(('1.GroundSta@SUR1,pSGL',
+                                               '1.GroundSta@SUR1,oSGL')))
+        self.assertFalse(self.default.isValid(('1.TinySat@LEO1',)))
+        self.assertFalse(self.default.isValid(('1.SmallSat',)))
+        self.assertFalse(self.default.isValid(('1.SmallSat@LEO1',)*4))
+
+    def test_variation(self):
+        rng = random.Random(0)
+        for i in range(50):
+            design = self.default.generateDesign(rng)
+            self.assertTrue(self.default.isValid(design))
+            self.assertEqual(design, self.default.canonicalize(design))
+            child = self.default.mutate(design, rng)
+            self.assertEqual(child, self.default.canonicalize(child))
+            child = self.default.crossover(design, self.design, rng)
+            self.assertTrue(0 < len(child) <= 3)
+            self.assertTrue(all(e in design + self.design for e in child))
@@ -0,0 +1,68 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+"""
+Test cases for L{ofspy.optimize.enumeration} package.
+"""
+
+import random
+import unittest
+
+from ...game import Game
+from ...optimize.design import DesignSpace
+from ...optimize.enumeration import enumerateDesigns, getElementChoices
+
+class EnumerationTestCase(unittest.TestCase):
+    def setUp(self):
+        self.space = DesignSpace(Game(numPlayers=1, initialCash=0),
+                                 maxElements=2)
+        self.budget = 600
+
+    def tearDown(self):
+        self.space = None
+
+    def test_getElementChoices(self):
+        choices = getElementChoices(self.space, self.budget)
+        self.assertEqual(choices, sorted(choices))
+        self.assertTrue(all(cost <= self.budget for cost, spec, station
+                            in choices))
+        self.assertIn((250, '1.SmallSat@LEO1,DAT', None), choices)
+        self.assertIn((550, '1.GroundSta@SUR3,pSGL', 'SUR3'), choices)
+
+    def test_enumerateDesigns(self):
+        designs = list(enumerateDesigns(self.space, self.budget))
+        self.assertEqual(len(designs), len(set(d for c, d in designs)))
+        for cost, design in designs:
+            self.assertTrue(cost <= self.budget)
+            self.assertEqual(cost, self.space.getCost(design))
+            self.assertEqual(design, self.space.canonicalize(design))
+            self.assertTrue(self.space.isValid(design))
+        # every random design within budget is enumerated
+        enumerated = set(d for c, d in designs)
+        rng = random.Random(0)
+        for i in range(500):
+            design = self.space.generateDesign(rng)
+            if self.space.getCost(design) <= self.budget:
+                self.assertIn(design, enumerated)
+
+    def test_enumerateDesigns_symmetric(self):
+        designs = set(d for c, d in enumerateDesigns(self.space,
+                                                     self.budget))
+        forms = set(d for c, d in enumerateDesigns(self.space, self.budget,
+                                                   symmetric=True))
+        self.assertTrue(len(forms) < len(designs))
+        self.assertEqual(forms, set(self.space.getSymmetricForm(d)
+                                    for d in designs))
@@ -0,0 +1,69 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+"""
+Test cases for L{ofspy.optimize.nsga} package.
+"""
+
+import unittest
+
+from ...game import Game
+from ...optimize.design import DesignSpace
+from ...optimize.nsga import (NSGAOptimizer, getCrowdingDistances,
+                              sortNondominated)
+from ...optimize.pareto import dominates
+
+class NSGATestCase(unittest.TestCase):
+    def test_sortNondominated(self):
+        objectives = [(1, 5), (2, 3), (3, 4), (4, 1), (5, 5), (2, 3)]
+        self.assertEqual(sortNondominated(objectives),
+                         [[0, 1, 3, 5], [2], [4]])
+
+    def test_getCrowdingDistances(self):
+        objectives = [(0, 4), (1, 2), (3, 1), (4, 0)]
+        distances = getCrowdingDistances(objectives, [0, 1, 2, 3])
+        self.assertEqual(distances[0], float('inf'))
+        self.assertEqual(distances[3], float('inf'))
+        self.assertAlmostEqual(distances[1], 3/4. + 3/4.)
+        self.assertAlmostEqual(distances[2], 3/4. + 2/4.)
+
+class NSGAOptimizerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.space = DesignSpace(Game(numPlayers=1, initialCash=0),
+                                 maxElements=2)
+        self.default = NSGAOptimizer(self.space, populationSize=6,
+                                     seeds=[0, 1], numWorkers=1,
+                                     ops='n', numTurns=2)
+
+    def tearDown(self):
+        self.default.close()
+        self.default = None
+        self.space = None
+
+    def test_run(self):
+        front = self.default.run(2)
+        self.assertEqual(len(self.default.population), 6)
+        self.assertTrue(all(self.space.isValid(d)
+                            for d in self.default.population))
+        # every distinct design is simulated once per seed
+        self.assertEqual(self.default.service.stats['executed'],
+                         2*len(self.default.evaluations))
+        points = [(c, v) for c, v, d in front]
+        for cost, value in self.default.evaluations.values():
+            self.assertFalse(any(dominates((cost, value), p) for p in points))
+        for cost, value, design in front:
+            self.assertEqual(self.default.evaluations[design], (cost, value))
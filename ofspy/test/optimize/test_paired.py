@@ -0,0 +1,51 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+"""
+Test cases for L{ofspy.optimize.paired} package.
+"""
+
+import unittest
+
+from ...optimize.paired import comparePaired
+
+class FakeService(object):
+    """
+    Simulates designs whose final cash is the seed plus their number of
+    elements times 100, recording the jobs.
+    """
+    def __init__(self):
+        self.jobs = []
+
+    def evaluate(self, jobs):
+        for job in jobs:
+            self.jobs.append(job)
+            yield {'id': job['id'],
+                   'results': [{'federate': 'P1', 'finalCash':
+                                job['seed'] + 100*len(job['elements'])}]}
+
+class PairedTestCase(unittest.TestCase):
+    def test_comparePaired(self):
+        service = FakeService()
+        comparison = comparePaired(service, ['a', 'b', 'c'], ['a'],
+                                   seeds=range(5), ops='n')
+        self.assertTrue(all(job['crn'] for job in service.jobs))
+        self.assertTrue(all(job['ops'] == 'n' for job in service.jobs))
+        self.assertEqual(len(service.jobs), 10)
+        # the seed noise cancels out of the paired differences
+        self.assertEqual(comparison['P1']['differences'], [200]*5)
+        self.assertEqual(comparison['P1']['mean'], 200)
+        self.assertEqual(comparison['P1']['halfWidth'], 0)
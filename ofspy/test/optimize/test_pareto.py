@@ -0,0 +1,51 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+"""
+Test cases for L{ofspy.optimize.pareto} package.
+"""
+
+import unittest
+
+from ...optimize.pareto import ParetoFront, dominates
+
+class ParetoFrontTestCase(unittest.TestCase):
+    def setUp(self):
+        self.default = ParetoFront()
+
+    def tearDown(self):
+        self.default = None
+
+    def test_dominates(self):
+        self.assertTrue(dominates((1, 2), (2, 2)))
+        self.assertTrue(dominates((1, 2), (1, 1)))
+        self.assertFalse(dominates((1, 2), (1, 2)))
+        self.assertFalse(dominates((1, 2), (2, 3)))
+
+    def test_add(self):
+        self.assertTrue(self.default.add(500, 1000, 'a'))
+        self.assertTrue(self.default.add(1000, 2000, 'b'))
+        self.assertFalse(self.default.add(1200, 1500, 'c'))
+        self.assertFalse(self.default.add(500, 1000, 'd'))
+        self.assertTrue(self.default.add(200, 800, 'e'))
+        self.assertEqual([p[2] for p in self.default], ['e', 'a', 'b'])
+        # dominates a and b
+        self.assertTrue(self.default.add(500, 2500, 'f'))
+        self.assertEqual(self.default.getPoints(),
+                         [(200, 800, 'e'), (500, 2500, 'f')])
+        self.assertTrue(self.default.isDominated(600, 2000))
+        self.assertFalse(self.default.isDominated(100, 0))
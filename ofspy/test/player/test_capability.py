@@ -0,0 +1,63 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+Copyright 2017 Paul T. Grogan, Stevens Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+"""
+Test cases for L{ofspy.player.capability} package.
+"""
+
+import unittest
+
+from ...player.capability import Registry, PROTOCOLS
+from ...game import Game
+
+class RegistryTestCase(unittest.TestCase):
+    def setUp(self):
+        self.default = Registry()
+        self.test = Registry(isOpen=lambda name: 'o' in name)
+
+    def tearDown(self):
+        self.default = None
+        self.test = None
+
+    def test_register(self):
+        self.assertEqual(self.default.register('SAR'), 1)
+        self.assertEqual(self.default.register('VIS'), 2)
+        self.assertEqual(self.default.register('SAR'), 1)
+        self.assertEqual(self.default.register(None), 0)
+        self.assertEqual(self.default.getNames(), ['SAR', 'VIS'])
+
+    def test_getMask(self):
+        self.assertEqual(self.default.getMask(['VIS', 'SAR', None]), 3)
+        self.assertEqual(self.default.getNames(2), ['SAR'])
+        self.assertEqual(self.default.getNames(3), ['VIS', 'SAR'])
+        self.assertEqual(self.default.getNames(0), [])
+
+    def test_isOpen(self):
+        self.assertFalse(self.default.isOpen('oSGL'))
+        self.assertTrue(self.test.isOpen('oSGL'))
+        self.assertFalse(self.test.isOpen('pSGL'))
+        self.test.register('pSGL', isOpen=True)
+        self.assertTrue(self.test.isOpen('pSGL'))
+        self.assertEqual(self.test.getOpenMask(),
+                         self.test.getMask(['oSGL', 'pSGL']))
+
+    def test_game(self):
+        Game(numPlayers=1, initialCash=1200)
+        self.assertTrue(PROTOCOLS.isOpen('oSGL'))
+        self.assertTrue(PROTOCOLS.isOpen('oISL'))
+        self.assertFalse(PROTOCOLS.isOpen('pSGL'))
+        self.assertFalse(PROTOCOLS.isOpen('pISL'))
@@ -154,3 +154,20 @@ class ContractTestCase(unittest.TestCase):
         self.contract2.tock()
         self.assertEqual(self.contract1.elapsedTime, 2*self.sim.timeStep)
         self.assertEqual(self.contract2.elapsedTime, 2*self.sim.timeStep)
+
+    def test_bind(self):
+        self.sim.init()
+        contract = Contract(Demand(0, 'SAR', 1,
+                                   ValueSchedule([(1,4), (2,2)],-1)),
+                            clock=self.sim)
+        contract.init(self.sim)
+        self.assertEqual(contract.startTime, self.sim.time)
+        self.assertEqual(contract.getDeadline(), self.sim.time + 2)
+        self.assertEqual(contract.elapsedTime, 0)
+        self.sim.advance()
+        self.assertEqual(contract.elapsedTime, self.sim.timeStep)
+        self.assertEqual(contract.getValue(), 4)
+        self.sim.advance()
+        self.assertEqual(contract.elapsedTime, 2*self.sim.timeStep)
+        self.assertEqual(contract.getValue(), 2)
+        self.assertFalse(contract.isDefaulted(self.orbit))
@@ -20,6 +20,8 @@ Test cases for L{ofspy.player.Data} class.
 
 import unittest
 
+from ...player import Data
+
 class DataTestCase(unittest.TestCase):
     def setUp(self):
         self.sar0 = Data('SAR',0)
@@ -27,3 +29,8 @@ class DataTestCase(unittest.TestCase):
     def tearDown(self):
         self.sar0 = None
         self.sar1 = None
+
+    def test_slots(self):
+        self.assertFalse(hasattr(self.sar0, '__dict__'))
+        self.assertEqual(self.sar1.size, 1)
+        self.assertRaises(AttributeError, setattr, self.sar1, 'foo', 0)
@@ -28,6 +28,7 @@ from ...simulation import Simulator
 
 from ...player.element import Element, GroundStation, Satellite
 from ...player import Contract, Data
+from ...player.capability import PROTOCOLS, PHENOMENA
 from ...player.module import Defense, Storage, Sensor, SpaceGroundLink, InterSatelliteLink
 
 """
@@ -129,6 +130,31 @@ class ElementTestCase(unittest.TestCase):
         self.assertFalse(self.default.getDecommissionValue())
         self.assertFalse(self.test1.getDecommissionValue())
 
+    def test_getLinks(self):
+        self.assertEqual(self.test0.getLinks('pSGL'), [self.test0.modules[0]])
+        self.assertEqual(self.test0.getLinks('pISL'), [])
+        self.assertEqual(self.test3.getLinks('pISL'), self.test3.modules[1:3])
+        self.test3.removeModule(self.test3.modules[1])
+        self.assertEqual(self.test3.getLinks('pISL'), [self.test3.modules[1]])
+
+    def test_getProtocolMask(self):
+        self.assertEqual(self.default.getProtocolMask(), 0)
+        self.assertEqual(self.test3.getSGLMask(), PROTOCOLS.getBit('pSGL'))
+        self.assertEqual(self.test3.getISLMask(), PROTOCOLS.getBit('pISL'))
+        self.assertEqual(self.test3.getProtocolMask(),
+                         PROTOCOLS.getMask(['pSGL', 'pISL']))
+        self.assertEqual(self.test3.getSharedProtocolMask(self.test2),
+                         PROTOCOLS.getBit('pISL'))
+        self.assertEqual(self.test1.getSharedProtocolMask(self.test2), 0)
+        self.test3.removeModule(self.test3.modules[3])
+        self.assertEqual(self.test3.getSGLMask(), 0)
+
+    def test_getPhenomenonMask(self):
+        self.assertEqual(self.test0.getPhenomenonMask(), 0)
+        self.assertEqual(self.test1.getPhenomenonMask(), PHENOMENA.getBit('SAR'))
+        self.assertEqual(self.test4.getPhenomenonMask(),
+                         PHENOMENA.getMask(['SAR', 'VIS']))
+
     def test_couldTransmit(self):
         self.assertTrue(self.test1.couldTransmit(
             'pSGL', self.testData[0], self.test0,
@@ -331,6 +357,25 @@ class ElementTestCase(unittest.TestCase):
                             for m in self.test4.modules))
         self.assertFalse(self.test4.store(self.testData[3]))
 
+    def test_getContainer(self):
+        self.test4.commission(self.testLocs[1], self.context)
+        self.assertIsNone(self.test4.getContainer(self.testData[0]))
+        self.test4.store(self.testData[0])
+        self.assertIs(self.test4.getContainer(self.testData[0]),
+                      self.test4.modules[2])
+        self.test4.store(self.testData[1])
+        self.assertIs(self.test4.getContainer(self.testData[1]),
+                      self.test4.modules[1])
+        self.test4.modules[1].transferOut(self.testData[1])
+        self.assertIsNone(self.test4.getContainer(self.testData[1]))
+        self.test4.modules[3].transferIn(self.testData[1])
+        self.assertIs(self.test4.getContainer(self.testData[1]),
+                      self.test4.modules[3])
+        self.test4.tock()
+        self.assertIsNone(self.test4.getContainer(self.testData[1]))
+        self.assertIs(self.test4.getContainer(self.testData[0]),
+                      self.test4.modules[2])
+
     def test_couldSense(self):
         self.assertFalse(self.test0.couldSense(self.testData[0]))
         self.assertFalse(self.test0.couldSense(self.testData[2]))
@@ -340,6 +385,15 @@ class ElementTestCase(unittest.TestCase):
         self.assertTrue(self.test4.couldSense(self.testData[0]))
         self.assertTrue(self.test4.couldSense(self.testData[2]))
 
+    def test_couldSensePhenomenon(self):
+        self.assertFalse(self.test0.couldSensePhenomenon('SAR', 1))
+        self.assertTrue(self.test1.couldSensePhenomenon('SAR', 1))
+        self.assertFalse(self.test1.couldSensePhenomenon('VIS', 1))
+        self.assertFalse(self.test1.couldSensePhenomenon('SAR', 2))
+        self.assertTrue(self.test4.couldSensePhenomenon('VIS', 1))
+        self.test4.removeModule(self.test4.modules[0])
+        self.assertFalse(self.test4.couldSensePhenomenon('VIS', 1))
+
     def test_canSense(self):
         self.test0.commission(self.testLocs[0], self.context)
         self.assertFalse(self.test0.canSense(Demand(0,'SAR',1)))
@@ -417,6 +471,18 @@ class ElementTestCase(unittest.TestCase):
         self.assertEqual(self.test4.getSensed('SAR'), 0)
         self.assertEqual(self.test4.getSensed('VIS'), 0)
 
+    def test_removeModule(self):
+        self.assertTrue(self.test4.removeModule(self.test4.modules[1]))
+        self.assertEqual(len(self.test4.modules), 3)
+        self.assertEqual(self.test4.getMaxSensed(), 1)
+        self.assertEqual(self.test4.getMaxSensed('SAR'), 0)
+        self.assertEqual(self.test4.getMaxStored('SAR'), 1)
+        self.assertEqual(self.test4.getMaxStored('VIS'), 1+1)
+        self.assertTrue(self.test4.removeModule(self.test4.modules[2]))
+        self.assertEqual(self.test4.getMaxTransmitted('pSGL'), 0)
+        self.assertEqual(self.test4.getMaxReceived('pSGL'), 0)
+        self.assertFalse(self.test4.removeModule(self.test0.modules[0]))
+
     def test_getMaxStored(self):
         self.assertEqual(self.test0.getMaxStored(), 0)
         self.assertEqual(self.test1.getMaxStored(), 1)
@@ -151,6 +151,13 @@ class ModuleTestCase(unittest.TestCase):
         self.cap2.transferOut(self.testData[4])
         self.assertTrue(self.testData[4] not in self.cap2.data)
 
+    def test_container(self):
+        self.assertIsNone(self.testData[0].container)
+        self.cap1.transferIn(self.testData[0])
+        self.assertIs(self.testData[0].container, self.cap1)
+        self.cap1.transferOut(self.testData[0])
+        self.assertIsNone(self.testData[0].container)
+
     def test_canExchange(self):
         self.cap1.transferIn(self.testData[0])
         self.cap2.transferIn(self.testData[1])
@@ -322,6 +329,12 @@ class SensorTestCase(unittest.TestCase):
         self.assertTrue(self.sensors[3].couldSense(Data('VIS',1)))
         self.assertTrue(self.sensors[3].couldSense(Data('VIS',2)))
 
+    def test_couldSensePhenomenon(self):
+        self.assertTrue(self.sensors[0].couldSensePhenomenon('SAR', 1))
+        self.assertFalse(self.sensors[0].couldSensePhenomenon('SAR', 2))
+        self.assertFalse(self.sensors[0].couldSensePhenomenon('VIS', 1))
+        self.assertTrue(self.sensors[3].couldSensePhenomenon('VIS', 2))
+
     def test_canSense(self):
         self.assertTrue(self.sensors[0].canSense(
             Orbit(0,'LEO'), Demand(0,'SAR',1)))
@@ -25,8 +25,10 @@ import logging
 
 from ...game import Game
 from ...simulation import Simulator
-from ...player.operations import Operations
+from ...player import Data
+from ...player.operations import Operations, getOperations
 from ...player.operations.dynamic import DynamicOperations
+from ...player.operations.path import PathDynamicOperations
 
 """
 Test cases for L{ofspy.operations.Operations} package.
@@ -53,6 +55,11 @@ class OperationsTestCase(unittest.TestCase):
         self.sat2 = None
         self.sat3 = None
 
+class OperationsGetOperationsTestCase(unittest.TestCase):
+    def test_getOperations(self):
+        self.assertIs(getOperations('d'), DynamicOperations)
+        self.assertIs(getOperations('p'), PathDynamicOperations)
+
 class OperationsGetStoragePenaltyTestCase(OperationsTestCase):
     def test_getStoragePenalty(self):
         self.sim.init()
@@ -85,3 +92,77 @@ class DynamicOperationsExecuteTestCase(OperationsTestCase):
         self.fed.commission(self.sat1, self.context.locations[1], self.context)
         self.sim.advance()
         self.fed.operations.execute(self.fed, self.context)
+
+"""
+Test cases for L{ofspy.operations.PathDynamicOperations} package.
+"""
+
+class Selected(object):
+    """
+    A solved binary variable selected in the solution.
+    """
+    x = 1
+
+class PathDynamicOperationsTestCase(OperationsTestCase):
+    def test_getRoutes(self):
+        ops = PathDynamicOperations()
+        adjacency = [[(1, 0)], [(0, 0), (2, 0)], [(1, 0)]]
+        self.assertEqual(ops.getRoutes(adjacency),
+                         [((0, 1, 0),), ((0, 1, 0), (1, 2, 0)),
+                          ((1, 0, 0),), ((1, 2, 0),),
+                          ((2, 1, 0),), ((2, 1, 0), (1, 0, 0))])
+        ops.maxHops = 1
+        self.assertEqual(ops.getRoutes(adjacency),
+                         [((0, 1, 0),), ((1, 0, 0),),
+                          ((1, 2, 0),), ((2, 1, 0),)])
+        ring = [[(j, 0) for j in range(12)
+                 if j != i and (i - j) % 6 in (0, 1, 5)]
+                for i in range(12)]
+        self.assertEqual(len(PathDynamicOperations().getRoutes(ring)), 300)
+
+    def test_getAdjacency(self):
+        self.sim.init()
+        sats = [self.game.generateElement('SmallSat', pId=0, eId=i,
+                                          mTypes=['pISL', 'SAR'])
+                for i in range(3)]
+        for sat, location in zip(sats, [1, 5, 13]):
+            self.fed.design(sat)
+            self.fed.commission(sat, self.context.locations[location],
+                                self.context)
+        adjacency = PathDynamicOperations().getAdjacency(
+            self.fed, self.context, sats, ['pISL'], 1, self.context.time)
+        self.assertEqual(adjacency, [[(1, 0)], [(0, 0)], []])
+
+    def test_transportISL(self):
+        self.sim.init()
+        sats = [self.game.generateElement('SmallSat', pId=0, eId=i,
+                                          mTypes=['pISL', 'SAR'])
+                for i in range(3)]
+        for sat, location in zip(sats, [1, 5, 13]):
+            self.fed.design(sat)
+            self.fed.commission(sat, self.context.locations[location],
+                                self.context)
+        data = Data('SAR', 1)
+        sats[0].modules[1].transferIn(data)
+        ops = PathDynamicOperations()
+        # the second hop is out of range so nothing is moved
+        route = ((0, 1, 0), (1, 2, 0))
+        self.assertIsNone(ops.transportISL(
+            self.fed, self.context, [[(route, Selected())]], sats,
+            ['pISL'], 0, 0, data))
+        self.assertIs(data.container, sats[0].modules[1])
+        route = ((0, 1, 0),)
+        self.assertIs(ops.transportISL(
+            self.fed, self.context, [[(route, Selected())]], sats,
+            ['pISL'], 0, 0, data), sats[1])
+        self.assertIs(data.container.element, sats[1])
+
+    def test_execute(self):
+        self.fed.operations = PathDynamicOperations()
+        self.sim.init()
+        self.fed.design(self.station)
+        self.fed.commission(self.station, self.context.locations[0], self.context)
+        self.fed.design(self.sat1)
+        self.fed.commission(self.sat1, self.context.locations[1], self.context)
+        self.sim.advance()
+        self.fed.operations.execute(self.fed, self.context)
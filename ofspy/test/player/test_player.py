@@ -24,23 +24,87 @@ import logging
 
 #logging.disable(logging.WARNING)
 
-from ...player import Contract, Data, Federation, Federate
+from ...player import Contract, Data, Federation, Federate, View
 from ...context.event import Demand, ValueSchedule
 from ...context.location import Surface, Orbit
 from ...context import Context
 from ...game import Game
 from ...simulation import Simulator
 
+"""
+Test cases for L{ofspy.player.View} class.
+"""
+
+class ViewTestCase(unittest.TestCase):
+    def setUp(self):
+        self.a = Data('SAR', 1)
+        self.b = Data('VIS', 1)
+        self.c = Data('VIS', 2)
+        self.default = View([self.a, self.b])
+
+    def tearDown(self):
+        self.a = None
+        self.b = None
+        self.c = None
+        self.default = None
+
+    def test_contains(self):
+        self.assertIn(self.a, self.default)
+        self.assertIn(self.b, self.default)
+        self.assertNotIn(self.c, self.default)
+        self.assertNotIn(self.a, View())
+
+    def test_sequence(self):
+        self.assertEqual(len(self.default), 2)
+        self.assertEqual(list(self.default), [self.a, self.b])
+        self.assertIs(self.default[1], self.b)
+        self.assertEqual(self.default.index(self.b), 1)
+        self.assertEqual(self.default.count(self.c), 0)
+        self.assertRaises(ValueError, self.default.index, self.c)
+
 """
 Test cases for L{ofspy.player.Federation} class.
 """
 
 class FederationTestCase(unittest.TestCase):
     def setUp(self):
-        pass
+        self.game = Game(numPlayers=2, initialCash=2000)
+        self.context = self.game.generateContext()
+        self.default = self.context.federations[0]
+        self.fed1 = self.default.federates[0]
+        self.fed2 = self.default.federates[1]
+        self.sat1 = self.game.generateElement('SmallSat',pId=0,eId=1,mTypes=['pSGL','SAR'])
+        self.sat2 = self.game.generateElement('SmallSat',pId=1,eId=2,mTypes=['pSGL','VIS'])
 
     def tearDown(self):
-        pass
+        self.game = None
+        self.context = None
+        self.default = None
+        self.fed1 = None
+        self.fed2 = None
+        self.sat1 = None
+        self.sat2 = None
+
+class FederationGetElementsTestCase(FederationTestCase):
+    def test_getElements(self):
+        elements = self.default.getElements()
+        self.assertEqual(len(elements), 0)
+        self.assertIs(self.default.getElements(), elements)
+        self.fed1.design(self.sat1)
+        self.assertIn(self.sat1, self.default.getElements())
+        self.assertNotIn(self.sat1, elements)
+        self.fed2.design(self.sat2)
+        self.assertEqual(list(self.default.getElements()), [self.sat1, self.sat2])
+        self.fed1.decommission(self.sat1)
+        self.assertEqual(list(self.default.getElements()), [self.sat2])
+
+class FederationGetFederatesTestCase(FederationTestCase):
+    def test_getFederates(self):
+        self.assertEqual(list(self.default.getFederates()), [self.fed1, self.fed2])
+        self.assertTrue(self.default.quit(self.fed2))
+        self.assertNotIn(self.fed2, self.default.getFederates())
+        self.assertTrue(self.default.join(self.fed2))
+        self.assertIn(self.fed2, self.default.getFederates())
 
 """
 Test cases for L{ofspy.player.Federate} class.
@@ -49,7 +113,8 @@ Test cases for L{ofspy.player.Federate} class.
 class FederateTestCase(unittest.TestCase):
     def setUp(self):
         self.game = Game(numPlayers=1, initialCash=2000)
-        self.context = self.game.generateContext()
+        # seed dealing VIS demands below sat2 in turns 1 and 2
+        self.context = self.game.generateContext(seed=2)
         self.sim = Simulator(entities=[self.context],
                         initTime=0, timeStep=1, maxTime=3)
         self.default = Federate(name='Default')
@@ -134,7 +199,7 @@ class FederateCanContractTestCase(FederateTestCase):
                             self.context)
         self.sim.advance()
         event = next(e for e in self.context.currentEvents
-                     if e.name == "VIS2.13")
+                     if e.name == "VIS2.15")
         self.assertTrue(self.fed.canContract(event, self.context))
         self.assertFalse(self.fed.canContract(
             next(e for e in self.context.futureEvents), self.context))
@@ -148,7 +213,7 @@ class FederateContractTestCase(FederateTestCase):
                             self.context)
         self.sim.advance()
         event = next(e for e in self.context.currentEvents
-                     if e.name == "VIS2.13")
+                     if e.name == "VIS2.15")
         contract1 = self.fed.contract(event, self.context)
         self.assertIsNot(contract1, None)
         self.assertIn(contract1, self.fed.contracts)
@@ -174,12 +239,12 @@ class FederateCanSenseTestCase(FederateTestCase):
                             self.context)
         self.sim.advance()
         event = next(e for e in self.context.currentEvents
-                     if e.name == "VIS2.13")
+                     if e.name == "VIS2.15")
         self.assertFalse(self.fed.canSense(event, self.sat1, self.context))
         self.assertTrue(self.fed.canSense(event, self.sat2, self.context))
         self.sim.advance()
         event = next(e for e in self.context.currentEvents
-                     if e.name == "VIS3.7")
+                     if e.name == "VIS3.6")
         self.assertTrue(self.fed.canSense(event, self.sat2, self.context))
 
 class FederateSenseAndStoreTestCase(FederateTestCase):
@@ -199,7 +264,7 @@ class FederateSenseAndStoreTestCase(FederateTestCase):
                             self.context)
         self.sim.advance()
         event = next(e for e in self.context.currentEvents
-                     if e.name == "VIS2.13")
+                     if e.name == "VIS2.15")
         contract = self.fed.contract(event, self.context)
         self.assertIsNotNone(contract)
         self.assertTrue(self.fed.senseAndStore(
@@ -207,7 +272,7 @@ class FederateSenseAndStoreTestCase(FederateTestCase):
         self.assertEqual(len(self.sat2.modules[1].data), 1)
         self.sim.advance()
         event = next(e for e in self.context.currentEvents
-                     if e.name == "VIS3.7")
+                     if e.name == "VIS3.6")
         self.assertFalse(self.fed.senseAndStore(
             Contract(event), self.sat2, self.context))
 
@@ -232,14 +297,14 @@ class FederateCanTransportTestCase(FederateTestCase):
                             self.context)
         self.sim.advance()
         event = next(e for e in self.context.currentEvents
-                     if e.name == "VIS2.13")
+                     if e.name == "VIS2.15")
         contract1 = self.fed.contract(event, self.context)
         self.fed.senseAndStore(contract1, self.sat2, self.context)
         data1 = next(d for d in self.sat2.modules[1].data if d.contract is contract1)
         self.assertFalse(self.fed.canTransport('pSGL', data1, self.sat2, self.station, self.context))
         self.sim.advance()
         event = next(e for e in self.context.currentEvents
-                     if e.name == "VIS3.7")
+                     if e.name == "VIS3.6")
         contract2 = self.fed.contract(event, self.context)
         self.fed.senseAndStore(contract2, self.sat3, self.context)
         data2 = next(d for d in self.sat3.modules[1].data if d.contract is contract2)
@@ -269,13 +334,13 @@ class FederateTransportTestCase(FederateTestCase):
                             self.context)
         self.sim.advance()
         event = next(e for e in self.context.currentEvents
-                     if e.name == "VIS2.13")
+                     if e.name == "VIS2.15")
         contract1 = self.fed.contract(event, self.context)
         self.fed.senseAndStore(contract1, self.sat2, self.context)
         data1 = next(d for d in self.sat2.modules[1].data if d.contract is contract1)
         self.sim.advance()
         event = next(e for e in self.context.currentEvents
-                     if e.name == "VIS3.7")
+                     if e.name == "VIS3.6")
         contract2 = self.fed.contract(event, self.context)
         self.fed.senseAndStore(contract2, self.sat3, self.context)
         data2 = next(d for d in self.sat3.modules[1].data if d.contract is contract2)
@@ -304,7 +369,7 @@ class FederateDeleteDataTestCase(FederateTestCase):
                             self.context)
         self.sim.advance()
         event = next(e for e in self.context.currentEvents
-                     if e.name == "VIS2.13")
+                     if e.name == "VIS2.15")
         contract1 = self.fed.contract(event, self.context)
         self.fed.senseAndStore(contract1, self.sat2, self.context)
         data1 = next(d for d in self.sat2.modules[1].data
@@ -326,7 +391,7 @@ class FederateContractTestCase(FederateTestCase):
                             self.context)
         self.sim.advance()
         event = next(e for e in self.context.currentEvents
-                     if e.name == "VIS2.13")
+                     if e.name == "VIS2.15")
         contract1 = self.fed.contract(event, self.context)
         self.assertIn(contract1, self.fed.contracts)
 
@@ -343,13 +408,13 @@ class FederateResolveTestCase(FederateTestCase):
                             self.context)
         self.sim.advance()
         event = next(e for e in self.context.currentEvents
-                     if e.name == "VIS2.13")
+                     if e.name == "VIS2.15")
         contract1 = self.fed.contract(event, self.context)
         self.fed.senseAndStore(contract1, self.sat2, self.context)
         data1 = next(d for d in self.sat2.modules[1].data if d.contract is contract1)
         self.sim.advance()
         event = next(e for e in self.context.currentEvents
-                     if e.name == "VIS3.7")
+                     if e.name == "VIS3.6")
         self.sim.advance()
         self.fed.transport('pSGL', data1, self.sat2, self.station, self.context)
         cash = self.fed.getCash()
@@ -359,6 +424,38 @@ class FederateResolveTestCase(FederateTestCase):
         self.assertNotIn(contract1, self.fed.contracts)
         self.assertEqual(self.fed.getCash(), cash + contract1.getValue())
 
+class FederateGetDefaultedContractsTestCase(FederateTestCase):
+    def test_getDefaultedContracts(self):
+        self.sim.init()
+        sat = self.game.generateElement('SmallSat',pId=0,eId=5,mTypes=['VIS','DAT'])
+        self.fed.design(sat)
+        self.fed.commission(sat,
+                            self.context.locations[1],
+                            self.context)
+        contract1 = Contract(Demand(1, 'VIS', 1,
+                                    ValueSchedule([(1,500)], -50)),
+                             clock=self.context)
+        contract2 = Contract(Demand(1, 'VIS', 1,
+                                    ValueSchedule([(3,500)], -50)),
+                             clock=self.context)
+        for module, contract in zip(sat.modules, [contract1, contract2]):
+            self.fed.contracts.append(contract)
+            self.fed.scheduleDefault(contract)
+            self.assertTrue(module.transferIn(Data('VIS', 1, contract)))
+        self.fed.invalidateViews()
+        self.assertEqual(self.fed.getDefaultedContracts(self.context), [])
+        sat.modules[1].transferOut(contract2.data)
+        self.assertEqual(self.fed.getDefaultedContracts(self.context),
+                         [contract2])
+        self.context.time = 2
+        self.assertEqual(self.fed.getDefaultedContracts(self.context),
+                         [contract1, contract2])
+        self.fed.contracts.remove(contract1)
+        self.fed.invalidateViews()
+        self.fed.decommission(sat)
+        self.assertEqual(self.fed.getDefaultedContracts(self.context),
+                         [contract2])
+
 class FederateInitTestCase(FederateTestCase):
     def test_init(self):
         pass
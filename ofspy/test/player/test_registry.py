@@ -0,0 +1,54 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+"""
+Test cases for the registry of L{ofspy.player.operations} package. These
+do not import the solver-based operations models.
+"""
+
+import unittest
+
+from ...game import Game
+from ...player import operations
+from ...player.operations import (Operations, getOperations,
+                                  getOperationsKeys, registerOperations)
+
+class MockOperations(Operations):
+    def __init__(self, planningHorizon=6, storagePenalty=-100, islPenalty=-10):
+        Operations.__init__(self)
+        self.planningHorizon = planningHorizon
+
+class OperationsRegistryTestCase(unittest.TestCase):
+    def tearDown(self):
+        operations._registry.pop('t', None)
+
+    def test_getOperations(self):
+        self.assertEqual([key for key in getOperationsKeys()
+                          if key in 'dpx'], ['d', 'p', 'x'])
+        self.assertIsNone(getOperations('t'))
+        registerOperations('t', __name__ + ':MockOperations')
+        self.assertIn('t', getOperationsKeys())
+        self.assertIs(getOperations('t'), MockOperations)
+
+    def test_generateContext(self):
+        registerOperations('t', MockOperations)
+        context = Game(numPlayers=1, initialCash=0).generateContext(
+            ops='t4,100,10', fops='t3,100,10')
+        self.assertIsInstance(context.federations[0].operations,
+                              MockOperations)
+        self.assertEqual(context.federations[0].federates[0]
+                         .operations.planningHorizon, 4)
+        self.assertEqual(context.federations[0].operations.planningHorizon, 3)
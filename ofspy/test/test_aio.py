@@ -0,0 +1,103 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+"""
+Test cases for L{ofspy.aio} package.
+"""
+
+import asyncio
+import unittest
+
+from ..aio import Evaluator
+from ..batch import executeJob, makeJob
+
+class EvaluatorTestCase(unittest.TestCase):
+    def setUp(self):
+        self.default = Evaluator(maxWorkers=1, maxPending=2)
+        self.design = ['1.GroundSta@SUR1,pSGL', '1.SmallSat@LEO1,pSGL,SAR']
+
+    def tearDown(self):
+        self.default.close()
+        self.default = None
+        self.design = None
+
+    def test_makeJob(self):
+        job = makeJob(' '.join(self.design), id='a', seed=2, ops='n')
+        self.assertEqual(job['elements'], self.design)
+        self.assertEqual(job['id'], 'a')
+        self.assertEqual(job['seed'], 2)
+        self.assertEqual(job['fops'], '')
+
+    def test_evaluate(self):
+        results = asyncio.run(self.default.evaluate(
+            self.design, seeds=[2, 0, 1], ops='n', numTurns=4))
+        self.assertEqual([r['id'] for r in results], [2, 0, 1])
+        for result in results:
+            self.assertEqual(result, executeJob(makeJob(
+                self.design, id=result['id'], seed=result['id'],
+                ops='n', numTurns=4)))
+
+    def test_imap(self):
+        async def first(jobs):
+            async for result in self.default.imap(jobs):
+                return result
+        jobs = (makeJob(self.design, id=i, seed=i, ops='n', numTurns=4)
+                for i in range(20))
+        result = asyncio.run(first(jobs))
+        self.assertIn('results', result)
+        # back-pressure: only pending runs were taken and submitted
+        self.assertEqual(len(list(jobs)), 18)
+        self.assertLessEqual(self.default.numSubmitted, 2)
+
+    def test_cancel(self):
+        async def cancel():
+            task = asyncio.ensure_future(self.default.evaluate(
+                self.design, seeds=range(20), ops='n', numTurns=4))
+            await asyncio.sleep(0)
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                return True
+            return False
+        self.assertTrue(asyncio.run(cancel()))
+        self.assertLessEqual(self.default.numSubmitted, 2)
+
+    def test_cancelRunning(self):
+        evaluator = Evaluator(maxWorkers=1, maxPending=1)
+        async def cancel():
+            task = asyncio.ensure_future(evaluator.run(makeJob(
+                self.design, seed=0, ops='n', numTurns=24)))
+            while evaluator.numSubmitted == 0:
+                await asyncio.sleep(0)
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            # the cancelled run still holds the only slot
+            locked = evaluator._semaphore[1].locked()
+            result = await evaluator.run(makeJob(
+                self.design, seed=1, ops='n', numTurns=4))
+            return locked, result
+        try:
+            locked, result = asyncio.run(cancel())
+        finally:
+            evaluator.close()
+        self.assertTrue(locked)
+        self.assertIn('results', result)
+        self.assertEqual(evaluator.numSubmitted, 2)
@@ -0,0 +1,97 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+"""
+Test cases for L{ofspy.batch} package.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+from ..batch import executeJob, executeJobs, parseJobs
+from ..ofs import OFS, getNumPlayers
+
+class BatchTestCase(unittest.TestCase):
+    def setUp(self):
+        self.elements = ['1.GroundSta@SUR1,pSGL', '1.SmallSat@LEO1,pSGL,SAR']
+        self.lines = [' '.join(self.elements),
+                      '',
+                      '{"id": "a", "elements": ["1.GroundSta@SUR1,pSGL",'
+                      ' "2.GroundSta@SUR2,pSGL"], "seed": 3}',
+                      '{"bad',
+                      'bad json {',
+                      '1.GroundSta@SUR1,pSGL SmallSat']
+
+    def tearDown(self):
+        self.elements = None
+        self.lines = None
+
+    def test_getNumPlayers(self):
+        self.assertEqual(getNumPlayers([]), 0)
+        self.assertEqual(getNumPlayers(self.elements), 1)
+        self.assertEqual(getNumPlayers(['GroundSta@SUR1,pSGL',
+                                        '3.SmallSat@LEO1,pSGL']), 3)
+
+    def test_parseJobs(self):
+        jobs = list(parseJobs(self.lines, {'ops': 'n'}))
+        self.assertEqual([job['id'] for job in jobs], [0, 'a', 3, 4, 5])
+        self.assertEqual(jobs[0]['elements'], self.elements)
+        self.assertEqual(jobs[0]['ops'], 'n')
+        self.assertEqual(jobs[0]['seed'], 0)
+        self.assertEqual(jobs[1]['seed'], 3)
+        self.assertIn('error', jobs[2])
+        self.assertIn('error', jobs[3])
+        self.assertIn('SmallSat', jobs[4]['error'])
+
+    def test_executeJob(self):
+        job = next(parseJobs(self.lines, {'ops': 'n', 'numTurns': 4}))
+        result = executeJob(job)
+        ofs = OFS(elements=self.elements, numPlayers=1, initialCash=0,
+                  numTurns=4, seed=0, ops='n', fops='')
+        self.assertEqual(result, {'id': 0, 'results': ofs.execute()})
+
+    def test_executeJobs(self):
+        jobs = list(parseJobs(self.lines, {'ops': 'n', 'numTurns': 4}))
+        results = list(executeJobs(jobs, numWorkers=1))
+        self.assertEqual(sorted(str(r['id']) for r in results),
+                         ['0', '3', '4', '5', 'a'])
+        self.assertEqual(len(results[1]['results']), 2)
+        self.assertIn('error', results[2])
+        self.assertEqual(sorted(list(executeJobs(jobs, numWorkers=2)),
+                                key=lambda r: str(r['id'])),
+                         sorted(results, key=lambda r: str(r['id'])))
+
+    def test_executeJobsOutput(self):
+        # solver output in this process must not reach standard output
+        script = ('import json, sys\n'
+                  'from ofspy.batch import executeJobs, parseJobs\n'
+                  'jobs = parseJobs(sys.argv[1:], {"ops": "d2",'
+                  ' "numTurns": 4})\n'
+                  'for result in executeJobs(jobs, numWorkers=1):\n'
+                  '    print(json.dumps(result))\n')
+        root = os.path.dirname(os.path.dirname(os.path.dirname(
+            os.path.abspath(__file__))))
+        with open(os.devnull, 'w') as devnull:
+            output = subprocess.check_output(
+                [sys.executable, '-c', script, ' '.join(self.elements)],
+                cwd=root, stderr=devnull)
+        lines = output.decode('utf-8').splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[0])['id'], 0)
@@ -31,3 +31,19 @@ class GameTestCase(unittest.TestCase):
 
     def test_generateContext(self):
         self.default.generateContext(seed=0, ops='', fops='')
+
+    def test_generateLocations(self):
+        locations = self.default.generateLocations()
+        self.assertIs(locations, Game(3, 2000).generateLocations())
+        context = self.default.generateContext(seed=0)
+        self.assertEqual(context.locations, list(locations))
+        self.assertIs(context.getLocation('MEO2'), locations[6])
+
+    def test_generateEvents(self):
+        events = self.default.generateEvents()
+        self.assertIs(events, Game(3, 2000).generateEvents())
+        context1 = self.default.generateContext(seed=0)
+        context2 = self.default.generateContext(seed=1)
+        self.assertEqual(len(context1.events), len(events))
+        self.assertTrue(all(e1 is e2 for e1, e2
+                            in zip(context1.events, context2.events)))
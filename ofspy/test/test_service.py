@@ -0,0 +1,100 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+"""
+Test cases for L{ofspy.service} package.
+"""
+
+import threading
+import unittest
+
+from ..batch import parseJobs
+from ..service import ServiceClient, ServiceServer, SimulationService
+
+class SimulationServiceTestCase(unittest.TestCase):
+    def setUp(self):
+        self.service = SimulationService(numWorkers=1)
+        self.server = ServiceServer(('localhost', 0), self.service,
+                                    defaults={'ops': 'n', 'numTurns': 4})
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        self.client = ServiceClient('localhost', self.server.server_address[1])
+        self.lines = ['1.GroundSta@SUR1,pSGL 1.SmallSat@LEO1,pSGL,SAR',
+                      '{"id": "a", "elements": ["1.GroundSta@SUR1,pSGL",'
+                      ' "1.SmallSat@LEO1,pSGL,SAR"]}',
+                      '{"id": "b", "elements": ["1.GroundSta@SUR1,pSGL"],'
+                      ' "seed": 1}']
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.service.close()
+        self.service = None
+        self.server = None
+        self.client = None
+
+    def test_evaluate(self):
+        results = dict((r['id'], r) for r in self.client.evaluate(self.lines))
+        self.assertEqual(sorted(str(id) for id in results), ['0', 'a', 'b'])
+        self.assertEqual(results[0]['results'], results['a']['results'])
+        self.assertEqual(self.client.getStats(),
+                         {'submitted': 3, 'executed': 2,
+                          'deduplicated': 1, 'cached': 0})
+        repeats = list(self.client.evaluate(self.lines[2:]))
+        self.assertEqual(repeats, [results['b']])
+        self.assertEqual(self.client.getStats()['cached'], 1)
+
+    def test_priority(self):
+        finished = []
+        done = threading.Event()
+        def callback(result):
+            finished.append(result['id'])
+            if len(finished) == 3:
+                done.set()
+        jobs = list(parseJobs(['1.GroundSta@SUR1,pSGL',
+                               '1.GroundSta@SUR2,pSGL',
+                               '{"elements": ["1.GroundSta@SUR3,pSGL"],'
+                               ' "priority": 1}'], {'ops': 'n'}))
+        # hold dispatch until all jobs are queued
+        self.service.numWorkers = 0
+        self.service.submit(jobs[0], callback)
+        self.service.submit(jobs[1], callback)
+        self.service.numWorkers = 1
+        self.service.submit(jobs[2], callback)
+        self.assertTrue(done.wait(30))
+        self.assertEqual(finished, [2, 0, 1])
+
+    def test_cache(self):
+        self.service.cacheSize = 2
+        jobs = list(parseJobs(['1.GroundSta@SUR1,pSGL',
+                               '1.GroundSta@SUR2,pSGL',
+                               '1.GroundSta@SUR3,pSGL'], {'ops': 'n'}))
+        def evaluate(job):
+            done = threading.Event()
+            self.service.submit(job, lambda result: done.set())
+            self.assertTrue(done.wait(30))
+        evaluate(jobs[0])
+        evaluate(jobs[1])
+        # a cache hit makes the first job the most recently used
+        evaluate(jobs[0])
+        evaluate(jobs[2])
+        self.assertEqual(self.service.stats['executed'], 3)
+        evaluate(jobs[0])
+        self.assertEqual(self.service.stats['executed'], 3)
+        evaluate(jobs[1])
+        self.assertEqual(self.service.stats['executed'], 4)
@@ -0,0 +1,105 @@
+"""
+Copyright 2015 Paul T. Grogan, Massachusetts Institute of Technology
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+"""
+Test cases for L{ofspy.simulation} package.
+"""
+
+import unittest
+
+from ..simulation import Entity, Schedule, Simulator
+from ..game import Game
+
+class ScheduleTestCase(unittest.TestCase):
+    def setUp(self):
+        self.default = Schedule()
+
+    def tearDown(self):
+        self.default = None
+
+    def test_run(self):
+        calls = []
+        self.default.add('tick', lambda sim: calls.append(('a', sim)))
+        self.default.add('tock', lambda: calls.append(('b', None)))
+        self.default.add('tick', lambda sim: calls.append(('c', sim)))
+        self.default.run('tick', 1)
+        self.assertEqual(calls, [('a', 1), ('c', 1)])
+        self.default.run('tock')
+        self.assertEqual(calls, [('a', 1), ('c', 1), ('b', None)])
+
+    def test_invalidate(self):
+        self.assertFalse(self.default.isValid())
+        self.default.validate()
+        self.assertTrue(self.default.isValid())
+        self.default.invalidate()
+        self.assertFalse(self.default.isValid())
+
+class SimulatorTestCase(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(numPlayers=1, initialCash=1200)
+        self.context = self.game.generateContext(seed=0)
+        self.sim = Simulator(entities=[self.context],
+                             initTime=0, timeStep=1, maxTime=4)
+
+    def tearDown(self):
+        self.game = None
+        self.context = None
+        self.sim = None
+
+    def test_entity(self):
+        self.assertIs(self.sim.entity('context'), self.context)
+        self.sim.init()
+        self.assertIs(self.sim.entity('context'), self.context)
+        self.assertIsNone(self.sim.entity('other'))
+        # entities added after compiling are still found
+        other = Entity('other')
+        self.sim.entities.append(other)
+        self.assertIs(self.sim.entity('other'), other)
+        self.sim.entities.remove(other)
+        self.assertIsNone(self.sim.entity('other'))
+        renamed = Entity('renamed')
+        self.sim.entities[self.sim.entities.index(self.context)] = renamed
+        self.assertIs(self.sim.entity('renamed'), renamed)
+
+    def test_compile(self):
+        entity = Entity('entity')
+        self.sim.entities.append(entity)
+        self.sim.init()
+        self.assertTrue(self.sim.schedule.isValid())
+        self.assertIn(entity.tick, self.sim.schedule.getUpdates('tick'))
+        self.assertIn(entity.tock, self.sim.schedule.getUpdates('tock'))
+
+        federate = self.context.federations[0].federates[0]
+        station = self.game.generateElement('GroundSta', 0, 0,
+                                            ['pSGL', 'DAT'])
+        satellite = self.game.generateElement('SmallSat', 0, 1,
+                                              ['pSGL', 'VIS'])
+        federate.design(station)
+        federate.design(satellite)
+        self.assertFalse(self.sim.schedule.isValid())
+        self.sim.compile()
+        updates = self.sim.schedule.getUpdates('tock')
+        self.assertIn(satellite.resetCounters, updates)
+        self.assertIn(satellite.modules[0].tock, updates)
+        self.assertIn(satellite.modules[1].tock, updates)
+        self.assertNotIn(station.modules[1].tock, updates)
+
+        locations = dict((l.name, l) for l in self.context.locations)
+        federate.commission(satellite, locations['LEO1'], self.context)
+        self.assertFalse(self.sim.schedule.isValid())
+        self.sim.advance()
+        self.assertTrue(self.sim.schedule.isValid())
+        self.assertIs(satellite.location, locations['LEO3'])
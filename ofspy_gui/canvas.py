@@ -28,6 +28,7 @@ from PIL import ImageTk, Image
 
 from ofspy.ofs import OFS
 from ofspy.context import Context
+from ofspy.context.location import SPEEDS
 
 class CanvasOFS(Canvas):
     def __init__(self, root, ofs):
@@ -146,9 +147,7 @@ class CanvasOFS(Canvas):
             location = (center[0] + int(self.orbitRadius*math.cos(theta+deltaTheta)),
                         center[1] + int(self.orbitRadius*math.sin(theta+deltaTheta)))
             return self.rotate(location, center, math.pi/(3*self.numFrames)*frame
-                               *(1 if element.location.altitude=='MEO'
-                                 else 2 if element.location.altitude=='LEO'
-                                 else 0))
+                               *SPEEDS[element.location.level])
 
     def drawElement(self, element, location, tags=()):
         center = (self.winfo_reqwidth()/2, self.winfo_reqheight()/2)